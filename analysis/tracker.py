@@ -24,6 +24,11 @@ class SimulationTracker:
             'avg_species_age': []
         }
     
+    def reset(self):
+        """Clear recorded history in place (keeps the existing lists)"""
+        for values in self.history.values():
+            values.clear()
+    
     def snapshot(self, world):
         """Record current simulation state"""
         self.history['generation'].append(world.generation)
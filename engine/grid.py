@@ -21,6 +21,9 @@ class World:
         # Species tracking
         self.species_registry = {}  # id -> Species object
         self.next_species_id = 1
+        # Change counters for caches built from the world (e.g. the renderer's palette)
+        self.species_version = 0  # Bumped whenever species are added or removed
+        self.reset_count = 0      # Bumped by every reset()
         
         # Stats
         self.total_population = 0
@@ -41,6 +44,7 @@ class World:
         self.births_this_gen = 0
         self.deaths_this_gen = 0
         self.mutations_this_gen = 0
+        self.reset_count += 1
         
         # Seed initial life
         random_cells = np.random.random((self.height, self.width)) < density
@@ -160,6 +164,7 @@ class World:
             species.inherit_from(parent, mutation_strength=0.1)
         
         self.species_registry[species_id] = species
+        self.species_version += 1
         return species
     
     def _cleanup_extinct(self):
@@ -169,6 +174,8 @@ class World:
         
         for sid in extinct:
             del self.species_registry[sid]
+        if extinct:
+            self.species_version += 1
     
     def _update_stats(self):
         """Update population statistics"""
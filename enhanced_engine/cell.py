@@ -5,83 +5,109 @@ from typing import Optional, Tuple
 
 
 class Cell:
-    """Individual cell with energy, position, and species traits"""
+    """Individual cell with energy, position, and species traits
+    
+    While a cell sits on a Grid, its energy/age/alive/movement state lives in
+    the grid's NumPy arrays and the Cell is a thin view onto its (x, y) slot.
+    Cells that are not on a grid (or have been removed from one) keep their
+    own copy of that state.
+    """
+    
+    __slots__ = ('x', 'y', 'species_id', 'move_history', '_grid',
+                 '_energy', '_max_energy', '_age', '_is_alive', '_has_moved')
     
     def __init__(self, x: int, y: int, species, energy: int = None):
         self.x = x
         self.y = y
         self.species_id = species.id
-        self.is_alive = True
-        self.age = 0
+        self._grid = None  # Set by Grid when the cell is attached
+        self._is_alive = True
+        self._age = 0
         
         # Energy system
-        self.energy = energy if energy is not None else species.traits.base_energy
-        self.max_energy = species.traits.base_energy * 2  # Can store up to 2x base
+        self._energy = energy if energy is not None else species.traits.base_energy
+        self._max_energy = species.traits.base_energy * 2  # Can store up to 2x base
         
         # Movement tracking
-        self.has_moved_this_gen = False
+        self._has_moved = False
         self.move_history = []  # Track last N positions
-        
-    def age_one_generation(self, species, zone_modifier: float = 1.0, zone_type: str = "neutral", 
-                          has_prey_nearby: bool = False, population_pressure: float = 1.0):
-        """Process one generation tick - decay energy and age
-        
-        Args:
-            species: Species traits
-            zone_modifier: Zone energy multiplier
-            zone_type: Type of zone for adaptation
-            has_prey_nearby: Whether prey is available (for predators)
-            population_pressure: Carrying capacity multiplier (0.2-1.2x)
-        """
-        self.age += 1
-        
-        # Check for old age death
-        if species.traits.max_lifespan > 0 and self.age >= species.traits.max_lifespan:
-            self.is_alive = False
-            return False
-        
-        # Get adaptation bonus based on environment
-        adaptation_mult = species.traits.get_adaptation_bonus(zone_type)
-        
-        # Apply complexity cost (more complex = more energy needed)
-        complexity_cost = species.traits.get_complexity_cost()
-        
-        # Calculate aging penalty
-        aging_penalty = 1.0
-        if species.traits.max_lifespan > 0:
-            age_ratio = self.age / species.traits.max_lifespan
-            if age_ratio > species.traits.age_decline_start:
-                # Linear decline after age threshold
-                decline = (age_ratio - species.traits.age_decline_start) / (1.0 - species.traits.age_decline_start)
-                aging_penalty = 1.0 + decline * 0.5  # Up to 50% more energy cost
-        
-        # Energy decay (increased by complexity, aging, modified by zone and adaptation)
-        decay = int(species.traits.energy_decay * zone_modifier * complexity_cost * aging_penalty / adaptation_mult)
-        self.energy = max(0, self.energy - decay)
-        
-        # Energy gain based on food source availability
-        food_mult = species.traits.get_energy_source_multiplier(has_prey_nearby)
-        
-        # Check if in optimal zone for bonus
-        zone_bonus = species.traits.optimal_zone_bonus if species.traits.is_optimal_zone(zone_type) else 1.0
-        
-        # Photosynthesis/energy generation (boosted by adaptation, food, optimal zone, POPULATION PRESSURE)
-        gain = int(species.traits.photosynthesis_rate * zone_modifier * adaptation_mult * 
-                  food_mult * zone_bonus * population_pressure / species.traits.metabolic_efficiency)
-        self.energy = min(self.max_energy, self.energy + gain)
-        
-        # Death by starvation (harsh penalty outside optimal zone)
-        if not species.traits.is_optimal_zone(zone_type):
-            if self.energy < species.traits.starvation_threshold:
-                self.is_alive = False
-                return False
-        
-        # Standard starvation
-        if self.energy <= 0:
-            self.is_alive = False
-            return False
-        
-        return True
+    
+    # State accessors: read/write through to the grid arrays while attached
+    
+    @property
+    def energy(self) -> int:
+        grid = self._grid
+        if grid is None:
+            return self._energy
+        return int(grid.energy[self.y, self.x])
+    
+    @energy.setter
+    def energy(self, value: int):
+        grid = self._grid
+        if grid is None:
+            self._energy = value
+        else:
+            grid.energy[self.y, self.x] = value
+    
+    @property
+    def max_energy(self) -> int:
+        grid = self._grid
+        if grid is None:
+            return self._max_energy
+        return int(grid.max_energy[self.y, self.x])
+    
+    @max_energy.setter
+    def max_energy(self, value: int):
+        grid = self._grid
+        if grid is None:
+            self._max_energy = value
+        else:
+            grid.max_energy[self.y, self.x] = value
+    
+    @property
+    def age(self) -> int:
+        grid = self._grid
+        if grid is None:
+            return self._age
+        return int(grid.age[self.y, self.x])
+    
+    @age.setter
+    def age(self, value: int):
+        grid = self._grid
+        if grid is None:
+            self._age = value
+        else:
+            grid.age[self.y, self.x] = value
+    
+    @property
+    def is_alive(self) -> bool:
+        grid = self._grid
+        if grid is None:
+            return self._is_alive
+        return bool(grid.alive[self.y, self.x])
+    
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        grid = self._grid
+        if grid is None:
+            self._is_alive = value
+        else:
+            grid.alive[self.y, self.x] = value
+    
+    @property
+    def has_moved_this_gen(self) -> bool:
+        grid = self._grid
+        if grid is None:
+            return self._has_moved
+        return bool(grid.moved[self.y, self.x])
+    
+    @has_moved_this_gen.setter
+    def has_moved_this_gen(self, value: bool):
+        grid = self._grid
+        if grid is None:
+            self._has_moved = value
+        else:
+            grid.moved[self.y, self.x] = value
     
     def can_reproduce(self, species) -> bool:
         """Check if cell has enough energy to reproduce"""
@@ -110,7 +136,9 @@ class Cell:
         if len(self.move_history) > 10:
             self.move_history.pop(0)
         
-        # Update position
+        # Update position (an attached cell's state follows it to the new slot)
+        if self._grid is not None:
+            self._grid._relocate(self, new_x, new_y)
         self.x = new_x
         self.y = new_y
         
@@ -5,38 +5,104 @@ Integrates energy, zones, mobility, and complex species interactions
 from typing import List, Tuple, Optional
 from .cell import Cell
 from .species_enhanced import Species, SpeciesRegistry
-from .zones import Zone, ZoneManager, ZoneType, ZoneProperties
+from .zones import ZoneManager, ZoneType, ZoneProperties, zone_type_code
 import random
+import sys
 import time
 import numpy as np
-from .grid_numba import count_all_neighbors
+from .grid_numba import (classify_conway, mask_positions, live_neighbor_indices,
+                         same_species_neighbor_counts, pick_prey_slots, age_cells, move_cells)
+
+
+# Moore neighborhood offsets in the same order get_neighbors() yields them
+NEIGHBOR_DX = (-1, 0, 1, -1, 1, -1, 0, 1)
+NEIGHBOR_DY = (-1, -1, -1, 0, 0, 1, 1, 1)
+# (dy + 1) * 3 + (dx + 1) -> neighbor slot index (center has no slot)
+NEIGHBOR_SLOT = (0, 1, 2, 3, -1, 4, 5, 6, 7)
 
 
 class Grid:
     """Main simulation grid with energy and zone support"""
     
-    def __init__(self, width: int, height: int, wrap: bool = True):
+    # Per-generation random draws (planes of Grid._rng_buf)
+    RNG_AGE_DEATH = 0
+    RNG_BIRTH = 1
+    RNG_MUTATION = 2
+    
+    # Generations between performance reports (printing is not free at high speed)
+    TIMING_REPORT_INTERVAL = 60
+    
+    def __init__(self, width: int, height: int, wrap: bool = True, seed: Optional[int] = None):
         self.width = width
         self.height = height
         self.wrap = wrap
         
+        # Bulk random numbers for the reproduction phase, refilled once per generation
+        self._rng = np.random.default_rng(seed)  # PCG64
+        self._rng_buf = np.empty((3, height, width), dtype=np.float32)
+        
         # Grid structure
         self.cells = [[None for _ in range(width)] for _ in range(height)]
+        # Flat mirror of self.cells indexed by y * width + x (kept in sync by _attach/_remove_cell/_relocate)
+        self._flat_cells = [None] * (width * height)
+        
+        # Precomputed Moore neighbor indices into _flat_cells, -1 where off-grid
+        self._nbr_idx = self._build_neighbor_table()
+        self._nbr_lists = [[i for i in row if i >= 0] for row in self._nbr_idx.tolist()]
+        
+        # Per-cell state as NumPy columns (SoA). Cells in self.cells are thin
+        # views onto these arrays, which are the source of truth.
+        self.alive = np.zeros((height, width), dtype=np.bool_)
+        self.energy = np.zeros((height, width), dtype=np.int32)
+        self.max_energy = np.zeros((height, width), dtype=np.int32)
+        self.age = np.zeros((height, width), dtype=np.int32)
+        self.moved = np.zeros((height, width), dtype=np.bool_)
+        # Positions holding a Cell object, living or not yet cleared (kept in sync with self.cells)
+        self.occupied = np.zeros((height, width), dtype=np.bool_)
+        
+        # Parallel NumPy arrays describing living cells (kept in sync with self.cells)
+        # species_id_grid is 0 where no living cell is present (species IDs start at 1)
+        self.species_id_grid = np.zeros((height, width), dtype=np.int32)
+        self.hunter_mask = np.zeros((height, width), dtype=np.bool_)
+        self.consumable_mask = np.zeros((height, width), dtype=np.bool_)
+        self.living_count = 0  # Maintained by _occupy/_vacate
+        # Flat views (same memory) for scalar lookups by _flat_cells index
+        self._species_id_flat = self.species_id_grid.reshape(-1)
+        self._hunter_flat = self.hunter_mask.reshape(-1)
+        self._consumable_flat = self.consumable_mask.reshape(-1)
         
         # Numba-accelerated neighbor cache
-        self._neighbor_cache = None
+        self._neighbor_cache = np.zeros((height, width), dtype=np.int32)
         self._neighbor_cache_generation = -1
+        self._cluster_counts = np.zeros((height, width, 8), dtype=np.int8)  # Same-species counts per neighbor slot
+        # Per-generation kernel outputs, rewritten in place each step
+        self._conway_dies = np.zeros((height, width), dtype=np.bool_)
+        self._birth_ok = np.zeros((height, width), dtype=np.bool_)
+        self._aging_dies = np.zeros((height, width), dtype=np.bool_)
         
         # Zone caches for performance
-        self._zone_cache = {}  # (x, y) -> Zone
-        self._zone_pressure_cache = {}  # Zone -> pressure
+        self._zone_list = []  # Zone index -> Zone (0 is the default zone)
+        self._zone_grid = np.zeros((height, width), dtype=np.uint16)  # Zone index per position
+        self._pressure_grid = np.ones((height, width), dtype=np.float64)  # Zone pressure per position
+        self._repro_difficulty_grid = np.ones((height, width), dtype=np.float64)
+        self._zone_decay_mults = np.ones(1, dtype=np.float64)  # Zone index -> energy_decay_mult
+        self._zone_energy_mults = np.ones(1, dtype=np.float64)  # Zone index -> energy_generation_mult
+        self._zone_can_enter = np.ones(1, dtype=np.bool_)  # Zone index -> can_enter
+        self._zone_type_codes = np.full(1, -1, dtype=np.int32)  # Zone index -> zone type code
+        
+        # Reusable birth queue: rows of (x, y, species_id, energy); at most one birth per position
+        self._birth_buf = np.empty((width * height, 4), dtype=np.int32)
+        self._n_births = 0
+        # Reusable movement buffers: per-mover rolls and (src, dst, displaced, state...) rows
+        self._move_rolls = np.empty((width * height, 3), dtype=np.float64)
+        self._move_buf = np.empty((width * height, 7), dtype=np.int64)
         self._zone_cache_generation = -1
         
         # Species management
         self.species_registry = SpeciesRegistry()
         
         # Zone management
-        self.zone_manager = ZoneManager(width, height)
+        self.zone_manager = ZoneManager(width, height, self._rng)
         
         # Statistics
         self.generation = 0
@@ -77,25 +143,24 @@ class Grid:
         zone_counts = {}
         
         cells_placed = 0
-        attempts = 0
-        max_attempts = population * 100  # Increased for better placement
         
         if pattern == "random":
-            while cells_placed < population and attempts < max_attempts:
-                x = random.randint(0, self.width - 1)
-                y = random.randint(0, self.height - 1)
-                
-                if self.cells[y][x] is None:
-                    zone = self.zone_manager.get_zone_at(x, y)
-                    if zone.properties.can_enter:
-                        self.cells[y][x] = Cell(x, y, species)
-                        cells_placed += 1
-                        
-                        # Track zone placement
-                        zone_name = zone.properties.name.lower().split()[0]
-                        zone_counts[zone_name] = zone_counts.get(zone_name, 0) + 1
-                
-                attempts += 1
+            # Sample distinct free, enterable positions in one draw
+            zone_map = self.zone_manager.zone_map
+            can_enter = self.zone_manager.build_modifier_arrays()['can_enter']
+            free = np.flatnonzero(~self.occupied & can_enter[zone_map])
+            picks = self._rng.choice(free, min(population, free.size), replace=False)
+            for i in picks.tolist():
+                y, x = divmod(i, self.width)
+                self._place_cell(x, y, species)
+            cells_placed = int(picks.size)
+            
+            # Track zone placement
+            zones_per_index = np.bincount(zone_map.reshape(-1)[picks], minlength=len(self.zone_manager.zones_arr))
+            for zone, count in zip(self.zone_manager.zones_arr.tolist(), zones_per_index.tolist()):
+                if count:
+                    zone_name = zone.properties.name.lower().split()[0]
+                    zone_counts[zone_name] = zone_counts.get(zone_name, 0) + count
         
         elif pattern == "center":
             cx, cy = self.width // 2, self.height // 2
@@ -145,7 +210,7 @@ class Grid:
                         for bdy in range(2):
                             for bdx in range(2):
                                 x, y = bx + bdx, by + bdy
-                                self.cells[y][x] = Cell(x, y, species)
+                                self._place_cell(x, y, species)
                                 cells_placed += 1
                                 
                                 # Track zone placement
@@ -175,7 +240,7 @@ class Grid:
                         if self.cells[y][x] is None:
                             zone = self.zone_manager.get_zone_at(x, y)
                             if zone.properties.can_enter:
-                                self.cells[y][x] = Cell(x, y, species)
+                                self._place_cell(x, y, species)
                                 cells_placed += 1
                                 
                                 # Track zone placement
@@ -199,7 +264,7 @@ class Grid:
                 if self.cells[y][x] is None:
                     zone = self.zone_manager.get_zone_at(x, y)
                     if zone.properties.can_enter:
-                        self.cells[y][x] = Cell(x, y, species)
+                        self._place_cell(x, y, species)
                         cells_placed += 1
                         
                         # Track zone placement
@@ -210,10 +275,112 @@ class Grid:
         if zone_counts:
             most_common_zone = max(zone_counts, key=zone_counts.get)
             species.traits.native_zone_type = most_common_zone
+            species.traits.native_zone_type_code = zone_type_code(most_common_zone)
+            self.species_registry.refresh_traits(species)
             print(f"  {species.name} established in {most_common_zone} zone ({zone_counts[most_common_zone]}/{cells_placed} cells)")
         
         print(f"Seeded {cells_placed} cells of {species.name}")
     
+    def _place_cell(self, x: int, y: int, species: Species, energy: int = None) -> Cell:
+        """Create a living cell at (x, y) and record it in the parallel arrays"""
+        if self.cells[y][x] is not None:
+            self._detach(self.cells[y][x])  # Overwrite a leftover dead cell
+        cell = Cell(x, y, species, energy)
+        self._attach(cell)
+        self._occupy(x, y, species)
+        return cell
+    
+    def _attach(self, cell: Cell):
+        """Move a cell's own state into the grid arrays at its position"""
+        x, y = cell.x, cell.y
+        self.alive[y, x] = cell._is_alive
+        self.energy[y, x] = cell._energy
+        self.max_energy[y, x] = cell._max_energy
+        self.age[y, x] = cell._age
+        self.moved[y, x] = cell._has_moved
+        cell._grid = self
+        self.cells[y][x] = cell
+        self._flat_cells[y * self.width + x] = cell
+        self.occupied[y, x] = True
+    
+    def _detach(self, cell: Cell):
+        """Copy a cell's state out of the grid arrays so it no longer aliases its slot"""
+        x, y = cell.x, cell.y
+        cell._is_alive = bool(self.alive[y, x])
+        cell._energy = int(self.energy[y, x])
+        cell._max_energy = int(self.max_energy[y, x])
+        cell._age = int(self.age[y, x])
+        cell._has_moved = bool(self.moved[y, x])
+        cell._grid = None
+    
+    def _remove_cell(self, x: int, y: int):
+        """Take the cell at (x, y) off the grid, leaving the slot empty"""
+        cell = self.cells[y][x]
+        if cell is not None:
+            self._detach(cell)
+            self.cells[y][x] = None
+            self._flat_cells[y * self.width + x] = None
+            self.occupied[y, x] = False
+        self._vacate(x, y)
+        self._clear_slot(x, y)
+    
+    def _relocate(self, cell: Cell, new_x: int, new_y: int):
+        """Move an attached cell's slot state to an empty position (called by Cell.move_to)"""
+        old_x, old_y = cell.x, cell.y
+        for arr in self._slot_arrays():
+            arr[new_y, new_x] = arr[old_y, old_x]
+        self.cells[new_y][new_x] = cell
+        self.cells[old_y][old_x] = None
+        self._flat_cells[new_y * self.width + new_x] = cell
+        self._flat_cells[old_y * self.width + old_x] = None
+        self.occupied[new_y, new_x] = True
+        self.occupied[old_y, old_x] = False
+        self._clear_slot(old_x, old_y)
+    
+    def _slot_arrays(self):
+        """All per-position state arrays"""
+        return (self.alive, self.energy, self.max_energy, self.age, self.moved,
+                self.species_id_grid, self.hunter_mask, self.consumable_mask)
+    
+    def _clear_slot(self, x: int, y: int):
+        """Zero every per-position array at (x, y) (does not touch living_count)"""
+        for arr in self._slot_arrays():
+            arr[y, x] = 0
+    
+    def _occupy(self, x: int, y: int, species: Species):
+        """Mark (x, y) as holding a living cell of the given species"""
+        table = self.species_registry.traits_table
+        if self.species_id_grid[y, x] == 0:
+            self.living_count += 1
+        self.species_id_grid[y, x] = species.id
+        self.hunter_mask[y, x] = table['can_hunt'][species.id]
+        self.consumable_mask[y, x] = table['can_be_consumed'][species.id]
+    
+    def _vacate(self, x: int, y: int):
+        """Mark (x, y) as holding no living cell"""
+        if self.species_id_grid[y, x] != 0:
+            self.living_count -= 1
+        self.species_id_grid[y, x] = 0
+        self.hunter_mask[y, x] = False
+        self.consumable_mask[y, x] = False
+    
+    def _build_neighbor_table(self) -> np.ndarray:
+        """(H*W, 8) flat indices of each position's Moore neighbors, in get_neighbors order"""
+        ys, xs = np.divmod(np.arange(self.width * self.height, dtype=np.int32), self.width)
+        table = np.empty((self.width * self.height, 8), dtype=np.int32)
+        for slot, (dx, dy) in enumerate(zip(NEIGHBOR_DX, NEIGHBOR_DY)):
+            nx, ny = xs + dx, ys + dy
+            if self.wrap:
+                table[:, slot] = (ny % self.height) * self.width + (nx % self.width)
+            else:
+                inside = (nx >= 0) & (nx < self.width) & (ny >= 0) & (ny < self.height)
+                table[:, slot] = np.where(inside, ny * self.width + nx, -1)
+        return table
+    
+    def neighbor_indices(self, x: int, y: int) -> List[int]:
+        """Flat indices (into _flat_cells) of the valid radius-1 neighbors of (x, y)"""
+        return self._nbr_lists[y * self.width + x]
+    
     def get_neighbors(self, x: int, y: int, radius: int = 1) -> List[Tuple[int, int]]:
         """Get valid neighbor coordinates within specified radius"""
         neighbors = []
@@ -235,59 +402,56 @@ class Grid:
         
         return neighbors
     
-    def _build_neighbor_cache(self):
-        """Build cached neighbor counts using Numba (called once per generation)"""
-        # Create numpy boolean array of alive cells
-        alive_grid = np.zeros((self.height, self.width), dtype=np.bool_)
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.cells[y][x]
-                alive_grid[y, x] = (cell is not None and cell.is_alive)
-        
-        # Use Numba to count all neighbors at once
-        self._neighbor_cache = count_all_neighbors(alive_grid, self.wrap)
+    def _classify_cells(self, age_death_rolls: np.ndarray, birth_rolls: np.ndarray):
+        """Build neighbor caches and Conway fates using Numba (called once per generation)
+        
+        Returns (dies, birth_ok) bool masks for process_reproduction.
+        """
+        # Fused neighbor count + birth/death classification in one pass
+        _, dies, birth_ok = classify_conway(
+            self.alive, self.energy, self.max_energy, self.age, age_death_rolls, birth_rolls,
+            self._neighbor_cache, self._conway_dies, self._birth_ok, self.wrap)
+        # Same-species counts for the cluster reproduction bonus (one pass, all positions)
+        same_species_neighbor_counts(self.species_id_grid, self._cluster_counts, self.wrap)
         self._neighbor_cache_generation = self.generation
+        return dies, birth_ok
     
     def _build_zone_caches(self):
         """Build zone and pressure caches (called once per generation)"""
         if self._zone_cache_generation == self.generation:
             return  # Already cached
         
-        self._zone_cache.clear()
-        self._zone_pressure_cache.clear()
+        # Zone index per position, maintained by the zone manager
+        self._zone_list = self.zone_manager.zones_arr.tolist()
+        zone_grid = self._zone_grid = self.zone_manager.zone_map
         
-        # Cache zone lookup for every position
-        for y in range(self.height):
-            for x in range(self.width):
-                zone = self.zone_manager.get_zone_at(x, y)
-                self._zone_cache[(x, y)] = zone
+        # Population pressure for each unique zone, then broadcast per position
+        pressures = self.zone_manager.update_population_pressure(self.alive)
+        modifiers = self.zone_manager.build_modifier_arrays()
+        self._zone_decay_mults = modifiers['energy_decay_mult']
+        self._zone_energy_mults = modifiers['energy_generation_mult']
+        self._zone_can_enter = modifiers['can_enter']
+        self._zone_type_codes = modifiers['zone_type_code']
+        self._pressure_grid = pressures[zone_grid]
         
-        # Cache population pressure for each unique zone
-        for zone in self.zone_manager.get_all_zones():
-            self._zone_pressure_cache[zone] = zone.get_population_pressure()
-        self._zone_pressure_cache[self.zone_manager.default_zone] = self.zone_manager.default_zone.get_population_pressure()
+        # Reproduction is moderately harder in overcrowded zones
+        # Only significantly blocked in extreme overcrowding (> 150% capacity)
+        self._repro_difficulty_grid = np.maximum(1.0, 1.0 / np.maximum(0.8, self._pressure_grid))
         
         self._zone_cache_generation = self.generation
     
-    def _get_cached_zone(self, x: int, y: int) -> Zone:
-        """Get zone from cache (must call _build_zone_caches first)"""
-        return self._zone_cache.get((x, y), self.zone_manager.default_zone)
-    
-    def _get_cached_pressure(self, zone: Zone) -> float:
-        """Get population pressure from cache"""
-        return self._zone_pressure_cache.get(zone, 1.0)
-    
     def count_living_neighbors(self, x: int, y: int) -> int:
         """Count how many living neighbors a position has"""
         # Use cached neighbor counts if available
-        if self._neighbor_cache is not None and self._neighbor_cache_generation == self.generation:
+        if self._neighbor_cache_generation == self.generation:
             return int(self._neighbor_cache[y, x])
         
         # Fallback to manual counting (shouldn't happen after optimization)
         t0 = time.perf_counter()
         count = 0
-        for nx, ny in self.get_neighbors(x, y):
-            if self.cells[ny][nx] and self.cells[ny][nx].is_alive:
+        flat_cells = self._flat_cells
+        for idx in self.neighbor_indices(x, y):
+            if flat_cells[idx] and flat_cells[idx].is_alive:
                 count += 1
         self.timing_stats['neighbor_counting'] += time.perf_counter() - t0
         return count
@@ -340,8 +504,8 @@ class Grid:
         
         self.timing_stats['total_step'] = time.perf_counter() - step_start
         
-        # Print performance stats every 10 generations
-        if self.generation % 10 == 0:
+        # Print performance stats every TIMING_REPORT_INTERVAL generations
+        if self.generation % self.TIMING_REPORT_INTERVAL == 0:
             self._print_timing_stats()
         
         return self.generation
@@ -351,65 +515,40 @@ class Grid:
         # Build zone caches once (OPTIMIZATION)
         self._build_zone_caches()
         
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.cells[y][x]
-                if cell and cell.is_alive:
-                    species = self.species_registry.get(cell.species_id)
-                    zone = self._get_cached_zone(x, y)  # CACHED
-                    
-                    # Apply zone modifiers
-                    energy_mult = zone.properties.energy_decay_mult
-                    zone_name = zone.properties.name.lower().split()[0]  # Extract type from name
-                    
-                    # Check for nearby prey (for predators/hybrid feeders)
-                    has_prey = self._has_prey_nearby(x, y, species)
-                    
-                    # Get population pressure from carrying capacity (Phase 4) - CACHED
-                    population_pressure = self._get_cached_pressure(zone)
-                    
-                    # Apply colonial clustering bonus (same-species neighbors)
-                    colony_bonus = self._get_colony_bonus(x, y, cell.species_id, species)
-                    energy_mult *= colony_bonus
-                    
-                    if not cell.age_one_generation(species, energy_mult, zone_name, has_prey, population_pressure):
-                        # Cell died (starvation or old age)
-                        self.deaths_this_gen += 1
-                        species.total_deaths += 1
-                        cell.is_alive = False
-    
-    def _has_prey_nearby(self, x: int, y: int, species) -> bool:
-        """Check if there are consumable cells nearby"""
-        if species.traits.energy_source == "photosynthesis":
-            return False  # Doesn't need prey
-        
-        for nx, ny in self.get_neighbors(x, y):
-            neighbor = self.cells[ny][nx]
-            if neighbor and neighbor.is_alive:
-                neighbor_species = self.species_registry.get(neighbor.species_id)
-                if (neighbor_species and 
-                    neighbor_species.traits.can_be_consumed and
-                    neighbor.species_id != species.id):
-                    return True
-        return False
-    
-    def _has_predators_nearby(self, x: int, y: int, species) -> bool:
-        """Check if there are predators nearby (complexity 3+ organisms)"""
-        for nx, ny in self.get_neighbors(x, y):
-            neighbor = self.cells[ny][nx]
-            if neighbor and neighbor.is_alive:
-                neighbor_species = self.species_registry.get(neighbor.species_id)
-                if neighbor_species and neighbor_species.traits.can_hunt():
-                    return True
-        return False
+        # Trait math runs per cell in one compiled pass, reading traits by species ID
+        table = self.species_registry.traits_table
+        dies = age_cells(
+            self.alive, self.species_id_grid, self.consumable_mask,
+            self.energy, self.max_energy, self.age,
+            self._zone_grid, self._zone_decay_mults, self._zone_type_codes, self._pressure_grid,
+            table['max_lifespan'], table['age_decline_start'], table['energy_decay'],
+            table['complexity_cost'], table['photosynthesis_rate'], table['metabolic_efficiency'],
+            table['starvation_threshold'], table['optimal_zone_bonus'], table['colonial_affinity'],
+            table['heat_tolerance'], table['toxin_resistance'], table['energy_source_code'],
+            self._aging_dies, self.wrap)
+        
+        # Cell died (starvation or old age)
+        dead_ids = self.species_id_grid[dies]
+        if dead_ids.size == 0:
+            return
+        self.deaths_this_gen += int(dead_ids.size)
+        deaths_per_species = np.bincount(dead_ids)
+        for species_id in np.flatnonzero(deaths_per_species).tolist():
+            self.species_registry.get(species_id).total_deaths += int(deaths_per_species[species_id])
+        self.alive[dies] = False
+        self.species_id_grid[dies] = 0
+        self.hunter_mask[dies] = False
+        self.consumable_mask[dies] = False
+        self.living_count -= int(dead_ids.size)
     
     def _get_colony_bonus(self, x: int, y: int, species_id: int, species) -> float:
         """Calculate colonial clustering bonus (same-species neighbors)"""
         same_species_count = 0
         total_neighbors = 0
         
-        for nx, ny in self.get_neighbors(x, y):
-            neighbor = self.cells[ny][nx]
+        flat_cells = self._flat_cells
+        for idx in self.neighbor_indices(x, y):
+            neighbor = flat_cells[idx]
             if neighbor and neighbor.is_alive:
                 total_neighbors += 1
                 if neighbor.species_id == species_id:
@@ -423,14 +562,25 @@ class Grid:
         # Bonus = 1.0 (no neighbors) to colonial_affinity (all same species)
         return 1.0 + (colony_ratio * (species.traits.colonial_affinity - 1.0))
     
-    def _get_cluster_reproduction_bonus(self, x: int, y: int, species_id: int, species) -> float:
-        """Calculate reproduction bonus when surrounded by same-species colony"""
-        same_species_count = 0
-        
-        for nx, ny in self.get_neighbors(x, y):
-            neighbor = self.cells[ny][nx]
-            if neighbor and neighbor.is_alive and neighbor.species_id == species_id:
-                same_species_count += 1
+    def _get_cluster_reproduction_bonus(self, x: int, y: int, parent_cell: Cell, species) -> float:
+        """Calculate reproduction bonus when surrounded by same-species colony
+        
+        Uses the per-generation same-species counts built in _build_neighbor_cache;
+        the parent is one of (x, y)'s neighbors, so its slot holds the count.
+        """
+        dx = parent_cell.x - x
+        dy = parent_cell.y - y
+        if self.wrap:
+            # Undo edge wrapping so the offset is back in -1..1
+            if dx > 1:
+                dx -= self.width
+            elif dx < -1:
+                dx += self.width
+            if dy > 1:
+                dy -= self.height
+            elif dy < -1:
+                dy += self.height
+        same_species_count = self._cluster_counts[y, x, NEIGHBOR_SLOT[(dy + 1) * 3 + (dx + 1)]]
         
         # Bonus scales with cluster size (3 same-species neighbors = full bonus)
         cluster_ratio = min(1.0, same_species_count / 3.0)
@@ -443,246 +593,104 @@ class Grid:
         # Build zone caches for movement checks (OPTIMIZATION)
         self._build_zone_caches()
         
-        # Collect all cells that CAN move (have energy)
-        mobile_cells = []
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.cells[y][x]
-                if cell and cell.is_alive:
-                    species = self.species_registry.get(cell.species_id)
-                    if cell.can_move(species):
-                        mobile_cells.append((x, y, cell))
-        
-        # Process movements - only when strategically necessary
-        for old_x, old_y, cell in mobile_cells:
-            species = self.species_registry.get(cell.species_id)
-            strategy = species.traits.get_movement_strategy()
-            should_move = False
+        # All cells that CAN move (have energy), in row-major order
+        table = self.species_registry.traits_table
+        movement_cost = table['movement_cost']
+        entries = np.flatnonzero(self.alive & ~self.moved &
+                                 (self.energy >= movement_cost[self.species_id_grid]))
+        if entries.size == 0:
+            return
+        
+        # Decisions and moves run cell by cell in one compiled pass (NUMBA OPTIMIZATION):
+        # hunters chase prey, fleers escape hunters, photosynthesizers seek better zones
+        moves = self._move_buf[:entries.size]
+        rolls = self._rng.random(out=self._move_rolls[:entries.size])
+        num_moves = move_cells(
+            self.alive, self.occupied, self.species_id_grid, self.energy, self.max_energy,
+            self.age, self.moved, self.hunter_mask, self.consumable_mask,
+            self._zone_grid, self._zone_energy_mults, self._zone_decay_mults, self._zone_can_enter,
+            self._pressure_grid, table['complexity'], table['reproduction_threshold'],
+            movement_cost, table['energy_source_code'], entries, rolls,
+            migration_pressure, self.wrap, moves)
+        
+        # Mirror the moves on the Cell objects (the arrays are already updated)
+        cells = self.cells
+        flat_cells = self._flat_cells
+        width = self.width
+        displaced = 0
+        for src, dst, killed, energy, max_energy, age, moved in moves[:num_moves].tolist():
+            if killed:
+                # The displaced organism keeps its last state, as _remove_cell would leave it
+                target = flat_cells[dst]
+                target._is_alive = False
+                target._energy = energy
+                target._max_energy = max_energy
+                target._age = age
+                target._has_moved = bool(moved)
+                target._grid = None
+                displaced += 1
             
-            # Migration pressure event overrides some logic
-            if migration_pressure > 0 and random.random() < migration_pressure:
-                should_move = True
-            
-            # FOOD-DRIVEN MOVEMENT LOGIC (if not already decided to move)
-            if not should_move:
-                if strategy == "hunt":
-                    # Predators ALWAYS move to find prey (aggressive hunting)
-                    # They must hunt to survive (can't photosynthesize)
-                    has_prey = self._has_prey_nearby(old_x, old_y, species)
-                    if not has_prey or cell.energy < species.traits.reproduction_threshold * 1.2:
-                        should_move = True
-                    # Even with prey nearby, 30% chance to hunt more aggressively
-                    elif random.random() < 0.3:
-                        should_move = True
-                        
-                elif strategy == "flee":
-                    # Flee from predators (survival instinct)
-                    if self._has_predators_nearby(old_x, old_y, species):
-                        should_move = True
-                    # Also move if zone quality is poor and energy is low
-                    elif cell.energy < species.traits.reproduction_threshold * 0.7:
-                        current_zone = self._get_cached_zone(old_x, old_y)  # CACHED
-                        if current_zone.properties.energy_generation_mult < 1.0:
-                            should_move = True
-                            
-                else:  # "energy_seeking" (photosynthesizers)
-                    # Photosynthesizers explore to find better zones
-                    current_zone = self._get_cached_zone(old_x, old_y)  # CACHED
-                    current_quality = current_zone.properties.energy_generation_mult
-                    population_pressure = self._get_cached_pressure(current_zone)  # CACHED
-                    
-                    # Move if population pressure is getting bad
-                    if population_pressure < 0.8:  # Start moving at 80% pressure (was 60%)
-                        should_move = True
-                    # Move if zone is poor
-                    elif current_quality < 1.0:  # Any non-ideal zone triggers exploration
-                        should_move = True
-                    elif cell.energy > species.traits.reproduction_threshold * 1.2:  # High energy = explore
-                        # Well-fed organisms explore for new territories
-                        if random.random() < 0.35:  # 35% chance to explore when healthy
-                            should_move = True
-                    elif cell.energy < species.traits.reproduction_threshold * 0.85:
-                        # Low energy - seek better zones
-                        should_move = True
-            
-            if not should_move:
-                continue  # Stay put - conserve energy
-            
-            # Extended range for migration when desperate or exploring
-            movement_range = 1  # Default adjacent
-            if cell.energy < species.traits.reproduction_threshold * 0.5:
-                # Desperate - try long-distance migration (range 2)
-                movement_range = 2
-            elif cell.energy > species.traits.reproduction_threshold * 1.5:
-                # Abundant energy - explore farther (range 2)
-                movement_range = 2
-            
-            neighbors = self.get_neighbors(old_x, old_y, radius=movement_range)
-            
-            # Filter for valid spots (can be empty OR occupied by weaker organisms)
-            valid_spots = []
-            for nx, ny in neighbors:
-                zone = self._get_cached_zone(nx, ny)  # CACHED
-                if not zone.properties.can_enter:
-                    continue
-                    
-                target_cell = self.cells[ny][nx]
-                if target_cell is None:
-                    # Empty space - always valid
-                    valid_spots.append((nx, ny))
-                elif target_cell.is_alive:
-                    # Occupied - can displace if we have more energy (competition)
-                    if cell.energy > target_cell.energy * 1.1:  # Only need 10% more energy (was 20%)
-                        valid_spots.append((nx, ny))
-            
-            if not valid_spots:
-                continue
-            
-            # Choose destination based on complexity-driven strategy
-            strategy = species.traits.get_movement_strategy()
-            target_x, target_y = None, None
-            
-            if strategy == "energy_seeking":
-                target_x, target_y = self._move_energy_seeking(old_x, old_y, valid_spots)
-            elif strategy == "flee":
-                target_x, target_y = self._move_flee(old_x, old_y, valid_spots, species)
-            elif strategy == "hunt":
-                target_x, target_y = self._move_hunt(old_x, old_y, valid_spots, species)
-            else:
-                target_x, target_y = random.choice(valid_spots)
-            
-            # Execute movement
-            if target_x is not None and cell.move_to(target_x, target_y, species):
-                # Check if target is occupied - displacement
-                target_cell = self.cells[target_y][target_x]
-                if target_cell and target_cell.is_alive:
-                    # Displace the weaker organism (it dies or moves)
-                    target_cell.is_alive = False
-                    self.deaths_this_gen += 1
-                
-                # Update grid
-                self.cells[old_y][old_x] = None
-                self.cells[target_y][target_x] = cell
+            cell = flat_cells[src]
+            old_y, old_x = divmod(src, width)
+            new_y, new_x = divmod(dst, width)
+            cell.move_history.append((old_x, old_y))
+            if len(cell.move_history) > 10:
+                cell.move_history.pop(0)
+            cells[new_y][new_x] = cell
+            cells[old_y][old_x] = None
+            flat_cells[dst] = cell
+            flat_cells[src] = None
+            cell.x = new_x
+            cell.y = new_y
+        
+        self.living_count -= displaced
+        self.deaths_this_gen += displaced
         
         # Reset movement flags
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.cells[y][x]
-                if cell and cell.is_alive:
-                    cell.reset_movement()
-    
-    def _move_energy_seeking(self, x: int, y: int, valid_spots: List[Tuple[int, int]]) -> Tuple[int, int]:
-        """Move toward zones with better energy generation"""
-        current_zone = self._get_cached_zone(x, y)  # CACHED
-        current_energy_mult = current_zone.properties.energy_generation_mult
-        
-        # Score each spot by energy potential
-        best_spot = None
-        best_score = current_energy_mult
-        
-        for nx, ny in valid_spots:
-            zone = self._get_cached_zone(nx, ny)  # CACHED
-            score = zone.properties.energy_generation_mult - zone.properties.energy_decay_mult
-            
-            if score > best_score:
-                best_score = score
-                best_spot = (nx, ny)
-        
-        # If no better spot, move randomly
-        return best_spot if best_spot else random.choice(valid_spots)
-    
-    def _move_flee(self, x: int, y: int, valid_spots: List[Tuple[int, int]], species: Species) -> Tuple[int, int]:
-        """Move away from predators (complexity 3+ organisms)"""
-        # Find predators in neighborhood
-        predators_nearby = []
-        for nx, ny in self.get_neighbors(x, y):
-            neighbor = self.cells[ny][nx]
-            if neighbor and neighbor.is_alive:
-                neighbor_species = self.species_registry.get(neighbor.species_id)
-                # Flee from organisms that can hunt (complexity 3+)
-                if neighbor_species.traits.can_hunt():
-                    predators_nearby.append((nx, ny))
-        
-        if not predators_nearby:
-            # No threat, move toward energy
-            return self._move_energy_seeking(x, y, valid_spots)
-        
-        # Move to spot farthest from predators
-        best_spot = None
-        best_distance = -1
-        
-        for nx, ny in valid_spots:
-            min_dist = min(abs(nx - px) + abs(ny - py) for px, py in predators_nearby)
-            if min_dist > best_distance:
-                best_distance = min_dist
-                best_spot = (nx, ny)
-        
-        return best_spot if best_spot else random.choice(valid_spots)
-    
-    def _move_hunt(self, x: int, y: int, valid_spots: List[Tuple[int, int]], species: Species) -> Tuple[int, int]:
-        """Move toward prey"""
-        # Find prey in extended neighborhood
-        prey_nearby = []
-        for nx, ny in self.get_neighbors(x, y):
-            neighbor = self.cells[ny][nx]
-            if neighbor and neighbor.is_alive:
-                neighbor_species = self.species_registry.get(neighbor.species_id)
-                # Hunt organisms that can be consumed and aren't hunters themselves
-                if neighbor_species.traits.can_be_consumed and not neighbor_species.traits.can_hunt():
-                    prey_nearby.append((nx, ny))
-        
-        if not prey_nearby:
-            # No prey, move toward energy
-            return self._move_energy_seeking(x, y, valid_spots)
-        
-        # Move to spot closest to prey
-        best_spot = None
-        best_distance = float('inf')
-        
-        for nx, ny in valid_spots:
-            min_dist = min(abs(nx - px) + abs(ny - py) for px, py in prey_nearby)
-            if min_dist < best_distance:
-                best_distance = min_dist
-                best_spot = (nx, ny)
-        
-        return best_spot if best_spot else random.choice(valid_spots)
+        self.moved[:] = False
     
     def process_predation(self):
         """Handle predation (only for complexity 3+ organisms)"""
-        predation_events = []  # (predator_cell, prey_x, prey_y)
-        
-        # Find all complex organisms that can hunt
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.cells[y][x]
-                if cell and cell.is_alive:
-                    species = self.species_registry.get(cell.species_id)
-                    
-                    # Only complex organisms (complexity 3+) can hunt
-                    if species.traits.can_hunt():
-                        # Look for prey in adjacent cells
-                        prey_neighbors = []
-                        for nx, ny in self.get_neighbors(x, y):
-                            neighbor = self.cells[ny][nx]
-                            if neighbor and neighbor.is_alive:
-                                neighbor_species = self.species_registry.get(neighbor.species_id)
-                                # Can't eat same species or other hunters
-                                if (neighbor_species.traits.can_be_consumed and 
-                                    neighbor.species_id != cell.species_id):
-                                    prey_neighbors.append((neighbor, nx, ny))
-                        
-                        # Attack one prey if available
-                        if prey_neighbors:
-                            prey_cell, px, py = random.choice(prey_neighbors)
-                            predation_events.append((cell, species, prey_cell, px, py))
+        # Only hunter positions enter Python; everything else is skipped by the mask
+        hunters = np.argwhere(self.hunter_mask)
+        if len(hunters) == 0:
+            return
+        
+        hunter_ys = hunters[:, 0]
+        hunter_xs = hunters[:, 1]
+        # Complexity-based hunting efficiency for every hunter in one gather
+        hunter_efficiency = self.species_registry.traits_table['hunting_efficiency'][
+            self.species_id_grid[hunter_ys, hunter_xs]]
+        
+        # Scan all hunters' neighborhoods and pick one prey each (NUMBA OPTIMIZATION)
+        # Can't eat same species or cells that can't be consumed
+        prey_slots = pick_prey_slots(self.species_id_grid, self.consumable_mask,
+                                     hunter_ys, hunter_xs, self._rng.random(len(hunters)),
+                                     self.wrap)
+        
+        # Hoist attribute lookups out of the per-hunter loops
+        cells = self.cells
+        width, height = self.width, self.height
+        species_get = self.species_registry.get
+        
+        predation_events = []  # (predator_cell, efficiency, prey_cell, prey_x, prey_y)
+        
+        # Attack one prey per hunter (hunters are visited in row-major order)
+        for i in np.flatnonzero(prey_slots >= 0).tolist():
+            x, y = int(hunter_xs[i]), int(hunter_ys[i])
+            cell = cells[y][x]
+            
+            slot = prey_slots[i]
+            px = (x + NEIGHBOR_DX[slot]) % width
+            py = (y + NEIGHBOR_DY[slot]) % height
+            predation_events.append((cell, float(hunter_efficiency[i]), cells[py][px], px, py))
         
         # Process predation events
-        for predator_cell, predator_species, prey_cell, px, py in predation_events:
+        for predator_cell, actual_efficiency, prey_cell, px, py in predation_events:
             if prey_cell.is_alive:  # Check if prey still alive
-                prey_species = self.species_registry.get(prey_cell.species_id)
+                prey_species = species_get(prey_cell.species_id)
                 
                 # Use complexity-based hunting efficiency
-                actual_efficiency = predator_species.traits.get_hunting_efficiency()
                 energy_gained = int(prey_cell.energy * actual_efficiency)
                 predator_cell.energy = min(predator_cell.max_energy, predator_cell.energy + energy_gained)
                 
@@ -690,164 +698,144 @@ class Grid:
                 prey_cell.is_alive = False
                 
                 # Remove from grid
-                self.cells[py][px] = None
+                self._remove_cell(px, py)
                 self.deaths_this_gen += 1
                 prey_species.total_deaths += 1
     
     def process_reproduction(self):
         """Handle births and deaths based on Conway rules + energy"""
-        # Build neighbor cache once for this generation (NUMBA OPTIMIZATION)
-        self._build_neighbor_cache()
         # Build zone caches (OPTIMIZATION)
         self._build_zone_caches()
         
-        # We need to process births/deaths simultaneously
-        birth_queue = []  # (x, y, species_id, energy)
-        death_queue = []  # (x, y)
-        
-        # Check all positions
-        for y in range(self.height):
-            for x in range(self.width):
-                neighbors_count = self.count_living_neighbors(x, y)
-                current_cell = self.cells[y][x]
+        # One bulk draw replaces the per-cell random.random() rolls
+        rolls = self._rng.random(out=self._rng_buf, dtype=np.float32)
+        age_death_rolls = rolls[self.RNG_AGE_DEATH]
+        birth_rolls = rolls[self.RNG_BIRTH]
+        mutation_rolls = rolls[self.RNG_MUTATION]
+        
+        # ENERGY-DEPENDENT CONWAY RULES (Phase 3+4) for the whole grid (NUMBA OPTIMIZATION)
+        # Living cells die outside their energy-dependent neighbor band, which
+        # makes stable patterns collapse when energy depletes; old cells at max
+        # neighbors get a small random death chance to break perfect geometry.
+        # Empty or dead cells with 2-4 neighbors are birth candidates, kept only
+        # if their birth roll passes (3 neighbors: always, 2 or 4: 50%).
+        dies, birth_ok = self._classify_cells(age_death_rolls, birth_rolls)
+        
+        # Per-row parallel compaction into short work lists (row-major order)
+        death_ys, death_xs = mask_positions(dies)
+        birth_ys, birth_xs = mask_positions(birth_ok)
+        
+        birth_buf = self._birth_buf  # (x, y, species_id, energy) rows
+        n_births = 0
+        
+        # Hoist attribute lookups out of the per-candidate loop
+        flat_cells = self._flat_cells
+        width = self.width
+        species_get = self.species_registry.get
+        zone_list = self._zone_list
+        get_cluster_bonus = self._get_cluster_reproduction_bonus
+        rand_choice = random.choice
+        generation = self.generation
+        
+        # Empty or dead cells: check for birth
+        # RELAXED CONWAY: 2-4 neighbors can trigger birth (not just 3)
+        # This allows reproduction in more configurations
+        # Per-candidate zone data gathered in one shot from the per-generation maps
+        birth_zones = self._zone_grid[birth_ys, birth_xs].tolist()
+        birth_pressures = self._pressure_grid[birth_ys, birth_xs].tolist()
+        birth_difficulties = self._repro_difficulty_grid[birth_ys, birth_xs].tolist()
+        # Living neighbors of every candidate, found in one compiled pass
+        birth_nbrs, birth_nbr_counts = live_neighbor_indices(self.alive, birth_ys, birth_xs, self.wrap)
+        
+        for y, x, zone_idx, population_pressure, reproduction_difficulty, nbrs, nbr_count in zip(
+                birth_ys.tolist(), birth_xs.tolist(), birth_zones, birth_pressures, birth_difficulties,
+                birth_nbrs.tolist(), birth_nbr_counts.tolist()):
+            # Determine parent species (from neighbors)
+            neighbor_cells = [flat_cells[idx] for idx in nbrs[:nbr_count]]
+            
+            if len(neighbor_cells) >= 2:  # At least 2 neighbors needed
+                # Check if sexual reproduction is required
+                parent_cell = rand_choice(neighbor_cells)
+                parent_species = species_get(parent_cell.species_id)
                 
-                if current_cell and current_cell.is_alive:
-                    # Living cell: ENERGY-DEPENDENT CONWAY RULES (Phase 3+4)
-                    # High energy cells: Standard Conway (2-3 neighbors survive)
-                    # Low energy cells: Need MORE neighbors (3-4) to survive
-                    # This makes stable patterns collapse when energy depletes
-                    species = self.species_registry.get(current_cell.species_id)
-                    energy_ratio = current_cell.energy / current_cell.max_energy
-                    
-                    # Calculate neighbor requirements based on energy
-                    if energy_ratio > 0.7:
-                        # High energy: Standard Conway (2-3 neighbors)
-                        min_neighbors, max_neighbors = 2, 3
-                    elif energy_ratio > 0.4:
-                        # Medium energy: Slightly harder (2-3 neighbors, but 4 is risky)
-                        min_neighbors, max_neighbors = 2, 3
-                        # Add small chance of death at 4 neighbors when weakened
-                        if neighbors_count == 4 and random.random() < 0.3:
-                            death_queue.append((x, y))
-                            continue
+                # Sexual reproduction: need two parents of same species
+                second_parent = None
+                if parent_species.traits.sexual_reproduction and len(neighbor_cells) >= 2:
+                    # Find another parent of same species
+                    same_species_neighbors = [nc for nc in neighbor_cells 
+                                             if nc.species_id == parent_species.id and nc != parent_cell]
+                    if same_species_neighbors:
+                        second_parent = rand_choice(same_species_neighbors)
                     else:
-                        # Low energy: Need 3-4 neighbors (2 is too lonely, 5+ too crowded)
-                        min_neighbors, max_neighbors = 3, 4
-                    
-                    # Apply rules with geometry-breaking perturbation
-                    if neighbors_count < min_neighbors or neighbors_count > max_neighbors:
-                        death_queue.append((x, y))
-                    elif neighbors_count == max_neighbors and current_cell.age > 50:
-                        # Older cells at max neighbors: small random death chance
-                        # Breaks perfect geometric stability over time
-                        if random.random() < 0.02:  # 2% chance
-                            death_queue.append((x, y))
-                    # else: survives
+                        # Can't reproduce without second parent
+                        continue
                 
-                else:
-                    # Empty or dead cell: check for birth
-                    # RELAXED CONWAY: 2-4 neighbors can trigger birth (not just 3)
-                    # This allows reproduction in more configurations
-                    if 2 <= neighbors_count <= 4:
-                        # Determine parent species (from neighbors)
-                        neighbor_cells = []
-                        for nx, ny in self.get_neighbors(x, y):
-                            ncell = self.cells[ny][nx]
-                            if ncell and ncell.is_alive:
-                                neighbor_cells.append(ncell)
+                zone = zone_list[zone_idx]  # CACHED
+                if zone.properties.can_enter:
+                    # Population pressure (Phase 4: Carrying Capacity) and reproduction
+                    # difficulty come from the per-position maps - CACHED
+                    
+                    # PHASE 3: Native zone bonus
+                    # Species reproduce better in their native habitat
+                    native_zone_bonus = 1.0
+                    if zone.properties.zone_type_code == parent_species.traits.native_zone_type_code:
+                        # In native zone: lower threshold, easier reproduction
+                        native_zone_bonus = parent_species.traits.native_zone_affinity
+                    
+                    # Colonial clustering bonus: Cells in same-species clusters reproduce better
+                    cluster_bonus = get_cluster_bonus(x, y, parent_cell, parent_species)
+                    
+                    # Birth happens if parent has enough energy
+                    # Energy from parent(s) if they can afford it
+                    effective_threshold = parent_species.traits.reproduction_threshold * reproduction_difficulty / (native_zone_bonus * cluster_bonus)
+                    
+                    if parent_cell.can_reproduce(parent_species) and parent_cell.energy >= effective_threshold:
+                        offspring_energy = parent_cell.consume_reproduction_energy(parent_species)
                         
-                        if len(neighbor_cells) >= 2:  # At least 2 neighbors needed
-                            # Check if sexual reproduction is required
-                            parent_cell = random.choice(neighbor_cells)
-                            parent_species = self.species_registry.get(parent_cell.species_id)
-                            
-                            # Sexual reproduction: need two parents of same species
-                            second_parent = None
-                            if parent_species.traits.sexual_reproduction and len(neighbor_cells) >= 2:
-                                # Find another parent of same species
-                                same_species_neighbors = [nc for nc in neighbor_cells 
-                                                         if nc.species_id == parent_species.id and nc != parent_cell]
-                                if same_species_neighbors:
-                                    second_parent = random.choice(same_species_neighbors)
-                                else:
-                                    # Can't reproduce without second parent
-                                    continue
-                            
-                            zone = self._get_cached_zone(x, y)  # CACHED
-                            if zone.properties.can_enter:
-                                # Check population pressure (Phase 4: Carrying Capacity) - CACHED
-                                population_pressure = self._get_cached_pressure(zone)
-                                
-                                # Reproduction is moderately harder in overcrowded zones
-                                # Only significantly blocked in extreme overcrowding (> 150% capacity)
-                                reproduction_difficulty = max(1.0, 1.0 / max(0.8, population_pressure))
-                                
-                                # PHASE 3: Native zone bonus
-                                # Species reproduce better in their native habitat
-                                zone_type_name = zone.properties.name.lower().split()[0]  # Extract "fertile", "desert", etc.
-                                native_zone_bonus = 1.0
-                                if zone_type_name == parent_species.traits.native_zone_type:
-                                    # In native zone: lower threshold, easier reproduction
-                                    native_zone_bonus = parent_species.traits.native_zone_affinity
-                                
-                                # Colonial clustering bonus: Cells in same-species clusters reproduce better
-                                cluster_bonus = self._get_cluster_reproduction_bonus(x, y, parent_species.id, parent_species)
-                                
-                                # Birth probability depends on neighbor count
-                                # 3 neighbors: 100% chance (classic Conway)
-                                # 2 or 4 neighbors: 50% chance (relaxed rule)
-                                birth_probability = 1.0 if neighbors_count == 3 else 0.5
-                                if random.random() > birth_probability:
-                                    continue  # Birth doesn't happen this time
-                                
-                                # Birth happens if parent has enough energy
-                                # Energy from parent(s) if they can afford it
-                                effective_threshold = parent_species.traits.reproduction_threshold * reproduction_difficulty / (native_zone_bonus * cluster_bonus)
-                                
-                                if parent_cell.can_reproduce(parent_species) and parent_cell.energy >= effective_threshold:
-                                    offspring_energy = parent_cell.consume_reproduction_energy(parent_species)
-                                    
-                                    # Second parent contributes if sexual
-                                    if second_parent and second_parent.can_reproduce(parent_species):
-                                        offspring_energy += second_parent.consume_reproduction_energy(parent_species) // 2
-                                else:
-                                    # In severely overcrowded zones (< 0.6x pressure), block weak reproduction
-                                    if population_pressure < 0.6:
-                                        continue  # Skip birth if zone is extremely crowded and parents are weak
-                                    # Otherwise birth can still happen with minimal energy
-                                    offspring_energy = parent_species.traits.base_energy // 3
-                                
-                                # Mutation check (sexual reproduction reduces mutation chance)
-                                mutation_mult = 0.5 if second_parent else 1.0
-                                effective_mutation_rate = (parent_species.traits.mutation_rate * 
-                                                         zone.properties.mutation_rate_mult * mutation_mult)
-                                
-                                if random.random() < effective_mutation_rate:
-                                    # Mutate
-                                    mutant_species = parent_species.mutate(self.generation)
-                                    self.species_registry.register(mutant_species)
-                                    birth_queue.append((x, y, mutant_species.id, offspring_energy))
-                                    self.mutations_this_gen += 1
-                                else:
-                                    # Normal birth
-                                    birth_queue.append((x, y, parent_species.id, offspring_energy))
+                        # Second parent contributes if sexual
+                        if second_parent and second_parent.can_reproduce(parent_species):
+                            offspring_energy += second_parent.consume_reproduction_energy(parent_species) // 2
+                    else:
+                        # In severely overcrowded zones (< 0.6x pressure), block weak reproduction
+                        if population_pressure < 0.6:
+                            continue  # Skip birth if zone is extremely crowded and parents are weak
+                        # Otherwise birth can still happen with minimal energy
+                        offspring_energy = parent_species.traits.base_energy // 3
+                    
+                    # Mutation check (sexual reproduction reduces mutation chance)
+                    mutation_mult = 0.5 if second_parent else 1.0
+                    effective_mutation_rate = (parent_species.traits.mutation_rate * 
+                                             zone.properties.mutation_rate_mult * mutation_mult)
+                    
+                    if mutation_rolls[y, x] < effective_mutation_rate:
+                        # Mutate
+                        mutant_species = parent_species.mutate(generation, self._rng)
+                        self.species_registry.register(mutant_species)
+                        birth_buf[n_births] = (x, y, mutant_species.id, offspring_energy)
+                        n_births += 1
+                        self.mutations_this_gen += 1
+                    else:
+                        # Normal birth
+                        birth_buf[n_births] = (x, y, parent_species.id, offspring_energy)
+                        n_births += 1
         
         # Apply deaths
-        for x, y in death_queue:
-            cell = self.cells[y][x]
+        for y, x in zip(death_ys.tolist(), death_xs.tolist()):
+            cell = flat_cells[y * width + x]
             if cell:
-                species = self.species_registry.get(cell.species_id)
+                species = species_get(cell.species_id)
                 if species:
                     species.total_deaths += 1
                 cell.is_alive = False
-                self.cells[y][x] = None
+                self._remove_cell(x, y)
                 self.deaths_this_gen += 1
         
         # Apply births
-        for x, y, species_id, energy in birth_queue:
-            species = self.species_registry.get(species_id)
+        self._n_births = n_births
+        for x, y, species_id, energy in birth_buf[:n_births].tolist():
+            species = species_get(species_id)
             if species:
-                self.cells[y][x] = Cell(x, y, species, energy)
+                self._place_cell(x, y, species, energy)
                 species.total_births += 1
                 self.births_this_gen += 1
     
@@ -859,20 +847,20 @@ class Grid:
         if total < 1:
             return  # Skip if too fast
         
-        print(f"\nPerformance (Gen {self.generation}):")
-        print(f"  Total:        {total:.1f}ms")
-        print(f"  Aging:        {stats['aging']*1000:.1f}ms ({stats['aging']/stats['total_step']*100:.0f}%)")
-        print(f"  Movement:     {stats['movement']*1000:.1f}ms ({stats['movement']/stats['total_step']*100:.0f}%)")
-        print(f"  Predation:    {stats['predation']*1000:.1f}ms ({stats['predation']/stats['total_step']*100:.0f}%)")
-        print(f"  Reproduction: {stats['reproduction']*1000:.1f}ms ({stats['reproduction']/stats['total_step']*100:.0f}%)")
-        print(f"  Neighbor Cnt: {stats['neighbor_counting']*1000:.1f}ms ({stats['neighbor_counting']/stats['total_step']*100:.0f}%)")
+        step = stats['total_step']
+        lines = [f"\nPerformance (Gen {self.generation}):", f"  Total:        {total:.1f}ms"]
+        for label, key in (("Aging", 'aging'), ("Movement", 'movement'), ("Predation", 'predation'),
+                           ("Reproduction", 'reproduction'), ("Neighbor Cnt", 'neighbor_counting')):
+            lines.append(f"  {label + ':':<13} {stats[key]*1000:.1f}ms ({stats[key]/step*100:.0f}%)")
+        
+        # One write instead of a print() per line
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Reset neighbor counting for next cycle
         stats['neighbor_counting'] = 0.0
     
     def get_stats(self):
         """Get current simulation statistics"""
-        living_cells = sum(1 for row in self.cells for cell in row if cell and cell.is_alive)
         species_stats = self.species_registry.get_stats()
         
         avg_species_age = 0
@@ -883,7 +871,7 @@ class Grid:
         
         return {
             'generation': self.generation,
-            'population': living_cells,
+            'population': self.living_count,
             'species_count': species_stats['total_species'],
             'births': self.births_this_gen,
             'deaths': self.deaths_this_gen,
@@ -5,48 +5,40 @@ These functions integrate with the existing Grid class for performance
 import numpy as np
 from numba import jit, prange
 
+from .zones import ZONE_TYPE_CODES
 
-@jit(nopython=True, parallel=True, cache=True)
-def count_all_neighbors(alive_grid, wrap=True):
+# Stencil passes walk the grid in TILE_SIZE x TILE_SIZE blocks so a block plus
+# its 1-cell halo (~9 bytes per cell across the inputs/outputs) stays in L1
+TILE_SIZE = 48
+
+# Zone type codes the trait math branches on (see zones.zone_type_code)
+ZONE_FERTILE = ZONE_TYPE_CODES['fertile']
+ZONE_DESERT = ZONE_TYPE_CODES['desert']
+ZONE_TOXIC = ZONE_TYPE_CODES['toxic']
+ZONE_PARADISE = ZONE_TYPE_CODES['paradise']
+
+# Energy source codes (see species_enhanced.EnergySource)
+SOURCE_PHOTOSYNTHESIS = 0
+SOURCE_PREDATION = 1
+
+
+@jit(nopython=True, cache=True)
+def wrap_index_table(size, wrap):
     """
-    Count living neighbors for every position in the grid
-    
-    Args:
-        alive_grid: 2D numpy bool array (height x width)
-        wrap: Whether edges wrap around
+    Neighbor coordinate lookup for the offsets -1..size (entry i + 1 -> coordinate i)
     
-    Returns:
-        2D numpy int array with neighbor counts
+    Wrapped edges map to the opposite side; off-grid entries are -1 when not
+    wrapping. Lets the stencil kernels index instead of taking a modulo per neighbor.
     """
-    height, width = alive_grid.shape
-    neighbor_counts = np.zeros((height, width), dtype=np.int32)
-    
-    for y in prange(height):
-        for x in range(width):
-            count = 0
-            
-            # Check all 8 neighbors
-            for dy in range(-1, 2):
-                for dx in range(-1, 2):
-                    if dx == 0 and dy == 0:
-                        continue
-                    
-                    nx = x + dx
-                    ny = y + dy
-                    
-                    if wrap:
-                        nx = nx % width
-                        ny = ny % height
-                    else:
-                        if nx < 0 or nx >= width or ny < 0 or ny >= height:
-                            continue
-                    
-                    if alive_grid[ny, nx]:
-                        count += 1
-            
-            neighbor_counts[y, x] = count
-    
-    return neighbor_counts
+    table = np.empty(size + 2, dtype=np.int64)
+    for i in range(-1, size + 1):
+        if 0 <= i < size:
+            table[i + 1] = i
+        elif wrap:
+            table[i + 1] = i % size
+        else:
+            table[i + 1] = -1
+    return table
 
 
 @jit(nopython=True, parallel=True, cache=True)
@@ -80,33 +72,727 @@ def process_energy_decay_batch(energy_array, alive_array, decay_rates, width, he
     return energy_array, alive_array, deaths
 
 
-@jit(nopython=True)
-def get_birth_and_death_positions(alive_grid, neighbor_counts, width, height):
+# Survival band per energy class (0: ratio <= 0.4, 1: <= 0.7, 2: > 0.7),
+# indexed instead of branched on so mixed populations don't mispredict
+SURVIVAL_MIN_LUT = np.array([3, 2, 2], dtype=np.int8)
+SURVIVAL_MAX_LUT = np.array([4, 3, 3], dtype=np.int8)
+
+
+@jit(nopython=True, inline='always', cache=True)
+def survival_range(energy, max_energy):
     """
-    Determine which positions should have births and deaths
-    Based on Conway's rules + energy requirements
+    Energy-dependent (min, max) living-neighbor range a cell survives in
     
-    This is a PURE CONWAY ANALYSIS - actual birth/death logic stays in Python
-    to handle species, energy, zones, etc.
+    Well-fed cells (ratio > 0.4) follow classic 2-3; starving cells need 3-4.
+    """
+    ratio = energy / max_energy
+    energy_class = np.int8(ratio > 0.7) + np.int8(ratio > 0.4)
+    return SURVIVAL_MIN_LUT[energy_class], SURVIVAL_MAX_LUT[energy_class]
+
+
+@jit(nopython=True, inline='always', cache=True)
+def birth_probability(count):
+    """
+    Birth chance for an empty cell with `count` living neighbors
+    
+    3 neighbors: 100% (classic Conway); 2 or 4 neighbors: 50% (relaxed rule)
+    """
+    if count == 3:
+        return 1.0
+    return 0.5
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def classify_conway(alive_grid, energy, max_energy, age, age_death_rolls, birth_rolls,
+                    neighbor_counts, dies, birth_ok, wrap=True):
+    """
+    Count neighbors and apply the energy-dependent Conway rules in one pass
+    
+    Living cells:
+        energy ratio > 0.4: survive with 2-3 neighbors
+        energy ratio <= 0.4: survive with 3-4 neighbors
+        cells older than 50 at their max neighbor count die with 2% chance
+    Empty/dead cells with 2-4 neighbors are birth candidates (relaxed Conway)
+    if their birth roll passes; the species/energy/zone side of a birth stays
+    in Python.
+    
+    Args:
+        alive_grid: 2D numpy bool array (height x width)
+        energy, max_energy, age: 2D numpy int arrays of per-cell state
+        age_death_rolls: 2D array of uniform [0, 1) random numbers
+        birth_rolls: 2D array of uniform [0, 1) random numbers
+        neighbor_counts: 2D numpy int32 output array, overwritten
+        dies, birth_ok: 2D numpy bool output masks, overwritten
+        wrap: Whether edges wrap around
     
     Returns:
-        potential_births: List of (x, y) positions that meet Conway birth criteria (2-4 neighbors)
-        potential_deaths: List of (x, y) positions that meet Conway death criteria
+        (neighbor_counts, dies, birth_ok): the output arrays passed in
     """
-    birth_positions = []
-    death_positions = []
+    height, width = alive_grid.shape
+    x_tbl = wrap_index_table(width, wrap)
+    y_tbl = wrap_index_table(height, wrap)
+    tiles_x = (width + TILE_SIZE - 1) // TILE_SIZE
+    tiles_y = (height + TILE_SIZE - 1) // TILE_SIZE
+    
+    for tile in prange(tiles_y * tiles_x):
+        y0 = (tile // tiles_x) * TILE_SIZE
+        x0 = (tile % tiles_x) * TILE_SIZE
+        for y in range(y0, min(y0 + TILE_SIZE, height)):
+            for x in range(x0, min(x0 + TILE_SIZE, width)):
+                count = 0
+                
+                # Check all 8 neighbors
+                for dy in range(-1, 2):
+                    for dx in range(-1, 2):
+                        if dx == 0 and dy == 0:
+                            continue
+                        
+                        nx = x_tbl[x + dx + 1]
+                        ny = y_tbl[y + dy + 1]
+                        if nx < 0 or ny < 0:
+                            continue
+                        
+                        if alive_grid[ny, nx]:
+                            count += 1
+                
+                neighbor_counts[y, x] = count
+                dies[y, x] = False
+                birth_ok[y, x] = False
+                
+                if alive_grid[y, x]:
+                    min_neighbors, max_neighbors = survival_range(energy[y, x], max_energy[y, x])
+                    if count < min_neighbors or count > max_neighbors:
+                        dies[y, x] = True
+                    elif count == max_neighbors and age[y, x] > 50:
+                        if age_death_rolls[y, x] < 0.02:
+                            dies[y, x] = True
+                elif 2 <= count <= 4 and birth_rolls[y, x] <= birth_probability(count):
+                    birth_ok[y, x] = True
     
+    return neighbor_counts, dies, birth_ok
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def mask_positions(mask):
+    """
+    Compact a 2D bool mask into row-major coordinate lists, in parallel
+    
+    Each row counts its hits, a prefix sum gives every row its own slice of
+    the output, and rows then fill their slices independently.
+    
+    Args:
+        mask: 2D numpy bool array (height x width)
+    
+    Returns:
+        (ys, xs): 1D int32 arrays of the True positions in row-major order
+    """
+    height, width = mask.shape
+    row_counts = np.zeros(height, dtype=np.int64)
+    
+    for y in prange(height):
+        count = 0
+        for x in range(width):
+            if mask[y, x]:
+                count += 1
+        row_counts[y] = count
+    
+    row_starts = np.zeros(height + 1, dtype=np.int64)
     for y in range(height):
+        row_starts[y + 1] = row_starts[y] + row_counts[y]
+    
+    total = row_starts[height]
+    ys = np.empty(total, dtype=np.int32)
+    xs = np.empty(total, dtype=np.int32)
+    
+    for y in prange(height):
+        i = row_starts[y]
+        for x in range(width):
+            if mask[y, x]:
+                ys[i] = y
+                xs[i] = x
+                i += 1
+    
+    return ys, xs
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def live_neighbor_indices(alive_grid, ys, xs, wrap=True):
+    """
+    Flat indices (y * width + x) of the living neighbors of each listed position
+    
+    Neighbor order follows Grid.get_neighbors, so callers iterating a row see
+    the same cells in the same order as a get_neighbors() scan would.
+    
+    Args:
+        alive_grid: 2D numpy bool array (height x width)
+        ys, xs: 1D arrays with the query coordinates
+        wrap: Whether edges wrap around
+    
+    Returns:
+        (indices, counts): (n, 8) int32 array padded with -1, and int32 live counts
+    """
+    height, width = alive_grid.shape
+    x_tbl = wrap_index_table(width, wrap)
+    y_tbl = wrap_index_table(height, wrap)
+    n = ys.shape[0]
+    indices = np.full((n, 8), -1, dtype=np.int32)
+    counts = np.zeros(n, dtype=np.int32)
+    
+    for i in prange(n):
+        y = ys[i]
+        x = xs[i]
+        k = 0
+        for dy in range(-1, 2):
+            for dx in range(-1, 2):
+                if dx == 0 and dy == 0:
+                    continue
+                
+                nx = x_tbl[x + dx + 1]
+                ny = y_tbl[y + dy + 1]
+                if nx < 0 or ny < 0:
+                    continue
+                
+                if alive_grid[ny, nx]:
+                    indices[i, k] = ny * width + nx
+                    k += 1
+        counts[i] = k
+    
+    return indices, counts
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def same_species_neighbor_counts(species_id_grid, counts, wrap=True):
+    """
+    Count same-species neighbors around every position, per neighbor slot
+    
+    Neighbor slots follow Grid.get_neighbors order:
+    (-1,-1), (0,-1), (1,-1), (-1,0), (1,0), (-1,1), (0,1), (1,1)
+    
+    Args:
+        species_id_grid: 2D numpy int32 array of living species IDs (0 = empty)
+        counts: 3D numpy int8 output array (height x width x 8), overwritten
+        wrap: Whether edges wrap around
+    
+    Returns:
+        counts, where [y, x, k] is how many neighbors of (x, y) share the
+        species found in slot k (0 if slot k is empty)
+    """
+    height, width = species_id_grid.shape
+    x_tbl = wrap_index_table(width, wrap)
+    y_tbl = wrap_index_table(height, wrap)
+    tiles_x = (width + TILE_SIZE - 1) // TILE_SIZE
+    tiles_y = (height + TILE_SIZE - 1) // TILE_SIZE
+    
+    for tile in prange(tiles_y * tiles_x):
+        y0 = (tile // tiles_x) * TILE_SIZE
+        x0 = (tile % tiles_x) * TILE_SIZE
+        ids = np.zeros(8, dtype=np.int32)
+        for y in range(y0, min(y0 + TILE_SIZE, height)):
+            for x in range(x0, min(x0 + TILE_SIZE, width)):
+                # Gather the 8 neighbor species IDs (0 for empty or off-grid)
+                k = 0
+                for dy in range(-1, 2):
+                    for dx in range(-1, 2):
+                        if dx == 0 and dy == 0:
+                            continue
+                        
+                        nx = x_tbl[x + dx + 1]
+                        ny = y_tbl[y + dy + 1]
+                        if nx < 0 or ny < 0:
+                            ids[k] = 0
+                        else:
+                            ids[k] = species_id_grid[ny, nx]
+                        k += 1
+                
+                for k in range(8):
+                    if ids[k] == 0:
+                        counts[y, x, k] = 0
+                        continue
+                    same = 0
+                    for j in range(8):
+                        if ids[j] == ids[k]:
+                            same += 1
+                    counts[y, x, k] = same
+    
+    return counts
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def pick_prey_slots(species_id_grid, consumable_mask, hunter_ys, hunter_xs, rolls, wrap=True):
+    """
+    Pick one prey neighbor slot per hunter, uniformly among edible neighbors
+    
+    Prey must be alive, consumable, and of a different species than the hunter.
+    Neighbor slots follow Grid.get_neighbors order (see same_species_neighbor_counts).
+    The choice is index-based (floor(roll * num_prey)-th edible slot), so no
+    candidate list is ever built.
+    
+    Args:
+        species_id_grid: 2D numpy int32 array of living species IDs (0 = empty)
+        consumable_mask: 2D numpy bool array of cells that can be eaten
+        hunter_ys, hunter_xs: 1D arrays with hunter coordinates
+        rolls: 1D array of uniform [0, 1) random numbers, one per hunter
+        wrap: Whether edges wrap around
+    
+    Returns:
+        1D numpy int8 array of chosen slots (-1 when a hunter has no prey)
+    """
+    height, width = species_id_grid.shape
+    x_tbl = wrap_index_table(width, wrap)
+    y_tbl = wrap_index_table(height, wrap)
+    num_hunters = hunter_ys.shape[0]
+    chosen = np.full(num_hunters, -1, dtype=np.int8)
+    
+    for i in prange(num_hunters):
+        y = hunter_ys[i]
+        x = hunter_xs[i]
+        hunter_id = species_id_grid[y, x]
+        
+        # Mark edible slots and count them
+        edible = np.zeros(8, dtype=np.bool_)
+        num_prey = 0
+        k = 0
+        for dy in range(-1, 2):
+            for dx in range(-1, 2):
+                if dx == 0 and dy == 0:
+                    continue
+                
+                nx = x_tbl[x + dx + 1]
+                ny = y_tbl[y + dy + 1]
+                if nx < 0 or ny < 0:
+                    k += 1
+                    continue
+                
+                if consumable_mask[ny, nx] and species_id_grid[ny, nx] != hunter_id:
+                    edible[k] = True
+                    num_prey += 1
+                k += 1
+        
+        if num_prey == 0:
+            continue
+        
+        # Select the target-th edible slot
+        target = min(int(rolls[i] * num_prey), num_prey - 1)
+        for k in range(8):
+            if edible[k]:
+                if target == 0:
+                    chosen[i] = k
+                    break
+                target -= 1
+    
+    return chosen
+
+
+@jit(nopython=True, inline='always', cache=True)
+def adaptation_bonus(zone_code, heat_tolerance, toxin_resistance):
+    """Energy bonus/penalty for a zone type (mirrors SpeciesTraits.get_adaptation_bonus)"""
+    if zone_code == ZONE_DESERT:
+        return 0.5 + (heat_tolerance * 1.0)
+    elif zone_code == ZONE_FERTILE:
+        return 1.0 + (1.0 - abs(heat_tolerance - 0.5)) * 0.5
+    elif zone_code == ZONE_TOXIC:
+        return 0.3 + (toxin_resistance * 1.2)
+    elif zone_code == ZONE_PARADISE:
+        return 1.5
+    return 1.0
+
+
+@jit(nopython=True, inline='always', cache=True)
+def is_optimal_zone(zone_code, heat_tolerance, toxin_resistance):
+    """Whether a zone type is optimal (mirrors SpeciesTraits.is_optimal_zone)"""
+    if zone_code == ZONE_DESERT:
+        return heat_tolerance > 0.7
+    elif zone_code == ZONE_FERTILE:
+        return 0.4 <= heat_tolerance <= 0.6
+    elif zone_code == ZONE_TOXIC:
+        return toxin_resistance > 0.7
+    return zone_code == ZONE_PARADISE
+
+
+@jit(nopython=True, inline='always', cache=True)
+def energy_source_multiplier(source_code, has_prey_nearby):
+    """Energy gain factor for a food source (mirrors SpeciesTraits.get_energy_source_multiplier)"""
+    if source_code == SOURCE_PHOTOSYNTHESIS:
+        return 1.0
+    elif source_code == SOURCE_PREDATION:
+        return 2.0 if has_prey_nearby else 0.1
+    return 1.5 if has_prey_nearby else 0.7
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def age_cells(alive_grid, species_id_grid, consumable_mask, energy, max_energy, age,
+              zone_grid, zone_decay_mult, zone_codes, pressure_grid,
+              max_lifespan, age_decline_start, energy_decay, complexity_cost,
+              photosynthesis_rate, metabolic_efficiency, starvation_threshold,
+              optimal_zone_bonus, colonial_affinity, heat_tolerance, toxin_resistance,
+              energy_source_code, dies, wrap=True):
+    """
+    Age every living cell and apply its energy decay/gain
+    
+    Neighbor-dependent terms (colony bonus, prey nearby) are read from the
+    state at the start of the pass, so cells dying here don't affect their
+    neighbors until the next generation.
+    
+    Args:
+        alive_grid, species_id_grid, consumable_mask: 2D per-position state
+        energy, age: 2D numpy int arrays, updated in place
+        max_energy: 2D numpy int array of per-cell energy caps
+        zone_grid: 2D numpy int array of zone indices per position
+        zone_decay_mult, zone_codes: 1D per-zone energy multiplier and type code
+        pressure_grid: 2D numpy float array of population pressure per position
+        max_lifespan ... energy_source_code: 1D trait columns indexed by species ID
+        dies: 2D numpy bool output mask, overwritten
+        wrap: Whether edges wrap around
+    
+    Returns:
+        dies, marking cells that died (old age or starvation)
+    """
+    height, width = alive_grid.shape
+    x_tbl = wrap_index_table(width, wrap)
+    y_tbl = wrap_index_table(height, wrap)
+    tiles_x = (width + TILE_SIZE - 1) // TILE_SIZE
+    tiles_y = (height + TILE_SIZE - 1) // TILE_SIZE
+    
+    for tile in prange(tiles_y * tiles_x):
+        y0 = (tile // tiles_x) * TILE_SIZE
+        x0 = (tile % tiles_x) * TILE_SIZE
+        for y in range(y0, min(y0 + TILE_SIZE, height)):
+            for x in range(x0, min(x0 + TILE_SIZE, width)):
+                dies[y, x] = False
+                if not alive_grid[y, x]:
+                    continue
+                sid = species_id_grid[y, x]
+                cell_age = age[y, x] + 1
+                age[y, x] = cell_age
+                
+                lifespan = max_lifespan[sid]
+                if lifespan > 0 and cell_age >= lifespan:
+                    dies[y, x] = True
+                    continue
+                
+                # Colony ratio and prey from the 8 neighbors
+                same = 0
+                total = 0
+                has_prey = False
+                for dy in range(-1, 2):
+                    for dx in range(-1, 2):
+                        if dx == 0 and dy == 0:
+                            continue
+                        nx = x_tbl[x + dx + 1]
+                        ny = y_tbl[y + dy + 1]
+                        if nx < 0 or ny < 0:
+                            continue
+                        if alive_grid[ny, nx]:
+                            total += 1
+                            if species_id_grid[ny, nx] == sid:
+                                same += 1
+                        if consumable_mask[ny, nx] and species_id_grid[ny, nx] != sid:
+                            has_prey = True
+                
+                source = energy_source_code[sid]
+                if source == SOURCE_PHOTOSYNTHESIS:
+                    has_prey = False
+                
+                zone = zone_grid[y, x]
+                zone_modifier = zone_decay_mult[zone]
+                if total > 0:
+                    zone_modifier *= 1.0 + ((same / total) * (colonial_affinity[sid] - 1.0))
+                
+                zone_code = zone_codes[zone]
+                heat = heat_tolerance[sid]
+                toxin = toxin_resistance[sid]
+                adaptation_mult = adaptation_bonus(zone_code, heat, toxin)
+                
+                aging_penalty = 1.0
+                if lifespan > 0:
+                    age_ratio = cell_age / lifespan
+                    decline_start = age_decline_start[sid]
+                    if age_ratio > decline_start:
+                        decline = (age_ratio - decline_start) / (1.0 - decline_start)
+                        aging_penalty = 1.0 + decline * 0.5
+                
+                decay = int(energy_decay[sid] * zone_modifier * complexity_cost[sid] *
+                            aging_penalty / adaptation_mult)
+                cell_energy = max(0, energy[y, x] - decay)
+                
+                in_optimal_zone = is_optimal_zone(zone_code, heat, toxin)
+                zone_bonus = optimal_zone_bonus[sid] if in_optimal_zone else 1.0
+                gain = int(photosynthesis_rate[sid] * zone_modifier * adaptation_mult *
+                           energy_source_multiplier(source, has_prey) * zone_bonus *
+                           pressure_grid[y, x] / metabolic_efficiency[sid])
+                cell_energy = min(max_energy[y, x], cell_energy + gain)
+                energy[y, x] = cell_energy
+                
+                if not in_optimal_zone and cell_energy < starvation_threshold[sid]:
+                    dies[y, x] = True
+                elif cell_energy <= 0:
+                    dies[y, x] = True
+    
+    return dies
+
+
+@jit(nopython=True, parallel=True, cache=True)
+def cell_colors(alive_grid, species_id_grid, energy, max_energy, palette, out):
+    """
+    Write each living cell's energy-dimmed color (Cell.get_color) into out
+    
+    Brightness runs from 40% at zero energy to 100% at max energy; empty
+    positions are black.
+    
+    Args:
+        alive_grid, species_id_grid: 2D per-position state
+        energy, max_energy: 2D numpy int arrays of per-cell energy
+        palette: 2D numpy float array (num_species x 3) of RGB indexed by species ID
+        out: 3D numpy uint8 array (height x width x 3), overwritten
+    """
+    height, width = alive_grid.shape
+    for y in prange(height):
         for x in range(width):
-            neighbors = neighbor_counts[y, x]
-            
-            if alive_grid[y, x]:
-                # Living cell death checks (under/overcrowding)
-                if neighbors < 2 or neighbors > 3:
-                    death_positions.append((x, y))
+            if not alive_grid[y, x]:
+                out[y, x, 0] = 0
+                out[y, x, 1] = 0
+                out[y, x, 2] = 0
+                continue
+            brightness = 0.4 + (0.6 * (energy[y, x] / max_energy[y, x]))
+            sid = species_id_grid[y, x]
+            for c in range(3):
+                out[y, x, c] = np.uint8(min(255.0, max(0.0, palette[sid, c] * brightness)))
+
+
+# Complexity levels of the movement strategies (see SpeciesTraits.get_movement_strategy);
+# any other level hunts
+COMPLEXITY_ENERGY_SEEKING = 1
+COMPLEXITY_FLEE = 2
+
+
+@jit(nopython=True, inline='always', cache=True)
+def pick_energy_spot(x, y, spot_x, spot_y, num_spots, zone_grid, zone_energy_mult,
+                     zone_decay_mult, roll):
+    """Index of the valid spot with the best zone energy score (Grid._move_energy_seeking)
+    
+    A spot must beat the current zone's energy_generation_mult; otherwise the
+    spot is chosen at random (floor(roll * num_spots)).
+    """
+    best_score = zone_energy_mult[zone_grid[y, x]]
+    best = -1
+    for i in range(num_spots):
+        zone = zone_grid[spot_y[i], spot_x[i]]
+        score = zone_energy_mult[zone] - zone_decay_mult[zone]
+        if score > best_score:
+            best_score = score
+            best = i
+    if best < 0:
+        best = min(int(roll * num_spots), num_spots - 1)
+    return best
+
+
+@jit(nopython=True, cache=True)
+def move_cells(alive_grid, occupied, species_id_grid, energy, max_energy, age, moved,
+               hunter_mask, consumable_mask, zone_grid, zone_energy_mult, zone_decay_mult,
+               zone_can_enter, pressure_grid, complexity, reproduction_threshold,
+               movement_cost, energy_source_code, entries, rolls, migration_pressure,
+               wrap, moves):
+    """
+    Decide and carry out one generation of movement (Grid.process_movement)
+    
+    Cells are visited in the order of `entries` and move one at a time, so
+    each decision sees the moves made before it. A mover may displace a
+    weaker occupant, which dies. Every per-position array travels with the
+    cell; `moved` is set for cells that moved.
+    
+    Args:
+        alive_grid ... consumable_mask: 2D per-position state, updated in place
+        occupied: 2D numpy bool array of positions holding a Cell object
+            (living or not yet cleared), updated in place
+        zone_grid: 2D numpy int array of zone indices per position
+        zone_energy_mult, zone_decay_mult, zone_can_enter: 1D per-zone properties
+        pressure_grid: 2D numpy float array of population pressure per position
+        complexity ... energy_source_code: 1D trait columns indexed by species ID
+        entries: 1D flat (y * width + x) indices of the cells that can move
+        rolls: (len(entries), 3) uniform [0, 1) draws per entry: migration,
+            behaviour (hunt/explore) and random spot choice
+        migration_pressure: Chance that a cell moves regardless of strategy
+        wrap: Whether edges wrap around
+        moves: (len(entries), 7) int64 output rows (src, dst, displaced,
+            displaced energy, max_energy, age, moved)
+    
+    Returns:
+        Number of rows written to `moves`
+    """
+    height, width = alive_grid.shape
+    x_tbl = wrap_index_table(width, wrap)
+    y_tbl = wrap_index_table(height, wrap)
+    spot_x = np.empty(24, dtype=np.int64)
+    spot_y = np.empty(24, dtype=np.int64)
+    other_x = np.empty(8, dtype=np.int64)
+    other_y = np.empty(8, dtype=np.int64)
+    num_moves = 0
+    
+    for i in range(entries.shape[0]):
+        src = entries[i]
+        y = src // width
+        x = src % width
+        # The cell was displaced by an earlier mover (its slot now holds the mover)
+        if not alive_grid[y, x] or moved[y, x]:
+            continue
+        
+        sid = species_id_grid[y, x]
+        cell_energy = energy[y, x]
+        threshold = reproduction_threshold[sid]
+        level = complexity[sid]
+        
+        hunts = level != COMPLEXITY_ENERGY_SEEKING and level != COMPLEXITY_FLEE
+        should_move = migration_pressure > 0 and rolls[i, 0] < migration_pressure
+        if not should_move:
+            if hunts:
+                # Hunters move unless fed with prey in reach (then 30% of the time)
+                has_prey = False
+                if energy_source_code[sid] != SOURCE_PHOTOSYNTHESIS:
+                    for dy in range(-1, 2):
+                        for dx in range(-1, 2):
+                            if dx == 0 and dy == 0:
+                                continue
+                            nx = x_tbl[x + dx + 1]
+                            ny = y_tbl[y + dy + 1]
+                            if nx < 0 or ny < 0:
+                                continue
+                            if consumable_mask[ny, nx] and species_id_grid[ny, nx] != sid:
+                                has_prey = True
+                if not has_prey or cell_energy < threshold * 1.2:
+                    should_move = True
+                elif rolls[i, 1] < 0.3:
+                    should_move = True
+            elif level == COMPLEXITY_FLEE:
+                # Flee from hunters; also leave poor zones when low on energy
+                predators = False
+                for dy in range(-1, 2):
+                    for dx in range(-1, 2):
+                        if dx == 0 and dy == 0:
+                            continue
+                        nx = x_tbl[x + dx + 1]
+                        ny = y_tbl[y + dy + 1]
+                        if nx >= 0 and ny >= 0 and hunter_mask[ny, nx]:
+                            predators = True
+                if predators:
+                    should_move = True
+                elif cell_energy < threshold * 0.7:
+                    if zone_energy_mult[zone_grid[y, x]] < 1.0:
+                        should_move = True
             else:
-                # Empty cell birth checks (2-4 neighbors for relaxed Conway)
-                if 2 <= neighbors <= 4:
-                    birth_positions.append((x, y))
+                # Photosynthesizers leave crowded or poor zones and explore when well fed
+                if pressure_grid[y, x] < 0.8:
+                    should_move = True
+                elif zone_energy_mult[zone_grid[y, x]] < 1.0:
+                    should_move = True
+                elif cell_energy > threshold * 1.2:
+                    if rolls[i, 1] < 0.35:
+                        should_move = True
+                elif cell_energy < threshold * 0.85:
+                    should_move = True
+        
+        if not should_move:
+            continue
+        
+        # Desperate or well-fed cells look two cells out
+        radius = 1
+        if cell_energy < threshold * 0.5 or cell_energy > threshold * 1.5:
+            radius = 2
+        
+        # Valid spots in Grid.get_neighbors order: enterable, and empty or held by
+        # a living cell with less than 1/1.1 of our energy
+        num_spots = 0
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                if dx == 0 and dy == 0:
+                    continue
+                nx = x + dx
+                ny = y + dy
+                if wrap:
+                    nx = nx % width
+                    ny = ny % height
+                elif not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                if not zone_can_enter[zone_grid[ny, nx]]:
+                    continue
+                if not occupied[ny, nx] or (alive_grid[ny, nx] and cell_energy > energy[ny, nx] * 1.1):
+                    spot_x[num_spots] = nx
+                    spot_y[num_spots] = ny
+                    num_spots += 1
+        
+        if num_spots == 0:
+            continue
+        
+        # Hunters close in on prey, fleers get away from hunters; both fall
+        # back to seeking energy when nobody is around
+        num_others = 0
+        if level != COMPLEXITY_ENERGY_SEEKING:
+            for dy in range(-1, 2):
+                for dx in range(-1, 2):
+                    if dx == 0 and dy == 0:
+                        continue
+                    nx = x_tbl[x + dx + 1]
+                    ny = y_tbl[y + dy + 1]
+                    if nx < 0 or ny < 0:
+                        continue
+                    if hunts:
+                        found = consumable_mask[ny, nx] and not hunter_mask[ny, nx]
+                    else:
+                        found = hunter_mask[ny, nx]
+                    if found:
+                        other_x[num_others] = nx
+                        other_y[num_others] = ny
+                        num_others += 1
+        
+        if num_others == 0:
+            best = pick_energy_spot(x, y, spot_x, spot_y, num_spots, zone_grid,
+                                    zone_energy_mult, zone_decay_mult, rolls[i, 2])
+        else:
+            # Manhattan distance to the nearest hunter/prey; first best spot wins
+            best = 0
+            best_distance = -1
+            for s in range(num_spots):
+                distance = 1 << 30
+                for k in range(num_others):
+                    d = abs(spot_x[s] - other_x[k]) + abs(spot_y[s] - other_y[k])
+                    if d < distance:
+                        distance = d
+                if best_distance < 0 or (distance < best_distance if hunts
+                                         else distance > best_distance):
+                    best_distance = distance
+                    best = s
+        
+        tx = spot_x[best]
+        ty = spot_y[best]
+        row = moves[num_moves]
+        row[0] = src
+        row[1] = ty * width + tx
+        row[2] = 0
+        if occupied[ty, tx]:
+            # Displace the weaker organism (it dies)
+            row[2] = 1
+            row[3] = energy[ty, tx]
+            row[4] = max_energy[ty, tx]
+            row[5] = age[ty, tx]
+            row[6] = moved[ty, tx]
+        num_moves += 1
+        
+        # Carry the cell's state to its new position and pay for the move
+        alive_grid[ty, tx] = True
+        energy[ty, tx] = cell_energy - movement_cost[sid]
+        max_energy[ty, tx] = max_energy[y, x]
+        age[ty, tx] = age[y, x]
+        moved[ty, tx] = True
+        species_id_grid[ty, tx] = sid
+        hunter_mask[ty, tx] = hunter_mask[y, x]
+        consumable_mask[ty, tx] = consumable_mask[y, x]
+        occupied[ty, tx] = True
+        alive_grid[y, x] = False
+        energy[y, x] = 0
+        max_energy[y, x] = 0
+        age[y, x] = 0
+        species_id_grid[y, x] = 0
+        hunter_mask[y, x] = False
+        consumable_mask[y, x] = False
+        occupied[y, x] = False
     
-    return birth_positions, death_positions
+    return num_moves
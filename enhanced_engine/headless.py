@@ -0,0 +1,165 @@
+"""
+Headless batch runs for Primordial Garden
+Runs seeded simulations without pygame, optionally many in parallel processes
+
+Run with: python -m enhanced_engine.headless --config <file> --runs 8 --workers 4
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import multiprocessing
+import random
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .grid import Grid
+from .species_enhanced import Species, SpeciesTraits
+
+
+def species_from_config(config_data: List[Dict]) -> List[Tuple[Species, int]]:
+    """Build (species, population) pairs from saved species config entries
+
+    Accepts the last_species_config.json format, upgrading old (v0.8.0)
+    trait sets to the current fields.
+    """
+    species_list = []
+    for config in config_data:
+        trait_data = config["traits"].copy()
+
+        # Remove old v0.8.0 parameters if present
+        trait_data.pop('can_move', None)
+        trait_data.pop('movement_strategy', None)
+        trait_data.pop('is_predator', None)
+        trait_data.pop('movement_cost', None)  # Now auto-calculated
+
+        # Add new v0.9.0 parameters with defaults if missing
+        trait_data.setdefault('colonial_affinity', 1.2)
+        trait_data.setdefault('cluster_reproduction_bonus', 1.3)
+        trait_data.setdefault('hunting_efficiency', 0.5)
+
+        traits = SpeciesTraits(**trait_data)
+        species = Species(name=config["name"], traits=traits)
+        species_list.append((species, config["population"]))
+    return species_list
+
+
+def build_grid(grid_config: Dict, species_config: List[Dict], seed: Optional[int] = None) -> Grid:
+    """Create, zone and seed a Grid from a grid config and species config entries
+
+    Args:
+        grid_config: {'width', 'height', 'zones', 'shift_interval' (None = no shifting)}
+        species_config: Species config entries (see species_from_config); each may
+            name a 'placement' (random/center/edge, default random)
+        seed: Seed for every random source the simulation uses (None = unseeded)
+    """
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+
+    grid = Grid(grid_config['width'], grid_config['height'], wrap=True, seed=seed)
+    grid.setup_zones(grid_config.get('zones', 'random'))
+    if grid_config.get('shift_interval'):
+        grid.zone_manager.enable_shifting(grid_config['shift_interval'])
+
+    for (species, population), config in zip(species_from_config(species_config), species_config):
+        grid.seed_species(species, population, config.get('placement', 'random'))
+    return grid
+
+
+def run_headless(grid_config: Dict, species_config: List[Dict], seed: int,
+                 out_path: str, max_gens: int) -> str:
+    """Run one seeded simulation to max_gens and write its stats CSV
+
+    Args:
+        grid_config: See build_grid
+        species_config: See build_grid
+        seed: Seed for every random source the simulation uses
+        out_path: CSV path; one row every 10 generations, as in interactive exports
+        max_gens: Generations to run
+
+    Returns:
+        out_path
+    """
+    # The engine reports progress with print(); keep batch output quiet
+    with contextlib.redirect_stdout(io.StringIO()):
+        grid = build_grid(grid_config, species_config, seed)
+
+        Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, 'w', newline='') as f:
+            writer = None
+            for _ in range(max_gens):
+                grid.step()
+                if grid.generation % 10 == 0:
+                    stats = grid.get_stats()
+                    # Species repr carries the process-wide id counter; the name
+                    # keeps same-seed runs byte-identical in any worker
+                    dominant = stats['dominant_species']
+                    stats['dominant_species'] = dominant.name if dominant is not None else None
+                    if writer is None:
+                        writer = csv.DictWriter(f, fieldnames=stats.keys())
+                        writer.writeheader()
+                    writer.writerow(stats)
+
+    return out_path
+
+
+def run_sweep(grid_config: Dict, species_config: List[Dict], runs: int, workers: int,
+              seed: int = 0, max_gens: int = 1000, out_dir: str = "exports") -> List[str]:
+    """Run `runs` independent simulations (seeds seed..seed+runs-1) on `workers` processes
+
+    Each run writes out_dir/run_<i>.csv. Returns the CSV paths in run order.
+    """
+    jobs = [(grid_config, species_config, seed + i, str(Path(out_dir) / f"run_{i}.csv"), max_gens)
+            for i in range(runs)]
+    with multiprocessing.get_context("spawn").Pool(workers) as pool:
+        return pool.starmap(run_headless, jobs)
+
+
+def add_grid_arguments(parser: argparse.ArgumentParser):
+    """Add the grid/seed options shared by the headless and interactive CLIs"""
+    parser.add_argument("--seed", type=int, default=0, help="random seed (of the first run)")
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--height", type=int, default=150)
+    parser.add_argument("--zones", default="random", choices=["neutral", "random", "quadrant", "ring"])
+    parser.add_argument("--shift-interval", type=int, default=None,
+                        help="enable zone shifting every N generations")
+
+
+def grid_config_from_args(args: argparse.Namespace) -> Dict:
+    """Grid config (see build_grid) from options added by add_grid_arguments"""
+    return {
+        'width': args.width,
+        'height': args.height,
+        'zones': args.zones,
+        'shift_interval': args.shift_interval,
+    }
+
+
+def main(argv=None):
+    """Headless command-line entry point (see --help); needs no pygame"""
+    parser = argparse.ArgumentParser(description="Primordial Garden headless batch runs")
+    parser.add_argument("--config", default="last_species_config.json",
+                        help="species config (as saved by the species designer, see "
+                             "config/species_presets.json)")
+    parser.add_argument("--runs", type=int, default=1, help="number of runs (seeds seed..seed+runs-1)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--gens", type=int, default=1000, help="generations per run")
+    parser.add_argument("--out-dir", default="exports")
+    add_grid_arguments(parser)
+    args = parser.parse_args(argv)
+
+    with open(args.config, 'r') as f:
+        species_config = json.load(f)
+
+    paths = run_sweep(grid_config_from_args(args), species_config, args.runs, args.workers,
+                      seed=args.seed, max_gens=args.gens, out_dir=args.out_dir)
+    for path in paths:
+        print(f"✓ Saved data to {path}")
+
+
+if __name__ == "__main__":
+    main()
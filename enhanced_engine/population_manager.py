@@ -9,10 +9,13 @@ from typing import Dict, List, Tuple
 class PopulationManager:
     """Manages large populations with performance optimization"""
     
-    def __init__(self, max_cells_per_species=200, total_cell_limit=5000):
+    def __init__(self, max_cells_per_species=200, total_cell_limit=5000,
+                 rng: np.random.Generator = None):
         self.max_cells_per_species = max_cells_per_species
         self.total_cell_limit = total_cell_limit
         self.cull_stats = {'total_culled': 0, 'by_species': {}}
+        # Shared by scoring and diversity sampling; pass Grid._rng for seeded runs
+        self._rng = rng if rng is not None else np.random.default_rng()
         
     def should_cull_population(self, total_population: int, species_count: int) -> bool:
         """Determine if population needs culling"""
@@ -78,35 +81,37 @@ class PopulationManager:
                     culled_cells[pos] = cell
                 total_kept += len(cells)
             else:
-                # Score each organism
-                scored_cells = []
-                for pos, cell in cells:
-                    score = self._calculate_fitness_score(cell, generation, species_registry)
-                    scored_cells.append((score, pos, cell))
-                
-                # Keep top performers + random sampling for diversity
-                scored_cells.sort(reverse=True, key=lambda x: x[0])
+                # Score each organism (vectorized across the species group)
+                scores = self._calculate_fitness_scores(cells, generation, species_id, species_registry)
                 
                 # Keep top 70% based on score, 30% random for diversity
                 elite_count = int(base_per_species * 0.7)
                 random_count = base_per_species - elite_count
                 
-                # Elite organisms
-                for i in range(min(elite_count, len(scored_cells))):
-                    _, pos, cell = scored_cells[i]
+                # Elite organisms (partial sort, order within the elite is irrelevant)
+                if elite_count < len(cells):
+                    order = np.argpartition(-scores, elite_count)
+                    elite_idx = order[:elite_count]
+                    remaining = order[elite_count:]
+                else:
+                    elite_idx = np.arange(len(cells))
+                    remaining = elite_idx[:0]
+                
+                for i in elite_idx.tolist():
+                    pos, cell = cells[i]
                     culled_cells[pos] = cell
-                    total_kept += 1
+                total_kept += len(elite_idx)
                 
                 # Random sampling from the rest for genetic diversity
-                remaining = scored_cells[elite_count:]
-                if remaining and random_count > 0:
-                    import random
-                    random_sample = random.sample(remaining, min(random_count, len(remaining)))
-                    for _, pos, cell in random_sample:
+                if len(remaining) and random_count > 0:
+                    picks = self._rng.choice(len(remaining), size=min(random_count, len(remaining)), replace=False)
+                    random_sample = remaining[picks]
+                    for i in random_sample.tolist():
+                        pos, cell = cells[i]
                         culled_cells[pos] = cell
-                        total_kept += 1
+                    total_kept += len(random_sample)
                 
-                removed = len(cells) - (min(elite_count, len(scored_cells)) + min(random_count, len(remaining)))
+                removed = len(cells) - (len(elite_idx) + min(random_count, len(remaining)))
                 total_removed += removed
                 
                 if species_id not in self.cull_stats['by_species']:
@@ -123,7 +128,6 @@ class PopulationManager:
             return culled_cells
         else:
             # Convert back to 2D array
-            import numpy as np
             height = max(pos[1] for pos in culled_cells.keys()) + 1
             width = max(pos[0] for pos in culled_cells.keys()) + 1
             new_grid = [[None for _ in range(width)] for _ in range(height)]
@@ -131,55 +135,54 @@ class PopulationManager:
                 new_grid[y][x] = cell
             return new_grid
     
-    def _calculate_fitness_score(self, cell, generation: int, species_registry=None) -> float:
+    def _calculate_fitness_scores(self, cells, generation: int, species_id: int,
+                                  species_registry=None) -> np.ndarray:
         """
-        Calculate fitness score for organism selection
+        Calculate fitness scores for one species group in a single pass
         Higher score = more likely to survive culling
         
         Args:
-            cell: Cell object
+            cells: List of (pos, cell) tuples sharing species_id
             generation: Current generation
+            species_id: Species of every cell in the group
             species_registry: Optional dict of {species_id: Species}
+        
+        Returns:
+            float32 array of scores aligned with cells
         """
-        score = 0.0
+        n = len(cells)
+        energy = np.fromiter((cell.energy for _, cell in cells), dtype=np.float32, count=n)
+        age = np.fromiter(
+            (cell.age if hasattr(cell, 'age') else (generation - getattr(cell, 'birth_generation', 0))
+             for _, cell in cells),
+            dtype=np.float32, count=n
+        )
         
-        # Get species data if available
-        species = None
-        if species_registry:
-            species = species_registry.get(cell.species_id)
+        # Get species data if available (constant across the group)
+        species = species_registry.get(species_id) if species_registry else None
         
         # Energy level (0-100 points)
         if species:
-            energy_ratio = cell.energy / (species.traits.base_energy * 2)
+            scores = np.minimum(100, energy * (25.0 / species.traits.base_energy))
         else:
-            energy_ratio = cell.energy / 100  # Fallback
-        score += min(100, energy_ratio * 50)
-        
-        # Complexity (0-50 points)
-        if species:
-            complexity = species.traits.complexity
-            score += min(50, complexity * 10)
+            scores = np.minimum(100, energy * 0.5)  # Fallback
         
         # Age bonus (younger = fresher genes, 0-30 points)
-        age = cell.age if hasattr(cell, 'age') else (generation - getattr(cell, 'birth_generation', 0))
-        age_score = max(0, 30 - (age * 0.5))
-        score += age_score
+        scores += np.maximum(0, 30 - age * 0.5)
         
-        # Metabolic efficiency (0-40 points)
         if species:
-            efficiency = species.traits.metabolic_efficiency
-            score += efficiency * 40
-        
-        # Predator bonus (more complex ecosystem role, +20 points)
-        if species and hasattr(species, 'can_hunt'):
-            if species.can_hunt():
-                score += 20
+            traits = species.traits
+            # Complexity (0-50 points) + metabolic efficiency (0-40 points)
+            species_bonus = min(50, traits.complexity * 10) + traits.metabolic_efficiency * 40
+            # Predator bonus (more complex ecosystem role, +20 points)
+            if hasattr(species, 'can_hunt') and species.can_hunt():
+                species_bonus += 20
+            scores += species_bonus
         
         # Random factor for diversity (0-10 points)
-        import random
-        score += random.random() * 10
+        scores += self._rng.random(n, dtype=np.float32) * 10
         
-        return score
+        return scores
     
     def get_population_stats(self, grid_cells) -> Dict:
         """Get current population statistics (handles dict or 2D array)"""
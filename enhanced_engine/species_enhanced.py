@@ -2,13 +2,49 @@
 Species system for Primordial Garden 2.0
 Each species has genetic traits that affect survival, energy, and behavior
 """
-from dataclasses import dataclass
+from collections import Counter, deque, namedtuple
+from dataclasses import dataclass, field, fields
+import itertools
+from enum import IntEnum
+from operator import attrgetter
 from typing import Tuple
-import random
+import numpy as np
 from .colorization import SpeciesColorizer
+from .zones import zone_type_code
 
 
-@dataclass
+# Valid ranges enforced by SpeciesTraits.__post_init__: field -> (low, high)
+_TRAIT_BOUNDS = {
+    'base_energy': (1, 200),
+    'energy_decay': (1, 10),
+    'photosynthesis_rate': (0, 20),
+    'complexity': (1, 5),
+    'max_lifespan': (0, 1000),
+    'mutation_rate': (0.0, 1.0),
+    'metabolic_efficiency': (0.5, 2.0),
+    'heat_tolerance': (0.0, 1.0),
+    'cold_tolerance': (0.0, 1.0),
+    'toxin_resistance': (0.0, 1.0),
+    'colonial_affinity': (1.0, 1.5),
+    'cluster_reproduction_bonus': (1.0, 2.0),
+}
+_CLAMPED_FIELDS = tuple(_TRAIT_BOUNDS)
+_CLAMP_LO, _CLAMP_HI = np.array(list(_TRAIT_BOUNDS.values()), dtype=np.float64).T
+_get_clamped_traits = attrgetter(*_CLAMPED_FIELDS)
+
+
+class EnergySource(IntEnum):
+    """Integer codes for SpeciesTraits.energy_source"""
+    PHOTOSYNTHESIS = 0
+    PREDATION = 1
+    HYBRID = 2
+
+
+# energy_source string -> EnergySource; any other value behaves as hybrid
+_ENERGY_SOURCE_CODES = {source.name.lower(): source for source in EnergySource}
+
+
+@dataclass(slots=True)
 class SpeciesTraits:
     """Genetic traits that define a species' behavior and efficiency"""
     
@@ -25,6 +61,7 @@ class SpeciesTraits:
     
     # Predation traits (unlocked at complexity 3+, efficiency scales with complexity)
     hunting_efficiency: float = 0.5  # Energy transfer rate when consuming (increases with complexity)
+    effective_hunting_efficiency: float = field(init=False, default=0.0)  # get_hunting_efficiency(), set once
     can_be_consumed: bool = True  # Can be eaten by predators
     
     # Colony clustering traits (same-species cells benefit from adjacency)
@@ -42,6 +79,7 @@ class SpeciesTraits:
     
     # Organism complexity (affects energy needs)
     complexity: int = 1  # 1=simple, 2=moderate, 3=complex
+    complexity_cost: float = field(init=False, default=1.0)  # get_complexity_cost(), set once
     metabolic_efficiency: float = 1.0  # Energy usage multiplier
     
     # Environmental adaptation
@@ -55,30 +93,32 @@ class SpeciesTraits:
     
     # Food/Energy source type
     energy_source: str = "photosynthesis"  # "photosynthesis", "predation", "hybrid"
+    energy_source_code: int = field(init=False, default=EnergySource.PHOTOSYNTHESIS)  # EnergySource
     starvation_threshold: int = 10  # Die if energy below this outside optimal zone
     optimal_zone_bonus: float = 2.0  # Energy multiplier in ideal environment
     
     # Habitat specialization (Phase 3)
     native_zone_type: str = "fertile"  # Zone where this lineage evolved
     native_zone_affinity: float = 1.5  # Reproduction bonus in native zone (1.0-2.0x)
+    native_zone_type_code: int = field(init=False, default=-1)  # zone_type_code(native_zone_type)
     
     # Visual
     color: Tuple[int, int, int] = (0, 255, 0)  # RGB color
     
     def __post_init__(self):
         """Validate traits are within reasonable bounds"""
-        self.base_energy = max(1, min(200, self.base_energy))
-        self.energy_decay = max(1, min(10, self.energy_decay))
-        self.photosynthesis_rate = max(0, min(20, self.photosynthesis_rate))
-        self.mutation_rate = max(0.0, min(1.0, self.mutation_rate))
-        self.complexity = max(1, min(5, self.complexity))
-        self.metabolic_efficiency = max(0.5, min(2.0, self.metabolic_efficiency))
-        self.heat_tolerance = max(0.0, min(1.0, self.heat_tolerance))
-        self.cold_tolerance = max(0.0, min(1.0, self.cold_tolerance))
-        self.toxin_resistance = max(0.0, min(1.0, self.toxin_resistance))
-        self.max_lifespan = max(0, min(1000, self.max_lifespan))
-        self.colonial_affinity = max(1.0, min(1.5, self.colonial_affinity))
-        self.cluster_reproduction_bonus = max(1.0, min(2.0, self.cluster_reproduction_bonus))
+        # One vectorized range check (bounds in _TRAIT_BOUNDS); only out-of-range
+        # traits are replaced, by their bound, so in-range values keep their type
+        values = np.array(_get_clamped_traits(self), dtype=np.float64)
+        for i in np.flatnonzero((values < _CLAMP_LO) | (values > _CLAMP_HI)).tolist():
+            name = _CLAMPED_FIELDS[i]
+            lo, hi = _TRAIT_BOUNDS[name]
+            setattr(self, name, lo if values[i] < lo else hi)
+        self.native_zone_type_code = zone_type_code(self.native_zone_type)
+        self.energy_source_code = _ENERGY_SOURCE_CODES.get(self.energy_source, EnergySource.HYBRID)
+        # Colors from JSON configs arrive as lists; draw code relies on an RGB int tuple
+        r, g, b = np.clip(np.array(self.color, dtype=np.int64), 0, 255).tolist()
+        self.color = (r, g, b)
         
         # Movement cost scales with complexity but stays low
         # Complexity 1: 1 energy (drift/float)
@@ -86,10 +126,18 @@ class SpeciesTraits:
         # Complexity 3: 2 energy (hunting movement)
         # Complexity 4+: 3 energy (complex movement)
         self.movement_cost = max(1, 1 + (self.complexity // 2))
+        
+        # Complexity-only derived values, computed once instead of per call
+        self.complexity_cost = 1.0 + (self.complexity - 1) * 0.3
+        if self.complexity >= 3:
+            # Complexity 3: 50%, 4: 65%, 5: 80%
+            self.effective_hunting_efficiency = min(0.8, 0.35 + (self.complexity * 0.15))
+        else:
+            self.effective_hunting_efficiency = 0.0
     
     def get_complexity_cost(self) -> float:
         """Higher complexity organisms need more energy"""
-        return 1.0 + (self.complexity - 1) * 0.3
+        return self.complexity_cost
     
     def get_adaptation_bonus(self, zone_type: str) -> float:
         """Get energy bonus/penalty based on adaptation to zone"""
@@ -117,9 +165,9 @@ class SpeciesTraits:
     
     def get_energy_source_multiplier(self, has_prey_nearby: bool) -> float:
         """Calculate energy gain based on food source availability"""
-        if self.energy_source == "photosynthesis":
+        if self.energy_source_code == EnergySource.PHOTOSYNTHESIS:
             return 1.0  # Always gets photosynthesis
-        elif self.energy_source == "predation":
+        elif self.energy_source_code == EnergySource.PREDATION:
             return 2.0 if has_prey_nearby else 0.1  # Needs prey or starves
         else:  # hybrid
             return 1.5 if has_prey_nearby else 0.7  # Flexible
@@ -142,20 +190,88 @@ class SpeciesTraits:
     
     def get_hunting_efficiency(self) -> float:
         """Get hunting efficiency based on complexity"""
-        if not self.can_hunt():
-            return 0.0
-        # Complexity 3: 50%, 4: 65%, 5: 80%
-        return min(0.8, 0.35 + (self.complexity * 0.15))
+        return self.effective_hunting_efficiency
+
+
+# Default generator for Species.mutate (PCG64)
+_rng = np.random.default_rng()
+
+# Mutated trait fields and their max per-generation deltas
+_MUTATE_INT_FIELDS, _MUTATE_INT_DELTAS = zip(
+    ('complexity', 1), ('base_energy', 5), ('energy_decay', 1), ('energy_from_birth', 5),
+    ('photosynthesis_rate', 1), ('movement_range', 1), ('overcrowding_tolerance', 1),
+    ('isolation_tolerance', 1), ('reproduction_threshold', 5), ('max_lifespan', 20),
+    ('starvation_threshold', 3),
+)
+_MUTATE_FLOAT_FIELDS, _MUTATE_FLOAT_DELTAS = zip(
+    ('hunting_efficiency', 0.1), ('colonial_affinity', 0.05), ('cluster_reproduction_bonus', 0.1),
+    ('mutation_rate', 0.005), ('metabolic_efficiency', 0.1), ('heat_tolerance', 0.1),
+    ('cold_tolerance', 0.1), ('toxin_resistance', 0.1), ('age_decline_start', 0.05),
+    ('optimal_zone_bonus', 0.2), ('native_zone_affinity', 0.1),
+)
+_MUTATE_INT_DELTAS = np.array(_MUTATE_INT_DELTAS, dtype=np.int64)
+_MUTATE_FLOAT_DELTAS = np.array(_MUTATE_FLOAT_DELTAS, dtype=np.float64)
+_get_int_traits = attrgetter(*_MUTATE_INT_FIELDS)
+_get_float_traits = attrgetter(*_MUTATE_FLOAT_FIELDS)
+
+# C-level key functions for registry stats
+_get_population = attrgetter('population')
+_get_generation_born = attrgetter('generation_born')
+
+# Energy source -> the sources it can switch to
+_ENERGY_SOURCE_ALTERNATIVES = {
+    "photosynthesis": ("predation", "hybrid"),
+    "predation": ("photosynthesis", "hybrid"),
+    "hybrid": ("photosynthesis", "predation"),
+}
+
+# Native zone types and the ones a lineage most easily adapts to from each
+_NATIVE_ZONES = ("fertile", "desert", "toxic", "paradise", "neutral")
+_NATIVE_ZONE_ADJACENT = {
+    "fertile": ("paradise", "neutral"),
+    "desert": ("neutral", "toxic"),
+    "toxic": ("desert", "neutral"),
+    "paradise": ("fertile", "neutral"),
+    "neutral": ("fertile", "desert", "toxic", "paradise"),
+}
+
+
+def _mutate_color(color: Tuple[int, int, int], rng: np.random.Generator) -> Tuple[int, int, int]:
+    """Slightly mutate RGB color"""
+    r, g, b = np.clip(np.array(color, dtype=np.int16) + rng.integers(-30, 31, 3), 0, 255).tolist()
+    return (r, g, b)
+
+
+def _mutate_energy_source(current: str, roll: float, rng: np.random.Generator) -> str:
+    """Mutate energy source type (rare)"""
+    if roll < 0.05:  # 5% chance to change
+        options = _ENERGY_SOURCE_ALTERNATIVES[current]
+        return options[rng.integers(len(options))]
+    return current
+
+
+def _mutate_native_zone(current: str, roll: float, rng: np.random.Generator) -> str:
+    """Mutate native zone type (very rare - long-term adaptation)"""
+    if roll < 0.02:  # 2% chance to adapt to new zone
+        # More likely to move to adjacent zone than random
+        if rng.random() < 0.7:  # 70% chance for adjacent zone
+            choices = _NATIVE_ZONE_ADJACENT.get(current, _NATIVE_ZONES)
+        else:
+            choices = _NATIVE_ZONES
+        return choices[rng.integers(len(choices))]
+    return current
 
 
 class Species:
     """Represents a distinct species with unique traits and genome"""
     
-    _next_id = 1
+    __slots__ = ('id', 'name', 'traits', 'parent_id',
+                 'population', 'total_births', 'total_deaths', 'generation_born')
+    
+    _id_gen = itertools.count(1)  # next() is a single atomic C call
     
     def __init__(self, name: str = None, traits: SpeciesTraits = None, parent_id: int = None):
-        self.id = Species._next_id
-        Species._next_id += 1
+        self.id = next(Species._id_gen)
         
         self.name = name or f"Species_{self.id}"
         self.traits = traits or SpeciesTraits()
@@ -170,44 +286,38 @@ class Species:
         self.total_births = 0
         self.total_deaths = 0
         self.generation_born = 0
+    
+    def mutate(self, generation: int, rng: np.random.Generator = None) -> 'Species':
+        """Create a mutated offspring species
+        
+        All random deltas come from a few vectorized draws on rng
+        (defaults to the module generator).
+        """
+        rng = rng if rng is not None else _rng
+        traits = self.traits
+        
+        # Integer traits: value + randint(-max_delta, max_delta), at least 1
+        int_values = np.array(_get_int_traits(traits), dtype=np.int64)
+        int_values += rng.integers(-_MUTATE_INT_DELTAS, _MUTATE_INT_DELTAS + 1)
+        np.maximum(int_values, 1, out=int_values)
         
-    def mutate(self, generation: int) -> 'Species':
-        """Create a mutated offspring species"""
-        # First, calculate the mutated complexity (needed for strategy selection)
-        new_complexity = self._mutate_value(self.traits.complexity, 1)
+        # Float traits: value + uniform(-max_delta, max_delta), clamped to [0, 1]
+        float_values = np.array(_get_float_traits(traits), dtype=np.float64)
+        float_values += rng.uniform(-1.0, 1.0, len(_MUTATE_FLOAT_DELTAS)) * _MUTATE_FLOAT_DELTAS
+        np.clip(float_values, 0.0, 1.0, out=float_values)
         
-        # Create traits object with mutated complexity to check available strategies
-        temp_traits = SpeciesTraits(complexity=new_complexity)
+        # Rare discrete switches share one draw
+        sex_roll, source_roll, zone_roll = rng.random(3)
         
         new_traits = SpeciesTraits(
-            base_energy=self._mutate_value(self.traits.base_energy, 5),
-            energy_decay=self._mutate_value(self.traits.energy_decay, 1),
-            energy_from_birth=self._mutate_value(self.traits.energy_from_birth, 5),
-            photosynthesis_rate=self._mutate_value(self.traits.photosynthesis_rate, 1),
-            movement_range=self._mutate_value(self.traits.movement_range, 1),
+            **dict(zip(_MUTATE_INT_FIELDS, int_values.tolist())),
+            **dict(zip(_MUTATE_FLOAT_FIELDS, float_values.tolist())),
             # movement_cost auto-calculated from complexity in __post_init__
-            hunting_efficiency=self._mutate_value(self.traits.hunting_efficiency, 0.1, is_float=True),
-            can_be_consumed=self.traits.can_be_consumed,
-            colonial_affinity=self._mutate_value(self.traits.colonial_affinity, 0.05, is_float=True),
-            cluster_reproduction_bonus=self._mutate_value(self.traits.cluster_reproduction_bonus, 0.1, is_float=True),
-            overcrowding_tolerance=self._mutate_value(self.traits.overcrowding_tolerance, 1),
-            isolation_tolerance=self._mutate_value(self.traits.isolation_tolerance, 1),
-            reproduction_threshold=self._mutate_value(self.traits.reproduction_threshold, 5),
-            mutation_rate=self._mutate_value(self.traits.mutation_rate, 0.005, is_float=True),
-            sexual_reproduction=self.traits.sexual_reproduction if random.random() > 0.02 else not self.traits.sexual_reproduction,
-            complexity=new_complexity,  # Use pre-calculated complexity
-            metabolic_efficiency=self._mutate_value(self.traits.metabolic_efficiency, 0.1, is_float=True),
-            heat_tolerance=self._mutate_value(self.traits.heat_tolerance, 0.1, is_float=True),
-            cold_tolerance=self._mutate_value(self.traits.cold_tolerance, 0.1, is_float=True),
-            toxin_resistance=self._mutate_value(self.traits.toxin_resistance, 0.1, is_float=True),
-            max_lifespan=self._mutate_value(self.traits.max_lifespan, 20),
-            age_decline_start=self._mutate_value(self.traits.age_decline_start, 0.05, is_float=True),
-            energy_source=self._mutate_energy_source(self.traits.energy_source),
-            starvation_threshold=self._mutate_value(self.traits.starvation_threshold, 3),
-            optimal_zone_bonus=self._mutate_value(self.traits.optimal_zone_bonus, 0.2, is_float=True),
-            native_zone_type=self._mutate_native_zone(self.traits.native_zone_type),
-            native_zone_affinity=self._mutate_value(self.traits.native_zone_affinity, 0.1, is_float=True),
-            color=self._mutate_color(self.traits.color)
+            can_be_consumed=traits.can_be_consumed,
+            sexual_reproduction=traits.sexual_reproduction if sex_roll > 0.02 else not traits.sexual_reproduction,
+            energy_source=_mutate_energy_source(traits.energy_source, source_roll, rng),
+            native_zone_type=_mutate_native_zone(traits.native_zone_type, zone_roll, rng),
+            color=_mutate_color(traits.color, rng)
         )
         
         mutant = Species(
@@ -222,79 +332,97 @@ class Species:
         
         return mutant
     
-    @staticmethod
-    def _mutate_value(value, max_delta, is_float=False):
-        """Apply random mutation to a value"""
-        if is_float:
-            delta = random.uniform(-max_delta, max_delta)
-            return max(0.0, min(1.0, value + delta))
-        else:
-            delta = random.randint(-max_delta, max_delta)
-            return max(1, value + delta)
-    
-    @staticmethod
-    def _mutate_color(color: Tuple[int, int, int]) -> Tuple[int, int, int]:
-        """Slightly mutate RGB color"""
-        r, g, b = color
-        return (
-            max(0, min(255, r + random.randint(-30, 30))),
-            max(0, min(255, g + random.randint(-30, 30))),
-            max(0, min(255, b + random.randint(-30, 30)))
-        )
-    
-    @staticmethod
-    def _mutate_energy_source(current: str) -> str:
-        """Mutate energy source type (rare)"""
-        if random.random() < 0.05:  # 5% chance to change
-            options = ["photosynthesis", "predation", "hybrid"]
-            options.remove(current)
-            return random.choice(options)
-        return current
-    
-    @staticmethod
-    def _mutate_native_zone(current: str) -> str:
-        """Mutate native zone type (very rare - long-term adaptation)"""
-        if random.random() < 0.02:  # 2% chance to adapt to new zone
-            zones = ["fertile", "desert", "toxic", "paradise", "neutral"]
-            # More likely to move to adjacent zone than random
-            if random.random() < 0.7:  # 70% chance for adjacent zone
-                adjacent = {
-                    "fertile": ["paradise", "neutral"],
-                    "desert": ["neutral", "toxic"],
-                    "toxic": ["desert", "neutral"],
-                    "paradise": ["fertile", "neutral"],
-                    "neutral": ["fertile", "desert", "toxic", "paradise"]
-                }
-                return random.choice(adjacent.get(current, zones))
-            else:
-                return random.choice(zones)
-        return current
-    
     def __repr__(self):
         return f"Species({self.name}, pop={self.population}, id={self.id})"
 
 
+# SpeciesTraits field type -> TraitsTable column dtype (float64 so gathered
+# values match the scalar trait math exactly)
+_COLUMN_DTYPES = {int: np.int32, float: np.float64, bool: np.bool_}
+
+
+class TraitsTable:
+    """Hot species traits as NumPy columns indexed by species ID
+    
+    Lets per-cell code gather traits for many cells at once, e.g.
+    table['reproduction_threshold'][grid.species_id_grid].
+    Rows are never freed (species IDs are not reused), so extinct
+    species keep their last values.
+    """
+    
+    # column -> (dtype, getter): every scalar SpeciesTraits field, plus derived values
+    COLUMNS = {f.name: (_COLUMN_DTYPES[f.type], attrgetter(f.name))
+               for f in fields(SpeciesTraits) if f.type in _COLUMN_DTYPES}
+    COLUMNS.update({
+        'can_hunt': (np.bool_, lambda t: t.can_hunt()),
+        'hunting_efficiency': (np.float64, attrgetter('effective_hunting_efficiency')),
+    })
+    
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.columns = {name: np.zeros(capacity, dtype=dtype)
+                        for name, (dtype, _) in self.COLUMNS.items()}
+    
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.columns[column]
+    
+    def _grow(self, min_capacity: int):
+        """Reallocate all columns to hold at least min_capacity rows"""
+        capacity = max(min_capacity, self.capacity * 2)
+        for name, old in self.columns.items():
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.capacity] = old
+            self.columns[name] = new
+        self.capacity = capacity
+    
+    def update(self, species: 'Species'):
+        """Write (or rewrite) the row for a species"""
+        if species.id >= self.capacity:
+            self._grow(species.id + 1)
+        traits = species.traits
+        for name, (_, getter) in self.COLUMNS.items():
+            self.columns[name][species.id] = getter(traits)
+
+
+# Summary kept for an extinct species once its Species object is dropped
+ExtinctRecord = namedtuple('ExtinctRecord', ('id', 'name', 'parent_id', 'generation_born'))
+
+
 class SpeciesRegistry:
     """Manages all species in the simulation"""
     
+    EXTINCT_HISTORY = 1000  # Most recent extinctions kept in extinct_species
+    
     def __init__(self):
         self.species_by_id = {}
-        self.extinct_species = []
+        self.extinct_species = deque(maxlen=self.EXTINCT_HISTORY)  # ExtinctRecords, oldest first
+        self.extinct_count = 0
+        self.traits_table = TraitsTable()
         
     def register(self, species: Species) -> Species:
         """Add a species to the registry"""
         self.species_by_id[species.id] = species
+        self.traits_table.update(species)
         return species
     
+    def refresh_traits(self, species: Species):
+        """Re-sync the traits table after a registered species' traits were edited"""
+        self.traits_table.update(species)
+    
     def get(self, species_id: int) -> Species:
         """Get species by ID"""
         return self.species_by_id.get(species_id)
     
     def mark_extinct(self, species_id: int):
-        """Move species to extinct list"""
-        if species_id in self.species_by_id:
-            species = self.species_by_id.pop(species_id)
-            self.extinct_species.append(species)
+        """Drop a species from the living table and record its extinction"""
+        species = self.species_by_id.pop(species_id, None)
+        if species is not None:
+            self._record_extinct(species)
+    
+    def _record_extinct(self, species: Species):
+        self.extinct_species.append(ExtinctRecord(species.id, species.name,
+                                                  species.parent_id, species.generation_born))
+        self.extinct_count += 1
     
     def get_living_species(self):
         """Get all non-extinct species"""
@@ -302,31 +430,34 @@ class SpeciesRegistry:
     
     def update_populations(self, grid):
         """Update population counts from grid state"""
-        # Reset all populations
-        for species in self.species_by_id.values():
-            species.population = 0
-        
-        # Count living cells
-        for row in grid.cells:
-            for cell in row:
-                if cell and cell.is_alive:
-                    species = self.get(cell.species_id)
-                    if species:
-                        species.population += 1
+        species_id_grid = getattr(grid, 'species_id_grid', None)
+        if species_id_grid is not None:
+            # Count living cells per species ID in one pass over the grid's ID array
+            # (species_id_grid is 0 where no living cell is present; the traits
+            # table always has a row for every registered ID)
+            counts = np.bincount(species_id_grid.ravel(), minlength=self.traits_table.capacity).tolist()
+        else:
+            # Grids without the ID array: one C-level counting pass over the cells
+            # (a Counter also yields 0 for missing IDs)
+            counts = Counter(cell.species_id for row in grid.cells for cell in row
+                             if cell and cell.is_alive)
         
-        # Mark extinct species
-        extinct_ids = [sid for sid, species in self.species_by_id.items() 
-                       if species.population == 0]
-        for sid in extinct_ids:
-            self.mark_extinct(sid)
+        # Assign populations and retire extinct species in the same pass
+        species_by_id = self.species_by_id
+        for sid, species in list(species_by_id.items()):
+            population = counts[sid]
+            species.population = population
+            if population == 0:
+                del species_by_id[sid]
+                self._record_extinct(species)
     
     def get_stats(self):
         """Get current species statistics"""
         living = self.get_living_species()
         return {
             'total_species': len(living),
-            'extinct_species': len(self.extinct_species),
-            'total_population': sum(s.population for s in living),
-            'most_populous': max(living, key=lambda s: s.population) if living else None,
-            'oldest_species': min(living, key=lambda s: s.generation_born) if living else None
+            'extinct_species': self.extinct_count,
+            'total_population': sum(map(_get_population, living)),
+            'most_populous': max(living, key=_get_population) if living else None,
+            'oldest_species': min(living, key=_get_generation_born) if living else None
         }
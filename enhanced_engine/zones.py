@@ -2,10 +2,11 @@
 Environmental zones for Primordial Garden 2.0
 Different regions with different rules
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Tuple
 from enum import Enum
 import random
+import numpy as np
 
 
 class ZoneType(Enum):
@@ -18,7 +19,17 @@ class ZoneType(Enum):
     VOID = "void"
 
 
-@dataclass
+# Integer codes for zone type keywords ("fertile", "desert", ...), so hot loops
+# compare ints instead of strings. Unknown keywords get a fresh code on first use.
+ZONE_TYPE_CODES = {zone_type.value: code for code, zone_type in enumerate(ZoneType)}
+
+
+def zone_type_code(zone_type_name: str) -> int:
+    """Integer code for a zone type keyword (stable for the life of the process)"""
+    return ZONE_TYPE_CODES.setdefault(zone_type_name, len(ZONE_TYPE_CODES))
+
+
+@dataclass(frozen=True, slots=True)
 class ZoneProperties:
     """Properties that define a zone's characteristics"""
     name: str
@@ -41,55 +52,96 @@ class ZoneProperties:
     # Visual
     background_color: Tuple[int, int, int] = (20, 20, 20)
     
+    # Code of the first word of the name ("fertile", "desert", ...), set once
+    zone_type_code: int = field(init=False, default=-1)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'zone_type_code', zone_type_code(self.name.lower().split()[0]))
+    
     @staticmethod
     def from_type(zone_type: ZoneType) -> 'ZoneProperties':
-        """Create zone properties from preset type"""
-        presets = {
-            ZoneType.FERTILE: ZoneProperties(
-                name="Fertile Plains",
-                energy_generation_mult=1.5,
-                energy_decay_mult=0.8,
-                carrying_capacity=120,  # Rich zone supports more life
-                background_color=(30, 40, 25)
-            ),
-            ZoneType.DESERT: ZoneProperties(
-                name="Desert Wastes",
-                energy_generation_mult=0.5,
-                energy_decay_mult=1.5,
-                movement_cost_mult=1.3,
-                carrying_capacity=60,  # Harsh zone supports less life
-                background_color=(45, 40, 25)
-            ),
-            ZoneType.TOXIC: ZoneProperties(
-                name="Toxic Zone",
-                energy_decay_mult=2.0,
-                mutation_rate_mult=3.0,
-                reproduction_cost_mult=1.5,
-                carrying_capacity=40,  # Very harsh, minimal capacity
-                background_color=(25, 45, 25)
-            ),
-            ZoneType.NEUTRAL: ZoneProperties(
-                name="Neutral Ground",
-                carrying_capacity=100,  # Standard capacity
-                background_color=(20, 20, 20)
-            ),
-            ZoneType.PARADISE: ZoneProperties(
-                name="Paradise",
-                energy_generation_mult=2.0,
-                energy_decay_mult=0.5,
-                reproduction_cost_mult=0.7,
-                mutation_rate_mult=0.5,
-                carrying_capacity=150,  # Paradise supports abundant life
-                background_color=(25, 30, 40)
-            ),
-            ZoneType.VOID: ZoneProperties(
-                name="The Void",
-                can_enter=False,
-                carrying_capacity=0,  # Nothing can live here
-                background_color=(0, 0, 0)
-            )
-        }
-        return presets.get(zone_type, presets[ZoneType.NEUTRAL])
+        """Get the (shared, immutable) zone properties for a preset type"""
+        return _ZONE_PRESETS.get(zone_type, _ZONE_PRESETS[ZoneType.NEUTRAL])
+
+
+# Types a zone can turn into when zones shift
+_SHIFT_ZONE_TYPES = (ZoneType.FERTILE, ZoneType.DESERT, ZoneType.TOXIC, ZoneType.PARADISE)
+
+# Types create_random_zones picks from (no random neutral zones)
+_RANDOM_ZONE_TYPES = tuple(zone_type for zone_type in ZoneType if zone_type != ZoneType.NEUTRAL)
+
+# Numeric multipliers exported by ZoneManager.build_modifier_arrays
+_MODIFIER_FIELDS = ('energy_generation_mult', 'energy_decay_mult', 'reproduction_cost_mult',
+                    'mutation_rate_mult', 'movement_cost_mult')
+
+# Preset properties per zone type, built once at import
+_ZONE_PRESETS = {
+    ZoneType.FERTILE: ZoneProperties(
+        name="Fertile Plains",
+        energy_generation_mult=1.5,
+        energy_decay_mult=0.8,
+        carrying_capacity=120,  # Rich zone supports more life
+        background_color=(30, 40, 25)
+    ),
+    ZoneType.DESERT: ZoneProperties(
+        name="Desert Wastes",
+        energy_generation_mult=0.5,
+        energy_decay_mult=1.5,
+        movement_cost_mult=1.3,
+        carrying_capacity=60,  # Harsh zone supports less life
+        background_color=(45, 40, 25)
+    ),
+    ZoneType.TOXIC: ZoneProperties(
+        name="Toxic Zone",
+        energy_decay_mult=2.0,
+        mutation_rate_mult=3.0,
+        reproduction_cost_mult=1.5,
+        carrying_capacity=40,  # Very harsh, minimal capacity
+        background_color=(25, 45, 25)
+    ),
+    ZoneType.NEUTRAL: ZoneProperties(
+        name="Neutral Ground",
+        carrying_capacity=100,  # Standard capacity
+        background_color=(20, 20, 20)
+    ),
+    ZoneType.PARADISE: ZoneProperties(
+        name="Paradise",
+        energy_generation_mult=2.0,
+        energy_decay_mult=0.5,
+        reproduction_cost_mult=0.7,
+        mutation_rate_mult=0.5,
+        carrying_capacity=150,  # Paradise supports abundant life
+        background_color=(25, 30, 40)
+    ),
+    ZoneType.VOID: ZoneProperties(
+        name="The Void",
+        can_enter=False,
+        carrying_capacity=0,  # Nothing can live here
+        background_color=(0, 0, 0)
+    )
+}
+
+
+def population_pressure(populations: np.ndarray, capacities: np.ndarray) -> np.ndarray:
+    """Population pressure multiplier for each (population, carrying capacity) pair
+    
+    See Zone.get_population_pressure for the curve; zero-capacity (void)
+    zones get 0.0.
+    """
+    populations = populations.astype(np.float64)
+    capacities = capacities.astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pressure = np.select(
+            [capacities == 0,
+             populations < capacities * 0.5,   # Plenty of room - bonus resources
+             populations < capacities,         # Normal density: 1.3 at 0% to 1.0 at 100%
+             populations < capacities * 1.3],  # Moderate overcrowding: 1.0 at 100% to 0.7 at 130%
+            [0.0,
+             1.3,
+             1.3 - (populations / capacities * 0.3),
+             1.0 - ((populations - capacities) / (capacities * 0.3) * 0.3)],
+            default=0.6)                       # Severe overcrowding - harsh but survivable
+    return pressure
 
 
 class Zone:
@@ -102,11 +154,16 @@ class Zone:
         self.height = height
         self.properties = properties
         self.grid = None  # Reference to grid for cell counting (set by ZoneManager)
+        self._recompute_bounds()
+    
+    def _recompute_bounds(self):
+        """Refresh the exclusive far corner (x2, y2) after x/y/width/height change"""
+        self.x2 = self.x + self.width
+        self.y2 = self.y + self.height
     
     def contains(self, x: int, y: int) -> bool:
         """Check if coordinates are within this zone"""
-        return (self.x <= x < self.x + self.width and
-                self.y <= y < self.y + self.height)
+        return self.x <= x < self.x2 and self.y <= y < self.y2
     
     def get_center(self) -> Tuple[int, int]:
         """Get center coordinates of zone"""
@@ -117,9 +174,15 @@ class Zone:
         if not self.grid:
             return 0
         
+        alive = getattr(self.grid, 'alive', None)
+        if alive is not None:
+            # One C-level count over the zone's slice of the living-cell mask
+            return int(np.count_nonzero(alive[max(0, self.y):max(0, self.y2),
+                                              max(0, self.x):max(0, self.x2)]))
+        
         count = 0
-        for y in range(self.y, min(self.y + self.height, len(self.grid.cells))):
-            for x in range(self.x, min(self.x + self.width, len(self.grid.cells[0]))):
+        for y in range(self.y, min(self.y2, len(self.grid.cells))):
+            for x in range(self.x, min(self.x2, len(self.grid.cells[0]))):
                 cell = self.grid.cells[y][x]
                 if cell and cell.is_alive:
                     count += 1
@@ -135,26 +198,8 @@ class Zone:
             100-150% capacity: 0.8-1.0x (moderate pressure)
             > 150% capacity: 0.5-0.8x (severe overcrowding)
         """
-        if self.properties.carrying_capacity == 0:
-            return 0.0  # Void zones
-        
-        current_pop = self.get_cell_count()
-        capacity = self.properties.carrying_capacity
-        
-        if current_pop < capacity * 0.5:
-            # Plenty of room - bonus resources
-            return 1.3
-        elif current_pop < capacity:
-            # Normal density - smooth transition from 1.3 to 1.0
-            ratio = current_pop / capacity
-            return 1.3 - (ratio * 0.3)  # 1.3 at 0% to 1.0 at 100%
-        elif current_pop < capacity * 1.3:
-            # Moderate overcrowding - manageable penalty
-            overcrowding_ratio = (current_pop - capacity) / (capacity * 0.3)
-            return 1.0 - (overcrowding_ratio * 0.3)  # 1.0 at 100% to 0.7 at 130%
-        else:
-            # Severe overcrowding - harsh but survivable
-            return 0.6  # Minimum 60% energy (was 30%)
+        return float(population_pressure(np.array([self.get_cell_count()]),
+                                         np.array([self.properties.carrying_capacity]))[0])
     
     def __repr__(self):
         return f"Zone({self.properties.name} at ({self.x},{self.y}) size {self.width}x{self.height})"
@@ -163,17 +208,41 @@ class Zone:
 class ZoneManager:
     """Manages environmental zones in the simulation"""
     
-    def __init__(self, grid_width: int, grid_height: int):
+    def __init__(self, grid_width: int, grid_height: int, rng: np.random.Generator = None):
         self.grid_width = grid_width
         self.grid_height = grid_height
         self.zones = []
         self.generation = 0
         self.shift_interval = 100  # Zones shift every N generations
         self.shift_enabled = False
+        self.rng = rng if rng is not None else np.random.default_rng()
         
         # Default: entire grid is neutral
         self.default_zone = Zone(0, 0, grid_width, grid_height, 
                                 ZoneProperties.from_type(ZoneType.NEUTRAL))
+        
+        # Zone rectangles as parallel int32 arrays ([zx[i], zx2[i]) x [zy[i], zy2[i]) is self.zones[i])
+        # and the winning zone per position: 0 is the default zone, i is self.zones[i - 1]
+        self.zone_map = np.zeros((grid_height, grid_width), dtype=np.uint16)
+        self.zones_arr = np.array([self.default_zone], dtype=object)  # zone_map value -> Zone
+        self.pressure_per_zone = np.ones(1, dtype=np.float64)  # See update_population_pressure
+        self._rebuild_zone_map()
+    
+    def _rebuild_zone_map(self):
+        """Repaint zone_map in priority order (later zones override earlier ones)"""
+        bounds = np.array([(zone.x, zone.y, zone.x2, zone.y2) for zone in self.zones],
+                          dtype=np.int32).reshape(-1, 4)
+        self.zx, self.zy, self.zx2, self.zy2 = bounds.T.copy()
+        
+        zone_map = self.zone_map
+        zone_map[:] = 0
+        for i, (x, y, x2, y2) in enumerate(bounds.tolist(), start=1):
+            zone_map[max(0, y):max(0, y2), max(0, x):max(0, x2)] = i
+        zones_arr = np.empty(len(self.zones) + 1, dtype=object)
+        zones_arr[:] = [self.default_zone] + self.zones
+        self.zones_arr = zones_arr
+        # Same map resolved to Zone objects as nested lists, for scalar get_zone_at()
+        self._zone_rows = zones_arr[zone_map].tolist()
     
     def enable_shifting(self, interval: int = 100):
         """Enable environmental zone shifting"""
@@ -191,30 +260,40 @@ class ZoneManager:
         if not self.zones:
             return
         
+        # Draw every roll up front: gates for type/position/size changes,
+        # the new type, and (dx, dy, dw, dh) deltas for each zone
+        num_zones = len(self.zones)
+        rolls = self.rng.random(size=(num_zones, 3))
+        type_choices = self.rng.integers(0, len(_SHIFT_ZONE_TYPES), size=num_zones).tolist()
+        dx, dy, dw, dh = self.rng.integers(-8, 9, size=(num_zones, 4)).T
+        
+        # Moderate chance to change zone type (30%); only the zones that roll it are visited
         changes = []
-        for i, zone in enumerate(self.zones):
-            # Moderate chance to change zone type (30%)
-            if random.random() < 0.3:
-                zone_types = [ZoneType.FERTILE, ZoneType.DESERT, 
-                             ZoneType.TOXIC, ZoneType.PARADISE]
-                old_type = zone.properties.name
-                new_type = random.choice(zone_types)
-                zone.properties = ZoneProperties.from_type(new_type)
-                changes.append(f"Zone {i+1}: {old_type} -> {zone.properties.name}")
-            
-            # Higher chance to shift boundaries (70%)
-            if random.random() < 0.7:
-                dx = random.randint(-8, 8)
-                dy = random.randint(-8, 8)
-                zone.x = max(0, min(self.grid_width - zone.width, zone.x + dx))
-                zone.y = max(0, min(self.grid_height - zone.height, zone.y + dy))
-            
-            # Change size more frequently (60%)
-            if random.random() < 0.6:
-                dw = random.randint(-8, 8)
-                dh = random.randint(-8, 8)
-                zone.width = max(15, min(80, zone.width + dw))
-                zone.height = max(15, min(80, zone.height + dh))
+        for i in np.flatnonzero(rolls[:, 0] < 0.3).tolist():
+            zone = self.zones[i]
+            old_type = zone.properties.name
+            zone.properties = ZoneProperties.from_type(_SHIFT_ZONE_TYPES[type_choices[i]])
+            changes.append(f"Zone {i+1}: {old_type} -> {zone.properties.name}")
+        
+        # Move/resize every zone at once, clamping once per shift
+        x, y = self.zx, self.zy
+        width, height = self.zx2 - x, self.zy2 - y
+        
+        # Higher chance to shift boundaries (70%)
+        move = rolls[:, 1] < 0.7
+        x = np.where(move, np.maximum(0, np.minimum(self.grid_width - width, x + dx)), x)
+        y = np.where(move, np.maximum(0, np.minimum(self.grid_height - height, y + dy)), y)
+        
+        # Change size more frequently (60%)
+        resize = rolls[:, 2] < 0.6
+        width = np.where(resize, np.maximum(15, np.minimum(80, width + dw)), width)
+        height = np.where(resize, np.maximum(15, np.minimum(80, height + dh)), height)
+        
+        for zone, bounds in zip(self.zones, zip(x.tolist(), y.tolist(), width.tolist(), height.tolist())):
+            zone.x, zone.y, zone.width, zone.height = bounds
+            zone._recompute_bounds()
+        
+        self._rebuild_zone_map()
         
         if changes:
             print("  Zone transformations:", ", ".join(changes))
@@ -223,27 +302,71 @@ class ZoneManager:
     def add_zone(self, zone: Zone):
         """Add a zone (later zones override earlier ones)"""
         self.zones.append(zone)
+        self._rebuild_zone_map()
     
     def get_zone_at(self, x: int, y: int) -> Zone:
         """Get the zone at specific coordinates"""
-        # Check zones in reverse order (later zones have priority)
-        for zone in reversed(self.zones):
-            if zone.contains(x, y):
-                return zone
+        if 0 <= x < self.grid_width and 0 <= y < self.grid_height:
+            return self._zone_rows[y][x]
         return self.default_zone
     
+    def recompute_populations(self, alive_mask: np.ndarray) -> np.ndarray:
+        """Living cells inside each zone's rectangle (indexed by zone_map values)
+        
+        Uses a summed-area table of alive_mask, so every zone is answered with
+        four lookups after a single cumulative-sum pass over the grid.
+        """
+        height, width = alive_mask.shape
+        sat = np.zeros((height + 1, width + 1), dtype=np.int32)
+        np.cumsum(alive_mask, axis=0, dtype=np.int32, out=sat[1:, 1:])
+        np.cumsum(sat[1:, 1:], axis=1, out=sat[1:, 1:])
+        
+        # Default zone first, clamped to the grid like zone_map
+        x = np.clip(np.concatenate(([0], self.zx)), 0, width)
+        y = np.clip(np.concatenate(([0], self.zy)), 0, height)
+        x2 = np.clip(np.concatenate(([width], self.zx2)), 0, width)
+        y2 = np.clip(np.concatenate(([height], self.zy2)), 0, height)
+        return sat[y2, x2] - sat[y, x2] - sat[y2, x] + sat[y, x]
+    
+    def update_population_pressure(self, alive_mask: np.ndarray) -> np.ndarray:
+        """Recompute pressure_per_zone (indexed by zone_map values) from alive_mask"""
+        populations = self.recompute_populations(alive_mask)
+        capacities = np.array([zone.properties.carrying_capacity for zone in self.zones_arr.tolist()])
+        self.pressure_per_zone = population_pressure(populations, capacities)
+        return self.pressure_per_zone
+    
+    def build_modifier_arrays(self) -> dict:
+        """Per-zone modifiers as contiguous arrays indexed by zone_map values
+        
+        Keys are the ZoneProperties multiplier names (float64) plus
+        'zone_type_code' (int32) and 'can_enter' (bool), for compiled per-cell kernels.
+        """
+        properties = [zone.properties for zone in self.zones_arr.tolist()]
+        arrays = {name: np.array([getattr(p, name) for p in properties], dtype=np.float64)
+                  for name in _MODIFIER_FIELDS}
+        arrays['zone_type_code'] = np.array([p.zone_type_code for p in properties], dtype=np.int32)
+        arrays['can_enter'] = np.array([p.can_enter for p in properties], dtype=np.bool_)
+        return arrays
+    
+    def get_zones_in_rect(self, x: int, y: int, width: int, height: int) -> list:
+        """Zones overlapping a rectangle, in priority order (lowest first)"""
+        hits = np.flatnonzero((self.zx < x + width) & (x < self.zx2) &
+                              (self.zy < y + height) & (y < self.zy2))
+        return [self.zones[i] for i in hits.tolist()]
+    
+    def get_zones_at_bulk(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Object array of the zones at in-grid coordinate arrays xs, ys"""
+        return self.zones_arr[self.zone_map[ys, xs]]
+    
     def create_random_zones(self, num_zones: int = 5, min_size: int = 20, max_size: int = 60):
         """Generate random zones for variety"""
-        zone_types = list(ZoneType)
-        zone_types.remove(ZoneType.NEUTRAL)  # Don't create random neutral zones
-        
         for _ in range(num_zones):
             width = random.randint(min_size, max_size)
             height = random.randint(min_size, max_size)
             x = random.randint(0, max(0, self.grid_width - width))
             y = random.randint(0, max(0, self.grid_height - height))
             
-            zone_type = random.choice(zone_types)
+            zone_type = random.choice(_RANDOM_ZONE_TYPES)
             properties = ZoneProperties.from_type(zone_type)
             
             self.add_zone(Zone(x, y, width, height, properties))
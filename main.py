@@ -7,6 +7,7 @@ Main entry point
 import pygame
 import sys
 import json
+import time
 from pathlib import Path
 
 from engine.grid import World
@@ -14,6 +15,12 @@ from engine.rules import EnvironmentalRules
 from visualization.renderer import Renderer
 from analysis.tracker import SimulationTracker
 
+# Number keys 1-5 -> simulation speed multiplier
+SPEED_KEYS = {pygame.K_1: 1, pygame.K_2: 5, pygame.K_3: 10, pygame.K_4: 50, pygame.K_5: 100}
+
+RENDER_INTERVAL_MS = 16  # ~60 FPS
+STEP_BUDGET_SECONDS = 0.012  # Stepping time per loop pass, leaving the rest of a 60 Hz frame for input/drawing
+
 
 def load_preset(preset_name="primordial_soup"):
     """Load simulation parameters from config"""
@@ -47,6 +54,7 @@ def main():
     
     clock = pygame.time.Clock()
     frame_count = 0
+    last_render = pygame.time.get_ticks()
     
     print("Primordial Garden - Controls:")
     print("  SPACE: Pause/Resume")
@@ -55,35 +63,33 @@ def main():
     print("  R: Reset simulation")
     print("  Q/ESC: Quit")
     
+    # Event constants as locals so the per-frame event loop skips module lookups
+    QUIT, KEYDOWN, K_SPACE = pygame.QUIT, pygame.KEYDOWN, pygame.K_SPACE
+    
     while running:
         # Event handling
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type == QUIT:
                 running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWFOCUSGAINED):
+                renderer.request_redraw()
+            elif event.type == KEYDOWN:
+                if event.key == K_SPACE:
                     paused = not paused
-                elif event.key == pygame.K_1:
-                    speed = 1
-                elif event.key == pygame.K_2:
-                    speed = 5
-                elif event.key == pygame.K_3:
-                    speed = 10
-                elif event.key == pygame.K_4:
-                    speed = 50
-                elif event.key == pygame.K_5:
-                    speed = 100
+                elif event.key in SPEED_KEYS:
+                    speed = SPEED_KEYS[event.key]
                 elif event.key == pygame.K_s:
                     show_stats = not show_stats
                 elif event.key == pygame.K_r:
                     world.reset(params["initial_density"])
-                    tracker = SimulationTracker()
+                    tracker.reset()
                     frame_count = 0
                 elif event.key in (pygame.K_q, pygame.K_ESCAPE):
                     running = False
         
-        # Simulation step
+        # Simulation step: up to `speed` generations, stopping early once the time budget is spent
         if not paused:
+            deadline = time.perf_counter() + STEP_BUDGET_SECONDS
             for _ in range(speed):
                 world.step()
                 frame_count += 1
@@ -91,13 +97,18 @@ def main():
                 # Track every 10 generations
                 if frame_count % 10 == 0:
                     tracker.snapshot(world)
+                
+                if time.perf_counter() >= deadline:
+                    break
         
-        # Render (skip frames at high speeds for better performance)
-        if speed <= 10 or frame_count % (speed // 10) == 0:
+        # Render at most once per RENDER_INTERVAL_MS, however many steps ran
+        now = pygame.time.get_ticks()
+        if now - last_render >= RENDER_INTERVAL_MS:
             renderer.draw_frame(show_stats, speed, paused)
+            last_render = now
         
-        # Cap framerate
-        clock.tick(60)
+        # Cap framerate at normal speeds; high speeds run the simulation flat out
+        clock.tick(60 if paused or speed <= 10 else 0)
     
     # Cleanup - close pygame window first to prevent lockup
     pygame.quit()
@@ -16,27 +16,51 @@ Features from v0.2.0:
 """
 
 import pygame
+import numpy as np
 import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
 import csv
 import json
+from contextlib import contextmanager
+from heapq import nlargest
+import threading
+import time
+import numba
+
+# The grid is stepped on a worker thread; with the TBB layer, parallel kernels
+# launched off the main thread leave the interpreter hanging at exit
+numba.config.THREADING_LAYER_PRIORITY = ["omp", "workqueue", "tbb"]
 
 # Import enhanced engine
 from enhanced_engine.grid import Grid
+from enhanced_engine.grid_numba import cell_colors
+from enhanced_engine.headless import (add_grid_arguments, build_grid, grid_config_from_args,
+                                      species_from_config)
 from enhanced_engine.species_enhanced import Species, SpeciesTraits
 from enhanced_engine.zones import ZoneType
 from enhanced_engine.population_manager import PopulationManager
 
 # Import existing visualization (reuse optimized renderer concept)
-from visualization.renderer import Renderer as BaseRenderer
+from visualization.renderer import render_text
 from visualization.live_graphs import LiveGraphs
 
+# Number keys 1-5 -> simulation speed multiplier
+SPEED_KEYS = {pygame.K_1: 1, pygame.K_2: 5, pygame.K_3: 10, pygame.K_4: 50, pygame.K_5: 100}
+
+GRAPH_UPDATE_EVERY = 15  # Frames between live-graph data points
+GRAPH_VIEW_SIZE = (1200, 800)  # Size of the rendered live graphs
 
-def save_species_config(species_configs, filename="last_species_config.json"):
-    """Save species configuration to file (v0.9.0: Updated for behavioral redesign)"""
+
+def save_species_config(species_configs, filename="last_species_config.json", placements=None):
+    """Save species configuration to file (v0.9.0: Updated for behavioral redesign)
+    
+    placements, if given, holds each species' placement pattern so the file can
+    be run as-is with --config.
+    """
     config_data = []
-    for species, pop in species_configs:
+    for i, (species, pop) in enumerate(species_configs):
         config_data.append({
             "name": species.name,
             "population": pop,
@@ -59,6 +83,8 @@ def save_species_config(species_configs, filename="last_species_config.json"):
                 "color": species.traits.color
             }
         })
+        if placements is not None:
+            config_data[-1]["placement"] = placements[i]
     
     with open(filename, 'w') as f:
         json.dump(config_data, f, indent=2)
@@ -70,24 +96,7 @@ def load_species_config(filename="last_species_config.json"):
         with open(filename, 'r') as f:
             config_data = json.load(f)
         
-        species_list = []
-        for config in config_data:
-            trait_data = config["traits"].copy()
-            
-            # Remove old v0.8.0 parameters if present
-            trait_data.pop('can_move', None)
-            trait_data.pop('movement_strategy', None)
-            trait_data.pop('is_predator', None)
-            trait_data.pop('movement_cost', None)  # Now auto-calculated
-            
-            # Add new v0.9.0 parameters with defaults if missing
-            trait_data.setdefault('colonial_affinity', 1.2)
-            trait_data.setdefault('cluster_reproduction_bonus', 1.3)
-            trait_data.setdefault('hunting_efficiency', 0.5)
-            
-            traits = SpeciesTraits(**trait_data)
-            species = Species(name=config["name"], traits=traits)
-            species_list.append((species, config["population"]))
+        species_list = species_from_config(config_data)
         
         print("✓ Loaded previous configuration (upgraded to v0.9.0)")
         return species_list
@@ -286,14 +295,16 @@ def main():
         default_species = Species("Default", SpeciesTraits())
         species_configs = [(default_species, 100)]
     
-    # Save configuration for replay
-    save_species_config(species_configs)
-    print(f"✓ Configuration saved (can replay with 'y' next time)\n")
-    
     # Seed species
+    placements = []
     for species, pop in species_configs:
         pattern = input(f"Placement for {species.name} (random/center/edge, default random): ").strip() or "random"
         grid.seed_species(species, pop, pattern)
+        placements.append(pattern)
+    
+    # Save configuration for replay
+    save_species_config(species_configs, placements=placements)
+    print(f"✓ Configuration saved (can replay with 'y' next time, or run with --config)\n")
     
     # Run simulation
     print("\n" + "=" * 60)
@@ -304,6 +315,72 @@ def main():
     run_enhanced_simulation(grid, width, height)
 
 
+class SimulationWorker(threading.Thread):
+    """Steps the grid on a background thread at `speed` generations per 60 Hz frame
+    
+    Anything that reads the grid from another thread must do so inside
+    `with worker.frame():`.
+    """
+    
+    FRAME_SECONDS = 1 / 60
+    
+    def __init__(self, grid, exporter):
+        super().__init__(daemon=True)
+        self.grid = grid
+        self.exporter = exporter
+        self.lock = threading.Lock()
+        self.speed = 1
+        self.paused = False
+        self._stop_requested = threading.Event()
+        self._no_frame_waiting = threading.Event()  # Cleared while a reader waits for/holds the lock
+        self._no_frame_waiting.set()
+    
+    @contextmanager
+    def frame(self):
+        """Hold the grid between steps; the worker yields to a waiting frame"""
+        self._no_frame_waiting.clear()
+        try:
+            with self.lock:
+                yield
+        finally:
+            self._no_frame_waiting.set()
+    
+    def run(self):
+        grid = self.grid
+        next_step = time.perf_counter()
+        while not self._stop_requested.is_set():
+            if self.paused:
+                self._stop_requested.wait(self.FRAME_SECONDS)
+                next_step = time.perf_counter()
+                continue
+            
+            self._no_frame_waiting.wait()
+            with self.lock:
+                grid.step()
+                if grid.generation % 10 == 0:
+                    self.exporter.write(grid.get_stats())
+            
+            # Pace to speed x 60 generations per second; never sleep when behind
+            next_step = max(next_step + self.FRAME_SECONDS / self.speed, time.perf_counter() - self.FRAME_SECONDS)
+            delay = next_step - time.perf_counter()
+            if delay > 0:
+                self._stop_requested.wait(delay)
+    
+    def stop(self):
+        """Ask the worker to finish its current step and wait for it"""
+        self._stop_requested.set()
+        self.join()
+
+
+def open_display(size):
+    """Set the display mode, preferring SDL's scaled renderer with vsync"""
+    try:
+        return pygame.display.set_mode(size, pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+    except pygame.error:
+        # Vsync/renderer not available on this driver
+        return pygame.display.set_mode(size)
+
+
 def run_enhanced_simulation(grid, width, height):
     """Run the enhanced simulation with pygame"""
     # Initialize pygame
@@ -311,7 +388,8 @@ def run_enhanced_simulation(grid, width, height):
     cell_size = 4
     screen_width = width * cell_size + 400  # Extra space for stats
     screen_height = height * cell_size
-    screen = pygame.display.set_mode((screen_width, screen_height))
+    # One window for both views, big enough for either, so toggling graphs never recreates it
+    screen = open_display((max(screen_width, GRAPH_VIEW_SIZE[0]), max(screen_height, GRAPH_VIEW_SIZE[1])))
     pygame.display.set_caption("Primordial Garden v0.2.0 - Enhanced")
     clock = pygame.time.Clock()
     
@@ -319,87 +397,94 @@ def run_enhanced_simulation(grid, width, height):
     running = True
     paused = False
     speed = 1
-    export_data = []
+    exporter = StatsExporter()
     show_graphs = False
+    frame_count = 0
+    current_stats = None  # Stats of the generation last drawn, reused until the grid steps
     
     # Initialize graphs
     graphs = LiveGraphs(max_history=500)
-    graph_window = None
+    graph_surface = None  # Last matplotlib render, redrawn only when new points arrive
     
     font = pygame.font.Font(None, 24)
     small_font = pygame.font.Font(None, 18)
     
+    # Simulation runs on its own thread so a slow step never stalls input or drawing
+    worker = SimulationWorker(grid, exporter)
+    worker.start()
+    
+    # Event constants as locals so the per-frame event loop skips module lookups
+    QUIT, KEYDOWN, K_SPACE = pygame.QUIT, pygame.KEYDOWN, pygame.K_SPACE
+    
     while running:
         # Events
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if event.type == QUIT:
                 running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
+            elif event.type == KEYDOWN:
+                if event.key == K_SPACE:
                     paused = not paused
-                elif event.key == pygame.K_1:
-                    speed = 1
-                elif event.key == pygame.K_2:
-                    speed = 5
-                elif event.key == pygame.K_3:
-                    speed = 10
-                elif event.key == pygame.K_4:
-                    speed = 50
-                elif event.key == pygame.K_5:
-                    speed = 100
+                elif event.key in SPEED_KEYS:
+                    speed = SPEED_KEYS[event.key]
                 elif event.key == pygame.K_s:
                     # Export
-                    save_data(export_data)
+                    exporter.save()
                 elif event.key == pygame.K_g:
                     # Toggle graphs
                     show_graphs = not show_graphs
-                    if show_graphs and graph_window is None:
-                        # Create separate window for graphs
-                        graph_window = pygame.display.set_mode((1200, 800))
+                    if show_graphs:
                         pygame.display.set_caption("Primordial Garden - Live Graphs")
-                    elif not show_graphs and graph_window:
-                        # Return to main window
-                        graph_window = None
-                        pygame.display.set_mode((screen_width, screen_height))
+                    else:
                         pygame.display.set_caption("Primordial Garden v0.2.0 - Enhanced")
                 elif event.key == pygame.K_q:
                     running = False
         
-        # Update
-        if not paused:
-            for _ in range(speed):
-                grid.step()
-                
-                if grid.generation % 10 == 0:
-                    stats = grid.get_stats()
-                    export_data.append(stats)
+        # Update: the worker steps the grid; hand it the current controls
+        worker.speed = speed
+        worker.paused = paused
         
-        # Update graphs with current stats
-        current_stats = grid.get_stats()
-        graphs.update(current_stats)
+        # Render whatever generation is current; hold the lock so no step runs mid-frame
+        with worker.frame():
+            # Stats for this frame, shared by the graphs and the stats panel;
+            # recomputed only when the worker has stepped since the last frame
+            if current_stats is None or current_stats['generation'] != grid.generation:
+                current_stats = grid.get_stats()
+            
+            # Update graphs with current stats (every few frames; one point per frame is more than visible)
+            # History is kept while the graphs are hidden so they are complete when shown
+            frame_count += 1
+            if frame_count % GRAPH_UPDATE_EVERY == 0:
+                graphs.update(current_stats)
+                graph_surface = None
+            
+            # Render the simulation view while the grid is held
+            if not show_graphs:
+                screen.fill((0, 0, 0))
+                draw_enhanced_grid(screen, grid, cell_size)
+                draw_enhanced_stats(screen, grid, width * cell_size, speed, paused, font, small_font,
+                                    stats=current_stats)
         
-        # Render
-        if show_graphs and graph_window:
-            # Display graphs
-            graph_image = graphs.render()
-            if graph_image is not None:
-                # Convert numpy array to pygame surface
-                graph_surface = pygame.surfarray.make_surface(
-                    graph_image.swapaxes(0, 1)
-                )
-                graph_window.fill((0, 0, 0))
-                graph_window.blit(graph_surface, (0, 0))
-        else:
-            # Display normal simulation
-            screen.fill((0, 0, 0))
-            draw_enhanced_grid(screen, grid, cell_size)
-            draw_enhanced_stats(screen, grid, width * cell_size, speed, paused, font, small_font)
+        if show_graphs:
+            # Display graphs; matplotlib only runs when there is a new point to plot.
+            # It reads only the graph history, so the worker keeps stepping meanwhile.
+            if graph_surface is None:
+                graph_image = graphs.render()
+                if graph_image is not None:
+                    # Wrap the RGBA buffer directly, then copy once into the display format
+                    height_px, width_px = graph_image.shape[:2]
+                    graph_surface = pygame.image.frombuffer(graph_image, (width_px, height_px), 'RGBA').convert()
+            if graph_surface is not None:
+                screen.fill((0, 0, 0))
+                screen.blit(graph_surface, (0, 0))
         
         pygame.display.flip()
         clock.tick(60)
     
+    # Stop stepping before the final save
+    worker.stop()
+    
     # Save on exit
-    save_data(export_data)
+    exporter.close()
     
     # Clean up graphs
     graphs.close()
@@ -409,8 +494,30 @@ def run_enhanced_simulation(grid, width, height):
 
 def draw_enhanced_grid(screen, grid, cell_size):
     """Draw grid with zones and energy-based brightness"""
+    # Zones come from a cached pre-rendered layer
+    screen.blit(zone_layer(grid, cell_size), (0, 0))
+    
+    # Draw cells with energy-based brightness: one pixel per cell, scaled up in one blit
+    screen.blit(cell_layer(grid, cell_size), (0, 0))
+
+
+# Pre-rendered zone layer, rebuilt when the zone manager repaints its zone map
+_zone_layer_cache = {'zones': None, 'cell_size': None, 'surface': None}
+
+
+def zone_layer(grid, cell_size):
+    """Surface with all zones drawn over black, cached until the zones change"""
+    zone_manager = grid.zone_manager
+    cache = _zone_layer_cache
+    # zones_arr is replaced every time the zone manager rebuilds its zone map
+    if cache['zones'] is zone_manager.zones_arr and cache['cell_size'] == cell_size:
+        return cache['surface']
+    
+    surface = pygame.Surface((grid.width * cell_size, grid.height * cell_size)).convert()
+    surface.fill((0, 0, 0))
+    
     # Draw zones with semi-transparent overlays and borders
-    for zone in grid.zone_manager.get_all_zones():
+    for zone in zone_manager.get_all_zones():
         zone_rect = pygame.Rect(
             zone.x * cell_size,
             zone.y * cell_size,
@@ -421,124 +528,126 @@ def draw_enhanced_grid(screen, grid, cell_size):
         zone_surface = pygame.Surface((zone_rect.width, zone_rect.height))
         zone_surface.set_alpha(60)  # More visible
         zone_surface.fill(zone.properties.background_color)
-        screen.blit(zone_surface, zone_rect.topleft)
+        surface.blit(zone_surface, zone_rect.topleft)
         
         # Draw zone border for clarity
         border_color = tuple(min(255, c + 40) for c in zone.properties.background_color)
-        pygame.draw.rect(screen, border_color, zone_rect, 2)  # 2px border
-    
-    # Draw cells with energy-based brightness
-    for y in range(grid.height):
-        for x in range(grid.width):
-            cell = grid.cells[y][x]
-            if cell and cell.is_alive:
-                species = grid.species_registry.get(cell.species_id)
-                if species:
-                    try:
-                        color = cell.get_color(species)
-                        # Validate color is RGB tuple
-                        if isinstance(color, (tuple, list)) and len(color) == 3:
-                            color = tuple(int(max(0, min(255, c))) for c in color)
-                        else:
-                            color = (100, 200, 100)  # Default green
-                    except:
-                        color = (100, 200, 100)  # Default green on error
-                    
-                    rect = pygame.Rect(x * cell_size, y * cell_size, cell_size, cell_size)
-                    pygame.draw.rect(screen, color, rect)
-
-
-def draw_enhanced_stats(screen, grid, panel_x, speed, paused, font, small_font, pop_manager=None):
-    """Draw stats panel"""
-    stats = grid.get_stats()
-    
-    # Background
-    pygame.draw.rect(screen, (30, 30, 40), (panel_x, 0, 400, screen.get_height()))
+        pygame.draw.rect(surface, border_color, zone_rect, 2)  # 2px border
     
-    y_offset = 20
-    line_height = 30
-    
-    # Check for population pressure
-    pressure_warning = ""
-    if pop_manager:
-        pop_stats = pop_manager.get_population_stats(grid.cells)
-        pressure = pop_stats['total'] / pop_manager.total_cell_limit
-        if pressure > 0.9:
-            pressure_warning = "🔥 HIGH LOAD"
-        elif pressure > 0.7:
-            pressure_warning = "⚠️  BUSY"
+    cache.update(zones=zone_manager.zones_arr, cell_size=cell_size, surface=surface)
+    return surface
+
+
+def species_palette(species_registry):
+    """(capacity, 3) RGB lookup indexed by species ID; unknown IDs are black"""
+    palette = np.zeros((species_registry.traits_table.capacity, 3), dtype=np.float64)
+    for species in species_registry.get_living_species():
+        palette[species.id] = species.traits.color
+    return palette
+
+
+# One-pixel-per-cell surface and its scaled-up copy, reused every frame while the size stays the same
+_cell_layer_cache = {'size': None, 'surface': None, 'scaled': None}
+
+
+def cell_layer(grid, cell_size):
+    """Surface with living cells dimmed by energy (Cell.get_color), cell_size pixels per cell
+    
+    Empty positions are black and color-keyed, so the zones show through.
+    """
+    cache = _cell_layer_cache
+    size = (grid.width, grid.height, cell_size)
+    surface, scaled = cache['surface'], cache['scaled']
+    if cache['size'] != size:
+        surface = pygame.Surface((grid.width, grid.height)).convert()
+        scaled = pygame.Surface((grid.width * cell_size, grid.height * cell_size)).convert()
+        surface.set_colorkey((0, 0, 0))
+        scaled.set_colorkey((0, 0, 0))
+        cache.update(size=size, surface=surface, scaled=scaled)
+    
+    # Write colors straight into the surface's pixels; the view is (x, y), the kernel wants (y, x)
+    pixels = pygame.surfarray.pixels3d(surface)
+    cell_colors(grid.alive, grid.species_id_grid, grid.energy, grid.max_energy,
+                species_palette(grid.species_registry), pixels.swapaxes(0, 1))
+    del pixels  # Unlocks the surface
+    
+    # Scale into the preallocated surface instead of a new one per frame
+    pygame.transform.scale(surface, scaled.get_size(), scaled)
+    return scaled
+
+
+# Stats panel layout
+PANEL_WIDTH = 400
+PANEL_LINE_HEIGHT = 30
+PANEL_TOP_SPECIES_Y = 650
+
+# Panel lines that never change, drawn below the live stat lines
+STATIC_STAT_LINES = [
+    f"",
+    f"Controls:",
+    f"SPACE: Pause",
+    f"1-5: Speed",
+    f"G: Toggle Graphs",
+    f"S: Export Data",
+    f"Q: Quit",
+    f"",
+    f"--- Zones Guide ---",
+    f"Forest Green: Fertile",
+    f"  (1.2x energy, easy)",
+    f"Tan: Desert",
+    f"  (0.6x energy, harsh)",
+    f"Dark Olive: Toxic",
+    f"  (0.4x, high mutation)",
+    f"Bright: Paradise",
+    f"  (2x energy, ideal)",
+    f"Gray: Neutral",
+    f"  (1x energy, default)",
+    f"",
+    f"Zones shift every",
+    f"50 generations!"
+]
+
+# Number of live stat lines above STATIC_STAT_LINES
+DYNAMIC_STAT_LINE_COUNT = 13
+
+# Fixed headings between the live stat lines, as (line index, text)
+STAT_HEADING_LINES = [
+    (4, "This Generation:"),
+    (9, "Avg Species Age:"),
+]
+
+# Pre-rendered panel background with the static text and legend
+_static_panel_cache = {'key': None, 'surface': None}
+
+
+def _stat_line_color(line):
+    """Label lines ("Name: ...") are highlighted"""
+    if ":" in line and not line.startswith(" "):
+        return (150, 200, 255)
+    return (200, 200, 200)
+
+
+def static_stats_panel(height, font, small_font):
+    """Panel background with every line that never changes, cached per height and fonts"""
+    key = (height, font, small_font)
+    if _static_panel_cache['key'] == key:
+        return _static_panel_cache['surface']
     
-    stat_lines = [
-        f"Generation: {stats['generation']}",
-        f"Population: {stats['population']} {pressure_warning}",
-        f"Species: {stats['species_count']}",
-        f"",
-        f"This Generation:",
-        f"  Births: {stats['births']}",
-        f"  Deaths: {stats['deaths']}",
-        f"  Mutations: {stats['mutations']}",
-        f"",
-        f"Avg Species Age:",
-        f"  {stats['avg_species_age']:.1f} gens",
-        f"",
-        f"Speed: {speed}x {'(PAUSED)' if paused else ''}",
-        f"",
-        f"Controls:",
-        f"SPACE: Pause",
-        f"1-5: Speed",
-        f"G: Toggle Graphs",
-        f"S: Export Data",
-        f"Q: Quit",
-        f"",
-        f"--- Zones Guide ---",
-        f"Forest Green: Fertile",
-        f"  (1.2x energy, easy)",
-        f"Tan: Desert",
-        f"  (0.6x energy, harsh)",
-        f"Dark Olive: Toxic",
-        f"  (0.4x, high mutation)",
-        f"Bright: Paradise",
-        f"  (2x energy, ideal)",
-        f"Gray: Neutral",
-        f"  (1x energy, default)",
-        f"",
-        f"Zones shift every",
-        f"50 generations!"
-    ]
+    panel = pygame.Surface((PANEL_WIDTH, height)).convert()
+    panel.fill((30, 30, 40))
     
-    for i, line in enumerate(stat_lines):
-        color = (200, 200, 200)
-        if ":" in line and not line.startswith(" "):
-            color = (150, 200, 255)
-        
-        text = small_font.render(line, True, color)
-        screen.blit(text, (panel_x + 10, y_offset + i * line_height))
+    y_offset = 20
+    for i, line in STAT_HEADING_LINES + list(enumerate(STATIC_STAT_LINES, start=DYNAMIC_STAT_LINE_COUNT)):
+        text = small_font.render(line, True, _stat_line_color(line))
+        panel.blit(text, (10, y_offset + i * PANEL_LINE_HEIGHT))
     
-    # Top species
-    top_y = 650
     title = font.render("Top Species:", True, (150, 200, 255))
-    screen.blit(title, (panel_x + 10, top_y))
-    
-    species_list = sorted(grid.species_registry.get_living_species(),
-                         key=lambda s: s.population, reverse=True)[:5]
-    
-    for i, species in enumerate(species_list):
-        # Show species with its actual color
-        name_text = species.name[:20] if len(species.name) <= 20 else species.name[:17] + "..."
-        complexity_indicator = f"[C{species.traits.complexity}]"
-        
-        text = small_font.render(f"{name_text}: {species.population}", 
-                                True, species.traits.color)
-        screen.blit(text, (panel_x + 10, top_y + 30 + i * 25))
-        
-        # Show complexity indicator
-        comp_text = small_font.render(complexity_indicator, True, (150, 150, 150))
-        screen.blit(comp_text, (panel_x + 280, top_y + 30 + i * 25))
+    panel.blit(title, (10, PANEL_TOP_SPECIES_Y))
     
     # Add organism color legend
-    legend_y = top_y + 180
+    legend_y = PANEL_TOP_SPECIES_Y + 180
     legend_title = small_font.render("--- Organism Colors ---", True, (150, 200, 255))
-    screen.blit(legend_title, (panel_x + 10, legend_y))
+    panel.blit(legend_title, (10, legend_y))
     
     legend_items = [
         ("Green: Photosynthesizers", (0, 200, 0)),
@@ -556,32 +665,142 @@ def draw_enhanced_stats(screen, grid, panel_x, speed, paused, font, small_font,
     for i, (text_str, color) in enumerate(legend_items):
         if color:
             # Draw color swatch
-            swatch_rect = pygame.Rect(panel_x + 10, legend_y + 25 + i * 20, 15, 15)
-            pygame.draw.rect(screen, color, swatch_rect)
+            swatch_rect = pygame.Rect(10, legend_y + 25 + i * 20, 15, 15)
+            pygame.draw.rect(panel, color, swatch_rect)
             text = small_font.render(text_str.split(":")[1] if ":" in text_str else text_str, 
                                     True, (180, 180, 180))
-            screen.blit(text, (panel_x + 30, legend_y + 25 + i * 20))
+            panel.blit(text, (30, legend_y + 25 + i * 20))
         else:
             text = small_font.render(text_str, True, (150, 150, 150))
-            screen.blit(text, (panel_x + 10, legend_y + 25 + i * 20))
+            panel.blit(text, (10, legend_y + 25 + i * 20))
+    
+    _static_panel_cache['key'] = key
+    _static_panel_cache['surface'] = panel
+    return panel
+
+
+def draw_enhanced_stats(screen, grid, panel_x, speed, paused, font, small_font, pop_manager=None,
+                        stats=None):
+    """Draw stats panel (stats: this frame's grid.get_stats(), computed if not given)"""
+    if stats is None:
+        stats = grid.get_stats()
+    
+    # Background, static text and legend in one blit
+    screen.blit(static_stats_panel(screen.get_height(), font, small_font), (panel_x, 0))
+    
+    y_offset = 20
+    
+    # Check for population pressure
+    pressure_warning = ""
+    if pop_manager:
+        pop_stats = pop_manager.get_population_stats(grid.cells)
+        pressure = pop_stats['total'] / pop_manager.total_cell_limit
+        if pressure > 0.9:
+            pressure_warning = "🔥 HIGH LOAD"
+        elif pressure > 0.7:
+            pressure_warning = "⚠️  BUSY"
+    
+    # Only the lines with live values; blank lines and headings are in the static panel
+    stat_lines = [
+        (0, f"Generation: {stats['generation']}"),
+        (1, f"Population: {stats['population']} {pressure_warning}"),
+        (2, f"Species: {stats['species_count']}"),
+        (5, f"  Births: {stats['births']}"),
+        (6, f"  Deaths: {stats['deaths']}"),
+        (7, f"  Mutations: {stats['mutations']}"),
+        (10, f"  {stats['avg_species_age']:.1f} gens"),
+        (12, f"Speed: {speed}x {'(PAUSED)' if paused else ''}"),
+    ]
+    
+    for i, line in stat_lines:
+        text = render_text(small_font, line, _stat_line_color(line))
+        screen.blit(text, (panel_x + 10, y_offset + i * PANEL_LINE_HEIGHT))
+    
+    # Top species
+    top_y = PANEL_TOP_SPECIES_Y
+    species_list = nlargest(5, grid.species_registry.get_living_species(),
+                            key=lambda s: s.population)
+    
+    for i, species in enumerate(species_list):
+        # Show species with its actual color
+        name_text = species.name[:20] if len(species.name) <= 20 else species.name[:17] + "..."
+        complexity_indicator = f"[C{species.traits.complexity}]"
+        
+        text = render_text(small_font, f"{name_text}: {species.population}", species.traits.color)
+        screen.blit(text, (panel_x + 10, top_y + 30 + i * 25))
+        
+        # Show complexity indicator
+        comp_text = render_text(small_font, complexity_indicator, (150, 150, 150))
+        screen.blit(comp_text, (panel_x + 280, top_y + 30 + i * 25))
 
 
-def save_data(export_data):
-    """Save simulation data to CSV"""
-    if not export_data:
+class StatsExporter:
+    """Streams stats rows to a timestamped CSV in exports/ as they are recorded"""
+    
+    def __init__(self):
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.filepath = Path("exports") / f"enhanced_{timestamp}.csv"
+        self._file = None
+        self._writer = None
+    
+    def write(self, stats):
+        """Append one stats row (the file and header are created on the first row)"""
+        if self._writer is None:
+            self.filepath.parent.mkdir(exist_ok=True)
+            self._file = open(self.filepath, 'w', newline='')
+            self._writer = csv.DictWriter(self._file, fieldnames=stats.keys())
+            self._writer.writeheader()
+        self._writer.writerow(stats)
+    
+    def save(self):
+        """Flush recorded rows to disk"""
+        if self._file is None:
+            return
+        self._file.flush()
+        print(f"\n✓ Saved data to {self.filepath}")
+    
+    def close(self):
+        """Flush and close the CSV file"""
+        if self._file is None:
+            return
+        self.save()
+        self._file.close()
+        self._file = None
+        self._writer = None
+
+
+def cli_main(argv=None):
+    """Command-line entry point (see --help)
+    
+    Without options the simulation is set up interactively; --config sets it up
+    from a species config file instead. Batch runs without a display live in
+    enhanced_engine.headless (python -m enhanced_engine.headless), which does
+    not import pygame.
+    """
+    parser = argparse.ArgumentParser(description="Primordial Garden enhanced mode")
+    parser.add_argument("--config", default=None,
+                        help="species config (as saved by the species designer, see "
+                             "config/species_presets.json); skips the interactive setup")
+    add_grid_arguments(parser)
+    args = parser.parse_args(argv)
+    
+    if args.config is None:
+        main()
         return
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filepath = Path("exports") / f"enhanced_{timestamp}.csv"
+    with open(args.config, 'r') as f:
+        species_config = json.load(f)
+    grid_config = grid_config_from_args(args)
     
-    with open(filepath, 'w', newline='') as f:
-        if export_data:
-            writer = csv.DictWriter(f, fieldnames=export_data[0].keys())
-            writer.writeheader()
-            writer.writerows(export_data)
+    grid = build_grid(grid_config, species_config, args.seed)
+    
+    print("\n" + "=" * 60)
+    print("Starting simulation...")
+    print("Controls: SPACE=pause, 1-5=speed, G=graphs, S=export, Q=quit")
+    print("=" * 60 + "\n")
     
-    print(f"\n✓ Saved data to {filepath}")
+    run_enhanced_simulation(grid, args.width, args.height)
 
 
 if __name__ == "__main__":
-    main()
+    cli_main()
@@ -0,0 +1,36 @@
+"""
+Tests for SpeciesTraits validation in enhanced_engine.species_enhanced
+"""
+import sys
+from pathlib import Path
+
+# Add repo root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from enhanced_engine.species_enhanced import EnergySource, SpeciesTraits
+
+
+def test_known_energy_sources():
+    """Each energy_source string maps to its EnergySource code"""
+    assert SpeciesTraits(energy_source="photosynthesis").energy_source_code == EnergySource.PHOTOSYNTHESIS
+    assert SpeciesTraits(energy_source="predation").energy_source_code == EnergySource.PREDATION
+    assert SpeciesTraits(energy_source="hybrid").energy_source_code == EnergySource.HYBRID
+
+
+def test_unknown_energy_source_is_hybrid():
+    """Unrecognized energy_source values (e.g. from JSON configs) behave as hybrid"""
+    traits = SpeciesTraits(energy_source="chemosynthesis")
+    
+    assert traits.energy_source_code == EnergySource.HYBRID
+    assert traits.get_energy_source_multiplier(False) == 0.7
+    assert traits.get_energy_source_multiplier(True) == 1.5
+
+
+def test_trait_bounds_keep_in_range_values():
+    """Clamping only replaces out-of-range traits; in-range values are left as given"""
+    traits = SpeciesTraits(max_lifespan=80.7, base_energy=500, complexity=0, mutation_rate=0.25)
+    
+    assert traits.max_lifespan == 80.7
+    assert traits.base_energy == 200
+    assert traits.complexity == 1
+    assert traits.mutation_rate == 0.25
@@ -5,24 +5,23 @@ Displays population, species, and energy metrics during simulation
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend for pygame integration
 import matplotlib.pyplot as plt
-from collections import deque
 from typing import Dict, List
 import numpy as np
 
 
+# Stats columns kept for plotting, in LiveGraphs.update order
+HISTORY_COLUMNS = ('generation', 'population', 'species_count', 'births', 'deaths', 'mutations')
+
+
 class LiveGraphs:
     """Manages real-time plotting of simulation metrics"""
     
     def __init__(self, max_history: int = 500):
         self.max_history = max_history
         
-        # Data storage
-        self.generation_history = deque(maxlen=max_history)
-        self.population_history = deque(maxlen=max_history)
-        self.species_history = deque(maxlen=max_history)
-        self.births_history = deque(maxlen=max_history)
-        self.deaths_history = deque(maxlen=max_history)
-        self.mutations_history = deque(maxlen=max_history)
+        # Data storage: one preallocated ring buffer per stats column
+        self._buf = {name: np.zeros(max_history, dtype=np.float64) for name in HISTORY_COLUMNS}
+        self._idx = 0  # Total points written; the next write goes to _idx % max_history
         
         # Figure setup
         self.fig = None
@@ -30,7 +29,7 @@ class LiveGraphs:
         self.setup_figure()
     
     def setup_figure(self):
-        """Initialize matplotlib figure with subplots"""
+        """Initialize matplotlib figure with subplots and one persistent line per series"""
         self.fig, self.axes = plt.subplots(2, 2, figsize=(12, 8))
         self.fig.suptitle('Primordial Garden - Live Metrics', fontsize=14, fontweight='bold')
         
@@ -53,82 +52,68 @@ class LiveGraphs:
         self.axes[1, 1].set_ylabel('Diversity Index')
         
         plt.tight_layout()
+        
+        # The diversity panel is labelled as a ratio once data is plotted
+        self.axes[1, 1].set_title('Species Diversity (Species/Population)')
+        self.axes[1, 1].set_ylabel('Diversity Ratio')
+        
+        # Lines are created once; render only swaps their data
+        # (series name -> Line2D; 'diversity' is derived in render)
+        self._lines = {
+            'population': self.axes[0, 0].plot([], [], color='#00ff00', linewidth=2, label='Population')[0],
+            'species_count': self.axes[0, 1].plot([], [], color='#ffaa00', linewidth=2, label='Species')[0],
+            'births': self.axes[1, 0].plot([], [], color='#00ff00', linewidth=1, alpha=0.7, label='Births')[0],
+            'deaths': self.axes[1, 0].plot([], [], color='#ff0000', linewidth=1, alpha=0.7, label='Deaths')[0],
+            'mutations': self.axes[1, 0].plot([], [], color='#ff00ff', linewidth=1, alpha=0.7, label='Mutations')[0],
+            'diversity': self.axes[1, 1].plot([], [], color='#00ffff', linewidth=2, label='Diversity')[0],
+        }
+        for ax in self.axes.flat:
+            ax.legend()
     
     def update(self, stats: Dict):
         """Update graphs with new data point"""
-        gen = stats.get('generation', 0)
-        pop = stats.get('population', 0)
-        species = stats.get('species_count', 0)
-        births = stats.get('births', 0)
-        deaths = stats.get('deaths', 0)
-        mutations = stats.get('mutations', 0)
-        
-        # Append new data
-        self.generation_history.append(gen)
-        self.population_history.append(pop)
-        self.species_history.append(species)
-        self.births_history.append(births)
-        self.deaths_history.append(deaths)
-        self.mutations_history.append(mutations)
+        slot = self._idx % self.max_history
+        for name, column in self._buf.items():
+            column[slot] = stats.get(name, 0)
+        self._idx += 1
+    
+    def history(self, name: str) -> np.ndarray:
+        """Recorded values of one stats column, oldest first"""
+        column = self._buf[name]
+        if self._idx <= self.max_history:
+            return column[:self._idx]
+        return np.roll(column, -(self._idx % self.max_history))
     
     def render(self) -> np.ndarray:
-        """Generate graph image as numpy array for pygame display"""
-        if len(self.generation_history) < 2:
-            return None
+        """Generate graph image as an RGBA numpy array (height x width x 4) for pygame display
         
-        # Clear all axes
-        for ax in self.axes.flat:
-            ax.clear()
-            ax.grid(True, alpha=0.3)
-        
-        gens = list(self.generation_history)
-        
-        # Plot 1: Population
-        self.axes[0, 0].plot(gens, list(self.population_history), 
-                            color='#00ff00', linewidth=2, label='Population')
-        self.axes[0, 0].set_title('Population Over Time')
-        self.axes[0, 0].set_ylabel('Population')
-        self.axes[0, 0].legend()
-        self.axes[0, 0].set_xlabel('Generation')
+        The array is a view of the canvas buffer, overwritten by the next render.
+        Only touches LiveGraphs' own history, so it can run while the grid keeps stepping.
+        """
+        if self._idx < 2:
+            return None
         
-        # Plot 2: Species Count
-        self.axes[0, 1].plot(gens, list(self.species_history), 
-                            color='#ffaa00', linewidth=2, label='Species')
-        self.axes[0, 1].set_title('Species Count Over Time')
-        self.axes[0, 1].set_ylabel('Species Count')
-        self.axes[0, 1].legend()
-        self.axes[0, 1].set_xlabel('Generation')
+        gens = self.history('generation')
+        for name, line in self._lines.items():
+            if name == 'diversity':
+                # Species/population ratio
+                values = self.history('species_count') / np.maximum(self.history('population'), 1)
+            else:
+                values = self.history(name)
+            line.set_data(gens, values)
         
-        # Plot 3: Events (Births/Deaths/Mutations)
-        self.axes[1, 0].plot(gens, list(self.births_history), 
-                            color='#00ff00', linewidth=1, alpha=0.7, label='Births')
-        self.axes[1, 0].plot(gens, list(self.deaths_history), 
-                            color='#ff0000', linewidth=1, alpha=0.7, label='Deaths')
-        self.axes[1, 0].plot(gens, list(self.mutations_history), 
-                            color='#ff00ff', linewidth=1, alpha=0.7, label='Mutations')
-        self.axes[1, 0].set_title('Births/Deaths/Mutations')
-        self.axes[1, 0].set_ylabel('Events per Generation')
-        self.axes[1, 0].legend()
-        self.axes[1, 0].set_xlabel('Generation')
-        
-        # Plot 4: Diversity (species/population ratio)
-        diversity = [s / max(p, 1) for s, p in zip(self.species_history, self.population_history)]
-        self.axes[1, 1].plot(gens, diversity, 
-                            color='#00ffff', linewidth=2, label='Diversity')
-        self.axes[1, 1].set_title('Species Diversity (Species/Population)')
-        self.axes[1, 1].set_ylabel('Diversity Ratio')
-        self.axes[1, 1].legend()
-        self.axes[1, 1].set_xlabel('Generation')
+        # Rescale to the new data (ticks change, so the whole figure is redrawn)
+        for ax in self.axes.flat:
+            ax.relim()
+            ax.autoscale_view()
         
         # Render to numpy array
         self.fig.canvas.draw()
         
-        # Get the RGBA buffer from the figure
+        # The figure's RGBA buffer, without copying
         w, h = self.fig.canvas.get_width_height()
         buf = np.frombuffer(self.fig.canvas.buffer_rgba(), dtype=np.uint8)
-        buf = buf.reshape(h, w, 4)[:, :, :3]  # Drop alpha channel
-        
-        return buf
+        return buf.reshape(h, w, 4)
     
     def save(self, filename: str):
         """Save current graphs to file"""
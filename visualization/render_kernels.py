@@ -0,0 +1,21 @@
+"""
+Numba kernels for the renderer's per-frame pixel work
+"""
+import numpy as np
+from numba import jit, prange
+
+
+@jit(nopython=True, parallel=True, cache=True, boundscheck=False)
+def paint(grid: np.ndarray, palette: np.ndarray, out: np.ndarray) -> None:
+    """
+    Write palette[grid[y, x]] into out[x, y] for every cell, rows in parallel
+    
+    Args:
+        grid: 2D (H x W) array of species IDs, all < len(palette)
+        palette: Packed uint32 pixel per species ID
+        out: (W x H) uint32 pixels2d view of the target surface
+    """
+    height, width = grid.shape
+    for y in prange(height):
+        for x in range(width):
+            out[x, y] = palette[grid[y, x]]
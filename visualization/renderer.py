@@ -3,11 +3,28 @@ Pygame Renderer
 Handles visualization of the simulation
 """
 
+from functools import lru_cache
+from heapq import nlargest
+
 import pygame
 import numpy as np
 
+from .render_kernels import paint
+
+TEXT_COLOR = (200, 200, 200)
+
+
+@lru_cache(maxsize=256)
+def render_text(font, text, color):
+    """Antialiased font.render, reusing the surface when the same text comes up again"""
+    return font.render(text, True, color)
+
 
 class Renderer:
+    # Stats overlay line spacing and its fixed last lines (controls help)
+    _LINE_HEIGHT = 25
+    _HELP_LINES = ("SPACE: Pause | 1-5: Speed", "S: Stats | R: Reset | Q: Quit")
+    
     def __init__(self, world, screen_size=(1600, 900)):
         pygame.init()
         self.screen = pygame.display.set_mode(screen_size)
@@ -24,66 +41,170 @@ class Renderer:
         self.bg_color = (10, 10, 15)  # Dark background
         self.dead_color = np.array([20, 20, 25], dtype=np.uint8)  # Dead cell color
         
+        # What the last frame showed, so unchanged frames can be skipped
+        self._last_frame_key = None
+        self._force_redraw = False
+        
         # Font for UI
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
         
-        # Preallocate color array for fast rendering
-        self.color_array = np.zeros((world.height, world.width, 3), dtype=np.uint8)
+        # Stats overlay is drawn into its own layer and reused between redraws
+        self.stats_interval = 5
+        self._stats_frame = 0
+        self._stats_controls = None  # (speed, paused) shown in the layer
+        self._stats_layer = pygame.Surface((400, 470), pygame.SRCALPHA)
+        
+        # Static parts of the stats overlay, built once
+        self._stats_panel_bg = self._panel((340, 280))
+        self._species_panel_bg = self._panel((340, 150))
+        self._species_title = self.font.render("Top Species:", True, TEXT_COLOR)
+        self._help_block = pygame.Surface(
+            (340, self._LINE_HEIGHT * len(self._HELP_LINES)), pygame.SRCALPHA)
+        for i, line in enumerate(self._HELP_LINES):
+            self._help_block.blit(self.small_font.render(line, True, TEXT_COLOR),
+                                  (0, i * self._LINE_HEIGHT))
+        
+        # 15x15 color swatches for the species list, by color
+        self._swatch_cache = {}
+        
+        # Species ID -> color lookup, rebuilt when the registry changes
+        self._palette = None
+        self._palette_key = None
         
-        # Create surface for fast pixel access
-        self.grid_surface = pygame.Surface((world.width, world.height))
+        # Grid as last painted, so frames only repaint cells that changed
+        self._prev_grid = None
+        
+        # Grid pixels are copied straight into a 32-bit screen; other
+        # screens go through transform.scale
+        self._direct_to_screen = self.screen.get_bytesize() == 4
+        
+        # Create 32-bit surface (in the screen's format if possible) for fast pixel access
+        self.grid_surface = pygame.Surface((world.width, world.height), 0,
+                                           self.screen if self._direct_to_screen else 32)
+        # (W, H) view of its packed pixels; colors are written straight into it
+        self._px2d = pygame.surfarray.pixels2d(self.grid_surface)
+        self._rgb_shifts = np.array(self.grid_surface.get_shifts()[:3], dtype=np.uint32)
+        
+        # Compile the paint kernel now rather than inside the first frame
+        paint(world.grid, self._get_palette(), self._px2d)
+        
+        # Screen-sized copy of the grid, scaled into every frame (non-32-bit screens)
+        self._scaled_surface = None
+        if not self._direct_to_screen:
+            self._scaled_surface = pygame.Surface(
+                (world.width * self.cell_width, world.height * self.cell_height),
+                0, self.grid_surface)
+    
+    def request_redraw(self):
+        """Make the next draw_frame redraw even if the simulation hasn't changed"""
+        self._force_redraw = True
     
     def draw_frame(self, show_stats=True, speed=1, paused=False):
-        """Draw one frame of the simulation"""
+        """Draw one frame of the simulation (skipped if nothing shown has changed)"""
+        key = (self.world.reset_count, self.world.generation,
+               self.world.total_population, show_stats, speed, paused)
+        if key == self._last_frame_key and not self._force_redraw:
+            return
+        self._last_frame_key = key
+        self._force_redraw = False
+        
         # Clear screen
         self.screen.fill(self.bg_color)
         
         # Draw grid
         self._draw_grid()
         
-        # Draw stats overlay
+        # Draw stats overlay (re-rendered every stats_interval frames)
         if show_stats:
-            self._draw_stats(speed, paused)
+            if (self._stats_frame % self.stats_interval == 0 or
+                    (speed, paused) != self._stats_controls):
+                self._redraw_stats_layer(speed, paused)
+                self._stats_controls = (speed, paused)
+            self._stats_frame += 1
+            self.screen.blit(self._stats_layer, (0, 0))
         
         pygame.display.flip()
     
+    def _get_palette(self):
+        """
+        Packed surface pixel per species ID (index 0 and unknown IDs get
+        the dead color)
+        """
+        registry = self.world.species_registry
+        # Colors are fixed at creation, so only added/removed species and resets
+        # (see World.species_version / reset_count) change the palette
+        key = (self.world.reset_count, self.world.species_version)
+        if key != self._palette_key:
+            if self._palette_key is not None and key[0] != self._palette_key[0]:
+                # World was reset: IDs may come back with other colors
+                self._prev_grid = None
+            palette = np.empty((self.world.next_species_id, 3), dtype=np.uint32)
+            palette[:] = self.dead_color
+            for species_id, species in registry.items():
+                palette[species_id] = species.color
+            self._palette = np.bitwise_or.reduce(palette << self._rgb_shifts, axis=1)
+            self._palette_key = key
+        return self._palette
+    
     def _draw_grid(self):
         """Draw the cellular automata grid using fast numpy operations"""
-        # Start with dead color everywhere
-        self.color_array[:] = self.dead_color
+        grid = self.world.grid
+        palette = self._get_palette()
+        
+        if self._prev_grid is None:
+            changed = None
+            self._prev_grid = np.empty_like(grid)
+        else:
+            changed = np.flatnonzero(grid != self._prev_grid)
         
-        # For each living species, set colors using numpy boolean indexing
-        for species_id, species in self.world.species_registry.items():
-            mask = self.world.grid == species_id
-            if np.any(mask):
-                self.color_array[mask] = species.color
+        if changed is None or changed.size > 0.3 * grid.size:
+            # One parallel gather from the species palette colors every cell,
+            # directly into the surface pixels
+            paint(grid, palette, self._px2d)
+        elif changed.size:
+            # Sparse frame: repaint just the cells that changed
+            ys, xs = np.divmod(changed, self.world.width)
+            self._px2d[xs, ys] = palette[grid.ravel()[changed]]
+        np.copyto(self._prev_grid, grid)
         
-        # Use surfarray for ultra-fast pixel rendering
-        pygame.surfarray.blit_array(self.grid_surface, self.color_array.swapaxes(0, 1))
+        if self._direct_to_screen:
+            # Replicate each grid pixel over its cell_width x cell_height block
+            # of screen pixels in one broadcast write
+            width, height = self.world.width, self.world.height
+            screen_px = pygame.surfarray.pixels2d(self.screen)
+            blocks = screen_px[:width * self.cell_width, :height * self.cell_height].reshape(
+                width, self.cell_width, height, self.cell_height)
+            np.copyto(blocks, self._px2d[:, None, :, None])
+            # Drop the views so the screen is unlocked for the blits and flip
+            del blocks, screen_px
+            return
         
         # Scale to screen size
-        scaled_surface = pygame.transform.scale(
-            self.grid_surface, 
-            (self.world.width * self.cell_width, self.world.height * self.cell_height)
-        )
+        pygame.transform.scale(self.grid_surface, self._scaled_surface.get_size(),
+                               self._scaled_surface)
         
         # Blit to main screen
-        self.screen.blit(scaled_surface, (0, 0))
+        self.screen.blit(self._scaled_surface, (0, 0))
     
-    def _draw_stats(self, speed, paused):
-        """Draw statistics overlay"""
+    @staticmethod
+    def _panel(size):
+        """Translucent black panel background"""
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        return panel
+    
+    def _redraw_stats_layer(self, speed, paused):
+        """Draw statistics overlay onto the stats layer"""
+        layer = self._stats_layer
+        layer.fill((0, 0, 0, 0))
         stats_x = 30
         stats_y = 20
-        line_height = 25
+        line_height = self._LINE_HEIGHT
         
         # Background panel - make it taller for more stats
-        panel_width = 340
-        panel_height = 280
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(180)
-        panel_surface.fill((0, 0, 0))
-        self.screen.blit(panel_surface, (stats_x - 10, stats_y - 10))
+        panel_height = self._stats_panel_bg.get_height()
+        layer.blit(self._stats_panel_bg, (stats_x - 10, stats_y - 10))
         
         # Calculate diversity metrics
         avg_age = self.world.get_average_species_age()
@@ -104,39 +225,43 @@ class Renderer:
             f"",
             f"Speed: {speed}x {'(PAUSED)' if paused else ''}",
             "",
-            "SPACE: Pause | 1-5: Speed",
-            "S: Stats | R: Reset | Q: Quit"
         ]
         
         for i, line in enumerate(stats):
-            text_surface = self.small_font.render(line, True, (200, 200, 200))
-            self.screen.blit(text_surface, (stats_x, stats_y + i * line_height))
+            if line:
+                text_surface = render_text(self.small_font, line, TEXT_COLOR)
+                layer.blit(text_surface, (stats_x, stats_y + i * line_height))
+        
+        # Controls help, pre-rendered as one block
+        layer.blit(self._help_block, (stats_x, stats_y + len(stats) * line_height))
         
         # Species list (top 5)
         if self.world.species_registry:
             species_y = stats_y + panel_height + 20
             
-            # Sort by population
-            sorted_species = sorted(
-                self.world.species_registry.values(),
-                key=lambda s: s.population,
-                reverse=True
-            )[:5]
+            # Top 5 by population, without sorting every species
+            sorted_species = nlargest(
+                5, self.world.species_registry.values(), key=lambda s: s.population
+            )
             
-            species_panel = pygame.Surface((panel_width, 150))
-            species_panel.set_alpha(180)
-            species_panel.fill((0, 0, 0))
-            self.screen.blit(species_panel, (stats_x - 5, species_y - 5))
+            layer.blit(self._species_panel_bg, (stats_x - 5, species_y - 5))
+            layer.blit(self._species_title, (stats_x, species_y))
             
-            title = self.font.render("Top Species:", True, (200, 200, 200))
-            self.screen.blit(title, (stats_x, species_y))
+            # Keep swatches for the listed colors only, so dead species drop out
+            swatches = {}
+            for species in sorted_species:
+                swatch = self._swatch_cache.get(species.color)
+                if swatch is None:
+                    swatch = pygame.Surface((15, 15))
+                    swatch.fill(species.color)
+                swatches[species.color] = swatch
+            self._swatch_cache = swatches
             
+            # Color swatch and species info per row, in one blits call
+            blit_seq = []
             for i, species in enumerate(sorted_species):
-                # Color swatch
-                swatch_rect = pygame.Rect(stats_x, species_y + 30 + i * 20, 15, 15)
-                pygame.draw.rect(self.screen, species.color, swatch_rect)
-                
-                # Species info
+                row_y = species_y + 30 + i * 20
                 info = f"ID {species.id}: {species.population} cells"
-                text = self.small_font.render(info, True, (200, 200, 200))
-                self.screen.blit(text, (stats_x + 20, species_y + 30 + i * 20))
+                blit_seq.append((swatches[species.color], (stats_x, row_y)))
+                blit_seq.append((render_text(self.small_font, info, TEXT_COLOR), (stats_x + 20, row_y)))
+            layer.blits(blit_seq, doreturn=0)